@@ -0,0 +1,28 @@
+import argparse
+import asyncio
+
+from utils.api_utils import serve
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Serve tournaments, leaderboards and player stats over HTTP"
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=5.0,
+        help="Seconds between checks for changed data files (0 to disable)",
+    )
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(args.host, args.port, poll_interval=args.poll_interval))
+    except KeyboardInterrupt:
+        print("Stopped")
+
+
+if __name__ == "__main__":
+    main()
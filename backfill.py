@@ -0,0 +1,50 @@
+import argparse
+
+from utils.backfill_utils import enqueue_backfill, plan_backfill
+from utils.queue_utils import DEFAULT_QUEUE_URL, TASK_KINDS
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Find the tournaments each dataset is missing and queue them"
+    )
+    parser.add_argument("--data-dir", default="data")
+    parser.add_argument("--kind", choices=TASK_KINDS, action="append")
+    parser.add_argument("--limit", type=int, help="Only the most recent tasks")
+    parser.add_argument(
+        "--retry-no-stats",
+        action="store_true",
+        help="Also plan player stats recorded as unavailable",
+    )
+    parser.add_argument(
+        "--enqueue", action="store_true", help="Add the tasks to the scrape queue"
+    )
+    parser.add_argument(
+        "--queue",
+        default=DEFAULT_QUEUE_URL,
+        help=f"Queue URL (default: {DEFAULT_QUEUE_URL})",
+    )
+    args = parser.parse_args()
+
+    plan = plan_backfill(args.data_dir, args.kind, retry_no_stats=args.retry_no_stats)
+    if args.limit is not None:
+        plan = plan.head(args.limit)
+
+    if plan.empty:
+        print("Every dataset is complete.")
+        return
+
+    print(plan.to_string(index=False))
+    print(f"\n{len(plan)} tasks:")
+    for kind, count in plan["Kind"].value_counts().items():
+        print(f"  {kind}: {count}")
+
+    if args.enqueue:
+        added = enqueue_backfill(args.queue, plan)
+        print(f"Queued {added} tasks ({len(plan) - added} already queued)")
+    else:
+        print("Run with --enqueue to queue them for scrape-queue.py workers")
+
+
+if __name__ == "__main__":
+    main()
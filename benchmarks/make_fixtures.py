@@ -0,0 +1,92 @@
+"""
+Rebuild the HTML page fixtures in benchmarks/fixtures from the recorded CSVs.
+
+The fixtures reproduce the table markup of ESPN's leaderboard page (Table__*
+classes, an unlabelled first column, a playoff table ahead of the leaderboard
+and the Player Stats table last on the page), filled with the values stored in
+data/, so the parsing benchmarks run without a browser or network access.
+
+Usage:
+    python benchmarks/make_fixtures.py
+"""
+
+import html
+import os
+
+import pandas as pd
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+TOURNAMENT_ID = "401580366"
+
+
+def format_score(score):
+    if score == 0:
+        return "E"
+    return f"+{score}" if score > 0 else str(score)
+
+
+def render_table(df, caption=None):
+    head = "".join(f'<th class="Table__TH">{html.escape(str(c))}</th>' for c in df)
+    rows = []
+    for values in df.itertuples(index=False):
+        cells = "".join(
+            f'<td class="Table__TD">{html.escape(str(v))}</td>' for v in values
+        )
+        rows.append(f'<tr class="Table__TR Table__TR--sm">{cells}</tr>')
+    caption = f'<div class="Table__Title">{caption}</div>' if caption else ""
+    return (
+        f'<div class="ResponsiveTable">{caption}<table class="Table">'
+        f'<thead class="Table__THEAD"><tr class="Table__TR">{head}</tr></thead>'
+        f'<tbody class="Table__TBODY">{"".join(rows)}</tbody></table></div>'
+    )
+
+
+def render_page(tables):
+    return (
+        "<!DOCTYPE html><html><head><title>Leaderboard - ESPN</title></head><body>"
+        '<div class="Leaderboard__Header">'
+        '<h1 class="Leaderboard__Event__Title">TOUR Championship</h1>'
+        '<span class="Leaderboard__Event__Date">August 29 - September 1, 2024</span>'
+        '<div class="Leaderboard__Courses">'
+        '<div class="Leaderboard__Course__Location">East Lake Golf Club - Atlanta, GA'
+        '<span class="Leaderboard__Course__Location__Detail">Par70Yards7490</span>'
+        "</div><div>Purse$100,000,000</div></div></div>"
+        f"{''.join(tables)}</body></html>\n"
+    )
+
+
+def leaderboard_table():
+    leaderboard = pd.read_csv("data/leaderboards_data.csv", dtype={"SCORE": int})
+    leaderboard = leaderboard[leaderboard["TOURNAMENT_ID"] == int(TOURNAMENT_ID)]
+    leaderboard = leaderboard.drop(columns=["TOURNAMENT_ID"])
+    leaderboard["SCORE"] = leaderboard["SCORE"].map(format_score)
+    leaderboard.insert(0, "", "")
+    return leaderboard
+
+
+def main():
+    os.makedirs(FIXTURES_DIR, exist_ok=True)
+    leaderboard = leaderboard_table()
+
+    playoff = pd.DataFrame(
+        {"Playoff Results": ["Scottie Scheffler"], "HOLE": ["18"], "SCORE": ["3"]}
+    )
+    path = os.path.join(FIXTURES_DIR, f"leaderboard_{TOURNAMENT_ID}.html")
+    with open(path, "w") as f:
+        f.write(render_page([render_table(playoff), render_table(leaderboard)]))
+    print(f"Saved {path}")
+
+    stats = pd.read_csv(f"data/player-stats/player_stats_{TOURNAMENT_ID}.csv")
+    stats = stats.rename(columns={"Unnamed: 0": ""}).fillna("")
+    path = os.path.join(FIXTURES_DIR, f"player_stats_{TOURNAMENT_ID}.html")
+    with open(path, "w") as f:
+        f.write(
+            render_page(
+                [render_table(leaderboard), render_table(stats, "Player Stats")]
+            )
+        )
+    print(f"Saved {path}")
+
+
+if __name__ == "__main__":
+    main()
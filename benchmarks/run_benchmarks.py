@@ -0,0 +1,350 @@
+"""
+Run the offline parsing and cleaning benchmarks and save the timings as JSON.
+
+Every benchmark runs against the HTML fixtures in benchmarks/fixtures and the
+CSVs in data/, scaled up synthetically with --scale (the number of tournaments
+to simulate), so no browser or network access is needed. Import benchmarks time
+how long a fresh interpreter takes to import what data-only and scraping
+commands need. Results record the git commit, so runs from different commits
+can be compared with --compare.
+
+Usage:
+    python benchmarks/run_benchmarks.py --scale 1000
+    python benchmarks/run_benchmarks.py --scale 1000 --compare benchmarks/results/<commit>.json
+    python benchmarks/run_benchmarks.py --imports-only
+    python benchmarks/run_benchmarks.py --check-dates
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from io import StringIO
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from utils import date_utils  # noqa: E402
+from utils.csv_utils import (  # noqa: E402
+    combine_tournament_data,
+    identify_csv_files_for_rescrape,
+)
+from utils.date_utils import (  # noqa: E402
+    extract_and_format_end_date,
+    parse_date_ranges,
+)
+from utils.tournament_utils import (  # noqa: E402
+    clean_leaderboard_batch,
+    clean_leaderboard_data,
+    parse_leaderboard_html,
+)
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+PLAYER_STATS_DIR = os.path.join("data", "player-stats")
+
+
+def git_commit():
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown", False
+    return commit, bool(dirty)
+
+
+def read_fixture(name):
+    with open(os.path.join(FIXTURES_DIR, name)) as f:
+        return f.read()
+
+
+def measure(function, repeat):
+    """
+    Run function `repeat` times with stdout silenced and return the timings.
+    """
+    timings = []
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            function()
+            timings.append(time.perf_counter() - start)
+    return timings
+
+
+def make_player_stats_dir(directory, scale):
+    """
+    Fill a directory with `scale` player stats files cycled from data/player-stats.
+    """
+    sources = sorted(
+        f for f in os.listdir(PLAYER_STATS_DIR) if f.startswith("player_stats_")
+    )
+    for i in range(scale):
+        shutil.copyfile(
+            os.path.join(PLAYER_STATS_DIR, sources[i % len(sources)]),
+            os.path.join(directory, f"player_stats_{500000000 + i}.csv"),
+        )
+
+
+# Startup of a fresh interpreter importing what each kind of command needs, and
+# whether that command is allowed to load selenium
+IMPORT_BENCHMARKS = {
+    "import_csv_tools": ("from utils import combine_tournament_data", False),
+    "import_date_tools": ("from utils.date_utils import parse_date_ranges", False),
+    "import_derived_store": ("from utils import load_season_aggregates", False),
+    "import_scraper": ("from utils import setup_driver", True),
+}
+
+
+def measure_import(statement, repeat):
+    """
+    Time a fresh interpreter running statement, minus bare interpreter startup.
+
+    Returns:
+        tuple: The timings, and whether selenium ended up imported.
+    """
+    root = os.path.join(os.path.dirname(__file__), "..")
+    check = "import sys; print('selenium' in sys.modules)"
+
+    def run(code):
+        start = time.perf_counter()
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=root,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        return time.perf_counter() - start, output
+
+    timings = []
+    for _ in range(repeat):
+        baseline, _ = run("pass")
+        seconds, output = run(f"{statement}; {check}")
+        timings.append(max(seconds - baseline, 0.0))
+    return timings, output.strip() == "True"
+
+
+def run_import_benchmarks(repeat):
+    """
+    Time the IMPORT_BENCHMARKS.
+
+    Raises:
+        AssertionError: If a data-only import loads selenium.
+    """
+    results = {}
+    for name, (statement, may_load_selenium) in IMPORT_BENCHMARKS.items():
+        timings, loads_selenium = measure_import(statement, repeat)
+        results[name] = summarize(name, 1, timings)
+        results[name]["loads_selenium"] = loads_selenium
+        if loads_selenium and not may_load_selenium:
+            raise AssertionError(f"{name} loads selenium: {statement}")
+    return results
+
+
+def check_date_parsing(info_file="data/tournament_info.csv"):
+    """
+    Check that parse_date_ranges gives the same end dates as the per-string
+    extract_and_format_end_date for every date in tournament_info.csv.
+
+    Raises:
+        AssertionError: Listing the dates the two parsers disagree on.
+    """
+    dates = pd.read_csv(info_file)["Date"]
+    expected = pd.to_datetime(
+        dates.map(
+            lambda date: (
+                extract_and_format_end_date(date) if isinstance(date, str) else None
+            )
+        ),
+        format="%Y-%m-%d",
+    )
+    parsed = parse_date_ranges(dates)["End Date"]
+    mismatched = ~((expected == parsed) | (expected.isna() & parsed.isna()))
+    if mismatched.any():
+        rows = pd.DataFrame({"Date": dates, "expected": expected, "parsed": parsed})[
+            mismatched
+        ]
+        raise AssertionError(f"parse_date_ranges disagrees on:\n{rows}")
+    print(f"Date parsing matches on all {len(dates)} dates in {info_file}")
+
+
+def parse_date_ranges_cold(dates):
+    date_utils._DATE_RANGE_CACHE.clear()
+    return parse_date_ranges(dates)
+
+
+def run_benchmarks(scale, repeat):
+    # Timings only compare like for like if both parsers agree
+    check_date_parsing()
+
+    leaderboard_html = read_fixture("leaderboard_401580366.html")
+    player_stats_html = read_fixture("player_stats_401580366.html")
+    with contextlib.redirect_stdout(io.StringIO()):
+        raw = parse_leaderboard_html(leaderboard_html, "401580366").astype(str)
+
+    # One raw leaderboard per simulated tournament
+    raw_leaderboards = [
+        raw.assign(TOURNAMENT_ID=str(500000000 + i)) for i in range(scale)
+    ]
+    combined_raw = pd.concat(raw_leaderboards, ignore_index=True)
+
+    dates = pd.read_csv("data/tournament_info.csv")["Date"].dropna()
+    dates = pd.Series(np.resize(dates.to_numpy(), scale))
+
+    html_pages = max(1, scale // 100)
+    benchmarks = {
+        "parse_leaderboard_html": (
+            html_pages,
+            lambda: [
+                parse_leaderboard_html(leaderboard_html) for _ in range(html_pages)
+            ],
+        ),
+        "read_html_player_stats": (
+            html_pages,
+            lambda: [
+                pd.read_html(StringIO(player_stats_html))[-1] for _ in range(html_pages)
+            ],
+        ),
+        "clean_leaderboard_data": (
+            scale,
+            lambda: [
+                clean_leaderboard_data(df.copy(), df["TOURNAMENT_ID"].iloc[0])
+                for df in raw_leaderboards
+            ],
+        ),
+        "clean_leaderboard_batch": (
+            scale,
+            lambda: clean_leaderboard_batch(combined_raw),
+        ),
+        "extract_and_format_end_date": (
+            scale,
+            lambda: [extract_and_format_end_date(date) for date in dates],
+        ),
+        # Cold parses every distinct string, warm only hits the cache that
+        # check_date_parsing and earlier runs filled
+        "parse_date_ranges_cold": (scale, lambda: parse_date_ranges_cold(dates)),
+        "parse_date_ranges_warm": (scale, lambda: parse_date_ranges(dates)),
+    }
+
+    results = {}
+    for name, (items, function) in benchmarks.items():
+        results[name] = summarize(name, items, measure(function, repeat))
+
+    with tempfile.TemporaryDirectory() as directory:
+        stats_dir = os.path.join(directory, "player-stats")
+        os.makedirs(stats_dir)
+        make_player_stats_dir(stats_dir, scale)
+        output_file = os.path.join(directory, "combined.csv")
+
+        results["combine_tournament_data"] = summarize(
+            "combine_tournament_data",
+            scale,
+            measure(
+                lambda: combine_tournament_data(stats_dir, output_file),
+                repeat,
+            ),
+        )
+        results["identify_csv_files_for_rescrape"] = summarize(
+            "identify_csv_files_for_rescrape",
+            scale,
+            measure(lambda: identify_csv_files_for_rescrape(stats_dir), repeat),
+        )
+
+    return results
+
+
+def summarize(name, items, timings):
+    result = {
+        "items": items,
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "per_item_us": min(timings) / items * 1e6,
+    }
+    print(
+        f"{name:32s} {items:>7d} items  min {result['min']:8.4f}s  "
+        f"median {result['median']:8.4f}s  {result['per_item_us']:10.1f} us/item"
+    )
+    return result
+
+
+def compare(results, baseline_file):
+    with open(baseline_file) as f:
+        baseline = json.load(f)
+    print(f"\nCompared with {baseline['commit']} (scale {baseline['scale']}):")
+    for name, result in results.items():
+        if name in baseline["results"]:
+            before = baseline["results"][name]["per_item_us"]
+            ratio = result["per_item_us"] / before
+            print(f"{name:32s} {ratio:6.2f}x time per item")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scale", type=int, default=1000, help="Tournaments")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="Results file (default: by commit)")
+    parser.add_argument("--compare", help="Earlier results file to compare with")
+    parser.add_argument(
+        "--imports-only", action="store_true", help="Only time package imports"
+    )
+    parser.add_argument(
+        "--check-dates",
+        action="store_true",
+        help="Only check parse_date_ranges against extract_and_format_end_date",
+    )
+    args = parser.parse_args()
+
+    if args.check_dates:
+        check_date_parsing()
+        return
+
+    commit, dirty = git_commit()
+    print(f"Benchmarking commit {commit}{' (dirty)' if dirty else ''}")
+    results = run_import_benchmarks(args.repeat)
+    if not args.imports_only:
+        results.update(run_benchmarks(args.scale, args.repeat))
+
+    report = {
+        "commit": commit,
+        "dirty": dirty,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "scale": args.scale,
+        "repeat": args.repeat,
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "results": results,
+    }
+    output = args.output or os.path.join(RESULTS_DIR, f"{commit}.json")
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results saved to {output}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,22 @@
+import argparse
+
+from utils.feature_utils import refresh_course_fit_features
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Join course attributes with players' trailing stat profiles"
+    )
+    parser.add_argument("--window", type=int, default=8, help="Events per window")
+    parser.add_argument("--force", action="store_true", help="Rebuild every row")
+    args = parser.parse_args()
+
+    features = refresh_course_fit_features(window=args.window, force=args.force)
+    print(
+        f"{len(features)} rows covering {features['PLAYER_ID'].nunique()} players "
+        f"and {features['TOURNAMENT_ID'].nunique()} tournaments"
+    )
+
+
+if __name__ == "__main__":
+    main()
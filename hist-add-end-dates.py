@@ -1,12 +1,12 @@
 import pandas as pd
 
-from utils import extract_and_format_end_date
+from utils.date_utils import parse_date_ranges
 
 # Load the CSV data
 df = pd.read_csv("data/tournament_info.csv")
 
-# Apply the function to create the new 'End Date' column
-df["End Date"] = df["Date"].apply(extract_and_format_end_date)
+# Parse all date ranges at once to create the new 'End Date' column
+df["End Date"] = parse_date_ranges(df["Date"])["End Date"].dt.strftime("%Y-%m-%d")
 
 # Display the first few rows of the updated dataframe
 print(df[["Tournament name", "Date", "End Date"]].head(10))
@@ -1,4 +1,5 @@
 import csv
+import json
 import os
 import re
 import time
@@ -10,6 +11,9 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import Select, WebDriverWait
 from webdriver_manager.chrome import ChromeDriverManager
 
+from utils import LEADERBOARD_URL, archive_page
+from utils.archive_utils import url_key
+
 
 def extract_tournament_id(url):
     match = re.search(r"/tournamentId/(\d+)", url)
@@ -31,6 +35,7 @@ def scrape_tournaments(driver, year):
 
     # Wait for the page to update
     time.sleep(2)
+    archive_page(LEADERBOARD_URL, driver.page_source, view=f"season-{year}")
 
     # Get the tournament dropdown
     tournament_dropdown = wait.until(
@@ -43,6 +48,7 @@ def scrape_tournaments(driver, year):
 
     # List to store tournament information
     tournaments = []
+    links = {}
 
     # Iterate through each tournament option
     for option in tournament_options:
@@ -52,6 +58,10 @@ def scrape_tournaments(driver, year):
         current_url = driver.current_url
         tournament_id = extract_tournament_id(current_url)
         tournaments.append({"name": tournament_name, "id": tournament_id, "year": year})
+        links[tournament_name] = url_key(current_url)
+
+    # Where each option leads, so a replay server can follow the dropdown
+    archive_page(LEADERBOARD_URL, json.dumps(links), view=f"links-{year}")
 
     return tournaments
 
@@ -86,7 +96,8 @@ def main():
     driver = webdriver.Chrome(service=service)
 
     # Navigate to the ESPN golf leaderboard
-    driver.get("https://www.espn.com/golf/leaderboard")
+    driver.get(LEADERBOARD_URL)
+    archive_page(LEADERBOARD_URL, driver.page_source)
 
     # Get all available years from the dropdown
     year_xpath = "//*[contains(@class, 'mt4')][1]//*[contains(@class, 'mr4')]//*[contains(@class, 'dropdown__select')][1]"
@@ -2,23 +2,29 @@ import csv
 import json
 import os
 import sys
-import time
 
-from utils import scrape_tournament_info, setup_driver
+from utils import (
+    LEADERBOARD_URL,
+    build_tournament_catalog,
+    scrape_tournament_info,
+    setup_driver,
+)
+from utils.throttle_utils import throttled
+from utils.timing_utils import timed, write_timing_report
 
 
 def load_tournament_ids_by_year(directory):
-    tournaments = []
-    seen_ids = set()
-    for filename in os.listdir(directory):
-        if filename.endswith(".csv") and filename.startswith("golf_tournaments"):
-            with open(os.path.join(directory, filename), "r") as csvfile:
-                reader = csv.DictReader(csvfile)
-                for row in reader:
-                    if row["id"] not in seen_ids:
-                        tournaments.append(row)
-                        seen_ids.add(row["id"])
-    return tournaments
+    # One entry per tournament ID, assigned to its canonical season
+    catalog = build_tournament_catalog(directory)
+    catalog = catalog[catalog["Listings"] > 0]
+    return [
+        {
+            "name": row["Tournament name"],
+            "id": str(tournament_id),
+            "year": row["Season"],
+        }
+        for tournament_id, row in catalog.iterrows()
+    ]
 
 
 def process_tournaments(tournaments, output_file):
@@ -47,17 +53,20 @@ def process_tournaments(tournaments, output_file):
                     )
                     continue
 
-                url = f"https://www.espn.com/golf/leaderboard/_/tournamentId/{tournament['id']}"
+                url = f"{LEADERBOARD_URL}/_/tournamentId/{tournament['id']}"
                 print(f"Scraping: {url}")
 
-                info = scrape_tournament_info(driver, url)
+                with throttled(url) as request:
+                    info = scrape_tournament_info(driver, url)
+                    request["ok"] = info.get("Tournament name", "") != "Not found"
 
                 # Only write the row if we successfully scraped the tournament name
                 if info.get("Tournament name", "") != "Not found":
                     info["Tournament ID"] = tournament["id"]
                     info["Year"] = tournament["year"]
-                    writer.writerow(info)
-                    csvfile.flush()  # Flush after each write
+                    with timed("write", "process_tournaments", tournament["id"]):
+                        writer.writerow(info)
+                        csvfile.flush()  # Flush after each write
 
                     # Print the row data to stdout
                     print(f"Row written: {json.dumps(info, indent=2)}")
@@ -70,8 +79,6 @@ def process_tournaments(tournaments, output_file):
                         f"Skipping tournament {tournament['id']}: Unable to scrape data"
                     )
 
-                time.sleep(1)  # Add a delay to avoid overloading the server
-
         print(f"CSV file has been successfully saved to: {output_file}")
 
     except IOError as e:
@@ -88,3 +95,4 @@ if __name__ == "__main__":
 
     tournaments = load_tournament_ids_by_year(data_directory)
     process_tournaments(tournaments, output_file)
+    write_timing_report("hist-tournament-info")
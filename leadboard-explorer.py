@@ -1,21 +1,158 @@
+import argparse
+import glob
+
 import pandas as pd
 
-# Read in Tournament info data from data folder
-df = pd.read_csv("data/tournament_info.csv")
+from utils.catalog_utils import load_tournament_catalog
+from utils.player_utils import PLAYERS_FILE, load_player_dimension, resolve_player_id
+from utils.season_utils import AGGREGATE_COLUMNS
+from utils.store_utils import cached_query, read_table, table_path
+
+TOURNAMENT_INFO_FILE = "data/tournament_info.csv"
+
+
+def player_names():
+    return load_player_dimension().set_index("Player ID")["Player name"]
+
+
+def query_player(args):
+    """
+    Every tournament of one player, read from the fact table with a row filter.
+    """
+    players = load_player_dimension()
+    player = int(args.player) if args.player.isdigit() else args.player
+    player_id = resolve_player_id(player, players)
+    if player_id is None:
+        raise ValueError(f"Unknown player: {args.player}")
+
+    history = read_table(
+        f"{args.source}_facts",
+        memory_map=True,
+        filters=[("PLAYER_ID", "==", player_id)],
+    )
+    catalog = load_tournament_catalog()
+    history.insert(
+        0, "Tournament name", history["TOURNAMENT_ID"].map(catalog["Tournament name"])
+    )
+    history.insert(1, "End Date", history["TOURNAMENT_ID"].map(catalog["End Date"]))
+    return history.sort_values("End Date", ignore_index=True)
+
 
-# Find rows with non-unique Tournament IDs
-non_unique_ids = df[df.duplicated("Tournament ID", keep=False)]
+def query_tournament(args):
+    """
+    One tournament's leaderboard or player stats, with player names.
+    """
+    rows = read_table(
+        f"{args.source}_facts",
+        memory_map=True,
+        filters=[("TOURNAMENT_ID", "==", args.tournament_id)],
+    )
+    rows.insert(
+        rows.columns.get_loc("PLAYER_ID") + 1,
+        "PLAYER",
+        rows["PLAYER_ID"].map(player_names()),
+    )
+    return rows
 
-# Group by Tournament ID and count occurrences
-id_counts = non_unique_ids["Tournament ID"].value_counts()
 
-print(f"Non-unique Tournament ID count: {id_counts}")
+def query_season(args):
+    """
+    Season aggregates of every player with at least --min-events events.
+    """
+    aggregates = read_table(
+        "season_aggregates",
+        memory_map=True,
+        filters=[("SEASON", "==", args.season), ("EVENTS", ">=", args.min_events)],
+    )
+    aggregates.insert(2, "PLAYER", aggregates["PLAYER_ID"].map(player_names()))
+    ascending = args.sort in ("SCORING AVG", "PLAYER")
+    return aggregates.sort_values(args.sort, ascending=ascending, ignore_index=True)
+
 
-print("\nDetailed information for non-unique Tournament IDs:")
-for tournament_id in id_counts.index:
-    print(f"\nTournament ID: {tournament_id}")
-    print(
-        non_unique_ids[non_unique_ids["Tournament ID"] == tournament_id][
-            ["Year", "Tournament name", "Date", "Location"]
-        ].to_string(index=False)
+def query_duplicates(args):
+    """
+    Tournament IDs listed in more than one season file, with their canonical season.
+    """
+    catalog = load_tournament_catalog()
+    duplicated = catalog[catalog["Listings"] > 1]
+    return duplicated[
+        ["Season", "Seasons listed", "Tournament name", "Date", "Location"]
+    ].reset_index()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Query the leaderboard, tournament and player stats tables"
     )
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        "--no-cache", action="store_true", help="Recompute instead of using the cache"
+    )
+    common.add_argument("--limit", type=int, help="Only print the first N rows")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    player = subparsers.add_parser(
+        "player", help="A player's tournament history", parents=[common]
+    )
+    player.add_argument("player", help="Player ID or name")
+    player.add_argument(
+        "--source", choices=["player_stats", "leaderboard"], default="player_stats"
+    )
+    player.set_defaults(query=query_player, tables=["{source}_facts"])
+
+    tournament = subparsers.add_parser(
+        "tournament", help="A tournament's results", parents=[common]
+    )
+    tournament.add_argument("tournament_id", type=int)
+    tournament.add_argument(
+        "--source", choices=["leaderboard", "player_stats"], default="leaderboard"
+    )
+    tournament.set_defaults(query=query_tournament, tables=["{source}_facts"])
+
+    season = subparsers.add_parser(
+        "season", help="Season aggregates of all players", parents=[common]
+    )
+    season.add_argument("season", help='Season label, e.g. "2024" or "2022-23"')
+    season.add_argument("--min-events", type=int, default=1)
+    season.add_argument(
+        "--sort",
+        default="EVENTS",
+        choices=["PLAYER"] + AGGREGATE_COLUMNS,
+        help="Column to sort by",
+    )
+    season.set_defaults(query=query_season, tables=["season_aggregates"])
+
+    duplicates = subparsers.add_parser(
+        "duplicates",
+        help="Tournament IDs listed in several season files",
+        parents=[common],
+    )
+    duplicates.set_defaults(query=query_duplicates, tables=[])
+
+    args = parser.parse_args()
+
+    # Cached results are invalidated when any table or CSV the query reads changes
+    paths = [table_path(name.format(**vars(args))) for name in args.tables]
+    paths += [PLAYERS_FILE, TOURNAMENT_INFO_FILE]
+    paths += glob.glob("data/golf_tournaments_*.csv")
+    key = repr(
+        sorted(
+            (name, value)
+            for name, value in vars(args).items()
+            if name not in ("query", "tables", "no_cache", "limit")
+        )
+    )
+
+    if args.no_cache:
+        result = args.query(args)
+    else:
+        result = cached_query(key, paths, lambda: args.query(args))
+
+    if args.limit:
+        result = result.head(args.limit)
+    with pd.option_context("display.max_columns", None, "display.width", 200):
+        print(result.to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+import argparse
+import os
+import subprocess
+import sys
+
+import pandas as pd
+
+from utils.backfill_utils import load_dataset_ids
+from utils.catalog_utils import load_season_listings
+from utils.feature_utils import refresh_course_fit_features
+from utils.pipeline_utils import run_pipeline
+from utils.player_utils import LEADERBOARD_FILE, PLAYER_STATS_DIR, build_player_index
+from utils.reparse_utils import merge_leaderboards
+from utils.scoring_utils import refresh_round_scores_vs_field, tournament_fingerprints
+from utils.season_utils import refresh_season_aggregates
+from utils.store_utils import DERIVED_DIR, files_fingerprint, table_path
+from utils.tensor_utils import PLAYER_STATS_TENSOR_FILE, build_player_stats_tensor
+from utils.timing_utils import timed, write_timing_report
+from utils.tournament_utils import (
+    clean_leaderboard_batch,
+    generate_urls,
+    scrape_leaderboard,
+    update_tournament_info,
+)
+
+DATA_DIR = "data"
+TOURNAMENT_INFO_FILE = os.path.join(DATA_DIR, "tournament_info.csv")
+
+
+def run_script(script, *args):
+    # Relay the output line by line so the pipeline prefixes it with the stage
+    with subprocess.Popen(
+        [sys.executable, "-u", script, *args],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    ) as process:
+        for line in process.stdout:
+            print(line, end="")
+    if process.returncode:
+        raise subprocess.CalledProcessError(process.returncode, script)
+
+
+def read_ids(path, column):
+    if not os.path.exists(path):
+        return set()
+    return set(pd.read_csv(path, usecols=[column])[column].dropna().astype("int64"))
+
+
+def player_stats_file(tournament_id):
+    return os.path.join(PLAYER_STATS_DIR, f"player_stats_{tournament_id}.csv")
+
+
+# Fingerprints: one per tournament, over the rows each stage reads
+
+
+def listing_fingerprints():
+    return tournament_fingerprints(load_season_listings(DATA_DIR), "id")
+
+
+def info_fingerprints():
+    return tournament_fingerprints(pd.read_csv(TOURNAMENT_INFO_FILE), "Tournament ID")
+
+
+def season_fingerprints():
+    leaderboard = pd.read_csv(LEADERBOARD_FILE)
+    rows = tournament_fingerprints(leaderboard)
+    return {
+        tournament_id: f"{fingerprint}-"
+        + files_fingerprint([player_stats_file(tournament_id)])
+        for tournament_id, fingerprint in rows.items()
+    }
+
+
+# Outputs: the tournaments each stage has produced
+
+
+def info_done(keys):
+    info = pd.read_csv(TOURNAMENT_INFO_FILE).dropna(subset=["Date"])
+    return info["Tournament ID"].astype("int64")
+
+
+def leaderboards_done(keys):
+    return read_ids(LEADERBOARD_FILE, "TOURNAMENT_ID")
+
+
+def player_stats_done(keys):
+    # Tournaments recorded as having no player stats count as done, as in
+    # the backfill planner, so they are not rescraped on every run
+    have = load_dataset_ids(DATA_DIR)
+    done = have["player_stats"] | have["no_stats"]
+    return [key for key in keys if int(key) in done]
+
+
+def season_aggregates_done(keys):
+    return keys if os.path.exists(table_path("season_aggregates")) else []
+
+
+# Runs: each receives the stale keys
+
+
+def update_leaderboards(tournament_ids):
+    raw_leaderboards = []
+    for url in generate_urls(list(tournament_ids)):
+        leaderboard_df = scrape_leaderboard(url)
+        if leaderboard_df is not None:
+            raw_leaderboards.append(leaderboard_df)
+
+    if not raw_leaderboards:
+        raise RuntimeError("No leaderboard data was successfully scraped")
+
+    leaderboard, _ = clean_leaderboard_batch(
+        pd.concat(raw_leaderboards, ignore_index=True)
+    )
+    existing = None
+    if os.path.exists(LEADERBOARD_FILE):
+        existing = pd.read_csv(LEADERBOARD_FILE)
+    with timed("write", "update_leaderboards"):
+        merge_leaderboards(existing, leaderboard).to_csv(LEADERBOARD_FILE, index=False)
+    print(f"Updated {len(raw_leaderboards)} tournaments in {LEADERBOARD_FILE}")
+
+
+STAGES = [
+    {
+        "name": "tournament_ids",
+        "after": [],
+        "outputs": [os.path.join(DATA_DIR, "golf_tournaments_*.csv")],
+        "run": lambda keys: run_script("hist-tournament-id.py"),
+    },
+    {
+        "name": "tournament_info",
+        "after": ["tournament_ids"],
+        "inputs": [os.path.join(DATA_DIR, "golf_tournaments_*.csv")],
+        "outputs": [TOURNAMENT_INFO_FILE],
+        "fingerprints": listing_fingerprints,
+        "done": info_done,
+        "run": lambda keys: update_tournament_info(keys, DATA_DIR, overwrite=True),
+    },
+    {
+        "name": "leaderboards",
+        "after": ["tournament_info"],
+        "inputs": [TOURNAMENT_INFO_FILE],
+        "outputs": [LEADERBOARD_FILE],
+        "fingerprints": info_fingerprints,
+        "done": leaderboards_done,
+        "run": update_leaderboards,
+    },
+    {
+        "name": "player_stats",
+        "after": ["tournament_info"],
+        "inputs": [TOURNAMENT_INFO_FILE],
+        "outputs": [os.path.join(PLAYER_STATS_DIR, "player_stats_*.csv")],
+        "fingerprints": info_fingerprints,
+        "done": player_stats_done,
+        "run": lambda keys: run_script(
+            "player-stats.py", *[f"--tournament-id={key}" for key in keys]
+        ),
+    },
+    {
+        "name": "player_index",
+        "after": ["leaderboards", "player_stats"],
+        "inputs": [LEADERBOARD_FILE, os.path.join(PLAYER_STATS_DIR, "*.csv")],
+        "outputs": [
+            table_path("player_appearances"),
+            table_path("leaderboard_facts"),
+            table_path("player_stats_facts"),
+        ],
+        "run": lambda keys: build_player_index(),
+    },
+    {
+        "name": "player_stats_tensor",
+        "after": ["player_index"],
+        "inputs": [table_path("player_stats_facts")],
+        "outputs": [os.path.join(DERIVED_DIR, PLAYER_STATS_TENSOR_FILE)],
+        "run": lambda keys: build_player_stats_tensor(),
+    },
+    {
+        "name": "round_scores",
+        "after": ["player_index"],
+        # The catalog it reads comes from the season files and tournament info
+        "inputs": [
+            LEADERBOARD_FILE,
+            TOURNAMENT_INFO_FILE,
+            os.path.join(DATA_DIR, "golf_tournaments_*.csv"),
+        ],
+        "outputs": [table_path("round_scores_vs_field")],
+        "run": lambda keys: refresh_round_scores_vs_field(),
+    },
+    {
+        "name": "course_fit_features",
+        "after": ["player_index"],
+        "inputs": [
+            table_path("player_stats_facts"),
+            TOURNAMENT_INFO_FILE,
+            os.path.join(DATA_DIR, "golf_tournaments_*.csv"),
+        ],
+        "outputs": [table_path("course_fit_features")],
+        "run": lambda keys: refresh_course_fit_features(),
+    },
+    {
+        "name": "season_aggregates",
+        "after": ["player_index"],
+        "inputs": [LEADERBOARD_FILE, table_path("player_stats_facts")],
+        "outputs": [table_path("season_aggregates")],
+        "fingerprints": season_fingerprints,
+        "done": season_aggregates_done,
+        "run": lambda keys: refresh_season_aggregates([int(key) for key in keys]),
+    },
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run the stale stages of the scraping and derived data pipeline"
+    )
+    parser.add_argument(
+        "stages",
+        nargs="*",
+        help="Only run these stages and their dependencies "
+        f"({', '.join(stage['name'] for stage in STAGES)})",
+    )
+    parser.add_argument("--force", action="store_true", help="Rerun everything")
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Only report stale stages"
+    )
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent stages")
+    args = parser.parse_args()
+
+    results = run_pipeline(
+        STAGES, args.stages or None, args.force, args.dry_run, args.workers
+    )
+
+    print("\nPipeline summary:")
+    for name, outcome in results.items():
+        print(f"  {name:20s} {outcome}")
+    if not args.dry_run:
+        write_timing_report("pipeline")
+    if "failed" in results.values():
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+import argparse
+
+from utils.catalog_utils import load_tournament_catalog
+from utils.form_utils import FORM_METRICS, build_player_form, refresh_player_form
+from utils.player_utils import load_player_dimension
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compute rolling player form over the last N events"
+    )
+    parser.add_argument("--window", type=int, default=8, help="Events per window")
+    parser.add_argument("--top", type=int, default=20, help="Players to show")
+    parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Recompute every window instead of only those of new tournaments",
+    )
+    args = parser.parse_args()
+
+    catalog = load_tournament_catalog()
+    if args.rebuild:
+        form = build_player_form(window=args.window, catalog=catalog)
+    else:
+        form = refresh_player_form(window=args.window, catalog=catalog)
+
+    # Current form: each player's most recent window with enough events
+    latest = form.drop_duplicates("PLAYER_ID", keep="last")
+    latest = latest[latest["EVENTS IN WINDOW"] >= args.window]
+
+    players = load_player_dimension().set_index("Player ID")["Player name"]
+    latest = latest.assign(PLAYER=latest["PLAYER_ID"].map(players))
+
+    form_columns = [f"{metric} FORM" for metric in FORM_METRICS]
+    latest[form_columns] = latest[form_columns].round(2)
+    print(f"\nBest current form over the last {args.window} events:")
+    print(
+        latest.sort_values("SCORE VS FIELD FORM")[["PLAYER", "End Date"] + form_columns]
+        .head(args.top)
+        .to_string(index=False)
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+import pandas as pd
+
+from utils.player_utils import (
+    build_player_index,
+    load_player_dimension,
+    load_player_stats,
+)
+
+# Assign player IDs and index every leaderboard and player stats row by player
+index = build_player_index()
+
+players = load_player_dimension()
+print(f"\nPlayers in dimension: {len(players)}")
+
+# Show the players with the most indexed appearances
+appearances = index.groupby("PLAYER_ID", observed=True).size().rename("Appearances")
+top_players = players.merge(
+    appearances, left_on="Player ID", right_index=True
+).sort_values("Appearances", ascending=False)
+print("\nMost frequently indexed players:")
+print(
+    top_players[["Player ID", "Player name", "Appearances"]]
+    .head(10)
+    .to_string(index=False)
+)
+
+# Report spellings that were resolved to an existing player by normalization
+names = pd.concat(
+    [
+        pd.read_csv("data/leaderboards_data.csv", usecols=["PLAYER"])["PLAYER"],
+        load_player_stats()["PLAYER"],
+    ]
+).unique()
+variants = sorted(set(names) - set(players["Player name"]))
+if variants:
+    print("\nName variants resolved to existing players:")
+    for name in variants:
+        print(f"  {name}")
@@ -0,0 +1,45 @@
+import argparse
+
+from utils.catalog_utils import load_tournament_catalog
+from utils.player_utils import load_player_dimension
+from utils.rating_utils import K_FACTOR, update_ratings
+from utils.store_utils import read_table
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Update Elo player ratings with newly added tournaments"
+    )
+    parser.add_argument(
+        "--source",
+        choices=["leaderboard", "player_stats"],
+        default="player_stats",
+        help="Finishing positions to rate (leaderboards include missed cuts)",
+    )
+    parser.add_argument("--k", type=float, default=K_FACTOR, help="Elo K factor")
+    parser.add_argument(
+        "--rebuild", action="store_true", help="Replay every tournament"
+    )
+    parser.add_argument("--top", type=int, default=20, help="Players to show")
+    args = parser.parse_args()
+
+    results = read_table(
+        f"{args.source}_facts", columns=["TOURNAMENT_ID", "PLAYER_ID", "POS"]
+    )
+    ratings = update_ratings(
+        results,
+        load_tournament_catalog(),
+        k_factor=args.k,
+        rebuild=args.rebuild,
+        history_table=f"{args.source}_rating_history",
+    )
+
+    players = load_player_dimension().set_index("Player ID")["Player name"]
+    ratings.insert(1, "PLAYER", ratings["PLAYER_ID"].map(players))
+    ratings["RATING"] = ratings["RATING"].round(1)
+    print(f"\nTop {args.top} players by rating:")
+    print(ratings.head(args.top).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
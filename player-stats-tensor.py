@@ -0,0 +1,55 @@
+import argparse
+import os
+import time
+
+from utils.player_utils import load_player_dimension, resolve_player_id
+from utils.store_utils import DERIVED_DIR
+from utils.tensor_utils import (
+    PLAYER_STATS_TENSOR_FILE,
+    TENSOR_STATS,
+    build_player_stats_tensor,
+    load_player_stats_tensor,
+    player_stat_history,
+    tournament_stat_table,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Build or query the memory-mapped player stats tensor"
+    )
+    parser.add_argument("--player", help="Player name or ID")
+    parser.add_argument("--stat", choices=TENSOR_STATS, default="GIR")
+    parser.add_argument("--tournament-id", type=int)
+    parser.add_argument(
+        "--rebuild", action="store_true", help="Rebuild the tensor before querying"
+    )
+    args = parser.parse_args()
+
+    if args.rebuild or not os.path.exists(
+        os.path.join(DERIVED_DIR, PLAYER_STATS_TENSOR_FILE)
+    ):
+        build_player_stats_tensor()
+
+    start = time.perf_counter()
+    tensor, axes = load_player_stats_tensor()
+
+    if args.player:
+        player = int(args.player) if args.player.isdigit() else args.player
+        player_id = resolve_player_id(player, load_player_dimension())
+        if player_id is None:
+            raise ValueError(f"Unknown player: {args.player}")
+        print(player_stat_history(tensor, axes, player_id, args.stat).to_string())
+
+    if args.tournament_id:
+        print(tournament_stat_table(tensor, axes, args.tournament_id).to_string())
+
+    print(
+        f"{len(axes['tournaments'])} tournaments x {len(axes['players'])} players "
+        f"x {len(axes['stats'])} stats, queried in "
+        f"{time.perf_counter() - start:.4f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,33 +1,23 @@
-import csv
+import argparse
 import os
-import time
 from datetime import datetime
-from io import StringIO
 
-import pandas as pd
 from selenium.common.exceptions import TimeoutException
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
 
 from utils import (
     extract_tournament_id,
     generate_urls,
     identify_csv_files_for_rescrape,
+    scrape_player_stats_page,
     setup_driver,
 )
-
-
-def wait_for_table_data(driver, timeout=30):
-    start_time = time.time()
-    while time.time() - start_time < timeout:
-        table = driver.find_elements(By.TAG_NAME, "table")
-        if table:
-            rows = table[0].find_elements(By.TAG_NAME, "tr")
-            if len(rows) > 1:  # Check if there's more than just the header row
-                return True
-        time.sleep(0.5)  # Short sleep to prevent excessive CPU usage
-    return False
+from utils.backfill_utils import (
+    NO_STATS_BUTTON_REASON,
+    NO_STATS_FILE,
+    record_tournaments_without_stats,
+)
+from utils.throttle_utils import throttled
+from utils.timing_utils import timed, write_timing_report
 
 
 def scrape_player_stats(urls, headless=True, additional_options=None):
@@ -48,40 +38,30 @@ def scrape_player_stats(urls, headless=True, additional_options=None):
         for url in urls:
             try:
                 print(f"Loading URL: {url}")
-                driver.get(url)
                 tournament_id = extract_tournament_id(url)
                 print(f"Processing tournament ID: {tournament_id}")
 
                 try:
-                    # Wait for and click the Player Stats button
-                    player_stats_button = WebDriverWait(driver, 10).until(
-                        EC.element_to_be_clickable(
-                            (By.XPATH, "//button[contains(text(), 'Player Stats')]")
+                    # A page without a Player Stats button loaded fine, so it
+                    # counts as a healthy request for the throttle
+                    with throttled(url):
+                        stats_df = scrape_player_stats_page(driver, url)
+                    if stats_df is None:
+                        tournaments_without_stats.append(
+                            {
+                                "url": url,
+                                "tournament_id": tournament_id,
+                                "timestamp": datetime.now().strftime(
+                                    "%Y-%m-%d %H:%M:%S"
+                                ),
+                                "reason": NO_STATS_BUTTON_REASON,
+                            }
                         )
+                        continue
+                    all_tournament_stats[tournament_id] = stats_df
+                    print(
+                        f"Successfully scraped Player Stats data for tournament ID: {tournament_id}"
                     )
-                    player_stats_button.click()
-                    print("Clicked Player Stats button")
-
-                    # Wait for the table data to load
-                    if wait_for_table_data(driver):
-                        print("Player Stats data loaded successfully")
-                        html = driver.page_source
-                        tables = pd.read_html(StringIO(html))
-
-                        if tables:
-                            stats_df = tables[
-                                -1
-                            ]  # Assuming the main stats table is the last one
-                            all_tournament_stats[tournament_id] = stats_df
-                            print(
-                                f"Successfully scraped Player Stats data for tournament ID: {tournament_id}"
-                            )
-                        else:
-                            raise Exception("No tables found in Player Stats")
-                    else:
-                        raise TimeoutException(
-                            "Timed out waiting for Player Stats data to load"
-                        )
 
                 except TimeoutException as e:
                     print(f"Timeout error for tournament {tournament_id}: {str(e)}")
@@ -109,27 +89,25 @@ def scrape_player_stats(urls, headless=True, additional_options=None):
         driver.quit()
 
     # Save information about tournaments without player stats
-    save_tournaments_without_stats(tournaments_without_stats)
+    save_tournaments_without_stats(
+        tournaments_without_stats, scraped_ids=all_tournament_stats
+    )
 
     return all_tournament_stats
 
 
 def save_tournaments_without_stats(
-    tournaments_without_stats, filename="tournaments_without_player_stats.csv"
+    tournaments_without_stats, filename=NO_STATS_FILE, scraped_ids=()
 ):
     """
-    Save information about tournaments without player stats to a CSV file.
+    Merge information about tournaments without player stats into a CSV file.
     Args:
     tournaments_without_stats (list): List of dictionaries containing tournament information.
-    filename (str): Name of the CSV file to save.
+    filename (str): Name of the CSV file to update. Rows of other tournaments are kept.
+    scraped_ids (list): IDs of tournaments whose stats were scraped, dropped from the file.
     """
+    record_tournaments_without_stats(tournaments_without_stats, scraped_ids, filename)
     if tournaments_without_stats:
-        with open(filename, "w", newline="") as csvfile:
-            fieldnames = ["url", "tournament_id", "timestamp", "reason"]
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            for tournament in tournaments_without_stats:
-                writer.writerow(tournament)
         print(f"Information about tournaments without player stats saved to {filename}")
     else:
         print("All tournaments had player stats available.")
@@ -175,20 +153,33 @@ def save_tournaments_without_stats(
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Scrape ESPN player stats")
+    parser.add_argument(
+        "--tournament-id",
+        action="append",
+        dest="tournament_ids",
+        help="Scrape this tournament (can be repeated); "
+        "defaults to every file that needs to be rescraped",
+    )
+    args = parser.parse_args()
+
     # Path to the player stats directory
     player_stats_dir = os.path.join("data", "player-stats")
 
-    # Identify CSV files that need to be rescraped
-    files_to_rescrape = identify_csv_files_for_rescrape(player_stats_dir)
+    if args.tournament_ids:
+        tournament_ids_to_rescrape = args.tournament_ids
+    else:
+        # Identify CSV files that need to be rescraped
+        files_to_rescrape = identify_csv_files_for_rescrape(player_stats_dir)
 
-    if not files_to_rescrape:
-        print("No files need to be rescraped. All data appears to be valid.")
-        return
+        if not files_to_rescrape:
+            print("No files need to be rescraped. All data appears to be valid.")
+            return
 
-    # Extract tournament IDs from the files that need to be rescraped
-    tournament_ids_to_rescrape = [
-        extract_tournament_id(filename) for filename, _ in files_to_rescrape
-    ]
+        # Extract tournament IDs from the files that need to be rescraped
+        tournament_ids_to_rescrape = [
+            extract_tournament_id(filename) for filename, _ in files_to_rescrape
+        ]
 
     print(
         f"Found {len(tournament_ids_to_rescrape)} tournaments that need to be rescraped."
@@ -203,13 +194,16 @@ def main():
     )
 
     # Process and save the rescraped data
+    os.makedirs(player_stats_dir, exist_ok=True)
     for tournament_id, stats_df in all_tournament_stats.items():
         print(f"Saving rescraped data for tournament ID: {tournament_id}")
         file_path = os.path.join(player_stats_dir, f"player_stats_{tournament_id}.csv")
-        stats_df.to_csv(file_path, index=False)
+        with timed("write", "main", tournament_id):
+            stats_df.to_csv(file_path, index=False)
         print(f"Saved to: {file_path}")
 
     print("Rescraping process completed.")
+    write_timing_report("player-stats")
 
 
 if __name__ == "__main__":
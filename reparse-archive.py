@@ -0,0 +1,93 @@
+import argparse
+import os
+
+import pandas as pd
+
+from utils.archive_utils import ARCHIVE_DIR
+from utils.player_utils import (
+    LEADERBOARD_FILE,
+    PLAYER_STATS_DIR,
+    build_player_index,
+)
+from utils.reparse_utils import merge_leaderboards, reparse_archive, write_player_stats
+from utils.scoring_utils import refresh_round_scores_vs_field
+from utils.season_utils import refresh_season_aggregates
+from utils.timing_utils import timed, write_timing_report
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Rebuild the leaderboard and player stats files from archived pages"
+    )
+    parser.add_argument("--archive-dir", default=ARCHIVE_DIR)
+    parser.add_argument(
+        "--tournament-id",
+        action="append",
+        dest="tournament_ids",
+        help="Only reparse this tournament (can be repeated)",
+    )
+    parser.add_argument("--workers", type=int, help="Default: CPU count")
+    parser.add_argument("--leaderboard-file", default=LEADERBOARD_FILE)
+    parser.add_argument("--player-stats-dir", default=PLAYER_STATS_DIR)
+    parser.add_argument(
+        "--refresh-derived",
+        action="store_true",
+        help="Refresh the round scores and season aggregates afterwards",
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Parse and report, write nothing"
+    )
+    args = parser.parse_args()
+
+    with timed("parse", "reparse_archive"):
+        result = reparse_archive(args.archive_dir, args.tournament_ids, args.workers)
+
+    if not result["failed"].empty:
+        print("Pages that could not be parsed:")
+        print(result["failed"].to_string(index=False))
+
+    if args.dry_run:
+        print("Dry run, nothing written")
+        return
+
+    leaderboard = result["leaderboard"]
+    if leaderboard is not None:
+        existing = None
+        if os.path.exists(args.leaderboard_file):
+            existing = pd.read_csv(args.leaderboard_file)
+        combined_leaderboard = merge_leaderboards(existing, leaderboard)
+        with timed("write", "main"):
+            combined_leaderboard.to_csv(args.leaderboard_file, index=False)
+        print(
+            f"Replaced {leaderboard['TOURNAMENT_ID'].nunique()} tournaments "
+            f"in {args.leaderboard_file}"
+        )
+
+        if result["extra_columns"]:
+            pd.DataFrame(result["extra_columns"]).to_csv(
+                "data/extra_column_tournaments.csv", index=False
+            )
+            print(
+                "Tournaments with extra columns saved to extra_column_tournaments.csv"
+            )
+
+    with timed("write", "main"):
+        paths = write_player_stats(result["player_stats"], args.player_stats_dir)
+    print(f"Wrote {len(paths)} player stats files to {args.player_stats_dir}")
+
+    if args.refresh_derived:
+        changed_ids = set(result["player_stats"])
+        if leaderboard is not None:
+            refresh_round_scores_vs_field(args.leaderboard_file)
+            changed_ids |= set(leaderboard["TOURNAMENT_ID"].astype(str))
+        if changed_ids:
+            # Season aggregates read the fact tables, so rebuild them from the
+            # rewritten leaderboard and player stats files first
+            build_player_index(args.leaderboard_file, args.player_stats_dir)
+            refresh_season_aggregates(changed_ids, args.leaderboard_file)
+
+    write_timing_report("reparse-archive")
+
+
+if __name__ == "__main__":
+    main()
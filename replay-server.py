@@ -0,0 +1,168 @@
+import argparse
+import json
+import re
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from utils.archive_utils import (
+    ARCHIVE_DIR,
+    load_archive_index,
+    read_archived_page,
+    url_key,
+)
+from utils.tournament_utils import LEADERBOARD_URL
+
+# Recorded pages are rendered DOM snapshots, so their scripts are dropped and
+# replaced with this one, which replays the interactions the scrapers use:
+# the Player Stats button and the season and tournament dropdowns. The
+# dropdown views are recorded under the leaderboard path by
+# hist-tournament-id.py, whichever page they are used from.
+REPLAY_SCRIPT = """
+<script>
+(function () {
+  var KEY = %s;
+  var DROPDOWN_KEY = %s;
+
+  function view(name, key) {
+    return fetch("/__replay/view?view=" + encodeURIComponent(name) +
+                 "&key=" + encodeURIComponent(key || KEY))
+      .then(function (r) { return r.ok ? r.text() : null; });
+  }
+
+  function swapBody(html) {
+    if (!html) return;
+    var doc = new DOMParser().parseFromString(html, "text/html");
+    document.body.innerHTML = doc.body.innerHTML;
+    bind();
+  }
+
+  // Show another tournament's page without navigating, keeping the dropdowns
+  // themselves so the scraper's references to them stay valid
+  function swapAround(dropdowns, html) {
+    if (!html) return;
+    var doc = new DOMParser().parseFromString(html, "text/html");
+    if (!doc.body.querySelector(".mt4")) return;
+    document.body.innerHTML = doc.body.innerHTML;
+    document.body.querySelector(".mt4").replaceWith(dropdowns);
+    bind();
+  }
+
+  function selectIn(container) {
+    return document.querySelector("." + container + " select.dropdown__select");
+  }
+
+  function bind() {
+    document.querySelectorAll("button").forEach(function (button) {
+      if (button.textContent.indexOf("Player Stats") !== -1) {
+        button.onclick = function () { view("player-stats").then(swapBody); };
+      }
+    });
+
+    var season = selectIn("mr4");
+    var tournament = selectIn("mr3");
+    if (season) {
+      season.onchange = function () {
+        view("season-" + season.selectedOptions[0].text, DROPDOWN_KEY)
+          .then(swapBody);
+      };
+    }
+    if (tournament) {
+      tournament.onchange = function () {
+        var year = season ? season.selectedOptions[0].text : "";
+        view("links-" + year, DROPDOWN_KEY).then(function (text) {
+          var target = text && JSON.parse(text)[tournament.selectedOptions[0].text];
+          if (!target) return;
+          history.pushState(null, "", target);
+          KEY = target;
+          var dropdowns = tournament.closest(".mt4");
+          view("page", target).then(function (html) {
+            if (dropdowns) swapAround(dropdowns, html);
+          });
+        });
+      };
+    }
+  }
+
+  bind();
+})();
+</script>
+"""
+
+# Views of a page as first loaded, in order of preference: scrape_leaderboard
+# records "page" once the table has loaded, the other scrapers record theirs
+# before interacting with the page
+PAGE_VIEWS = ["page", "tournament-info", "player-stats-button"]
+
+SCRIPT_PATTERN = re.compile(r"<script\b.*?</script>", re.IGNORECASE | re.DOTALL)
+
+
+def make_handler(archive_dir):
+    index = load_archive_index(archive_dir).set_index(["key", "view"])["file"]
+    print(f"Replaying {len(index)} archived pages from {archive_dir}")
+    dropdown_key = url_key(LEADERBOARD_URL)
+
+    class ReplayHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlsplit(self.path)
+            if url.path == "/__replay/view":
+                query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+                file = index.get((query.get("key"), query.get("view")))
+                if file is None:
+                    return self.send_error(404)
+                html = SCRIPT_PATTERN.sub("", read_archived_page(file, archive_dir))
+                return self.respond(html)
+
+            key = url.path + (f"?{url.query}" if url.query else "")
+            file = next(
+                (
+                    index[(key, view)]
+                    for view in PAGE_VIEWS
+                    if (key, view) in index.index
+                ),
+                None,
+            )
+            if file is None:
+                return self.send_error(404, f"Not archived: {key}")
+
+            html = SCRIPT_PATTERN.sub("", read_archived_page(file, archive_dir))
+            script = REPLAY_SCRIPT % (json.dumps(key), json.dumps(dropdown_key))
+            if "</body>" in html:
+                html = html.replace("</body>", script + "</body>", 1)
+            else:
+                html += script
+            self.respond(html)
+
+        def respond(self, html):
+            body = html.encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return ReplayHandler
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Serve recorded ESPN pages at their original paths"
+    )
+    parser.add_argument("--archive-dir", default=ARCHIVE_DIR)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(args.archive_dir))
+    print(f"Replay server on http://{args.host}:{args.port}")
+    print(f"Run the scrapers with ESPN_BASE_URL=http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("Stopped")
+
+
+if __name__ == "__main__":
+    main()
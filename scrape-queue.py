@@ -0,0 +1,291 @@
+import argparse
+import json
+import os
+import time
+import traceback
+from datetime import datetime
+from io import StringIO
+from multiprocessing import Process
+
+import pandas as pd
+
+from utils.backfill_utils import (
+    NO_STATS_BUTTON_REASON,
+    NO_STATS_FILE,
+    record_tournaments_without_stats,
+)
+from utils.queue_utils import (
+    DEFAULT_LEASE_SECONDS,
+    DEFAULT_MAX_ATTEMPTS,
+    DEFAULT_QUEUE_URL,
+    TASK_KINDS,
+    acknowledge_results,
+    claim_task,
+    collect_results,
+    complete_task,
+    default_worker_id,
+    enqueue_tasks,
+    fail_task,
+    failed_tasks,
+    queue_status,
+)
+from utils.reparse_utils import merge_leaderboards, write_player_stats
+from utils.throttle_utils import throttled
+from utils.timing_utils import write_timing_report
+from utils.tournament_utils import (
+    clean_leaderboard_batch,
+    generate_urls,
+    load_tournament_info,
+    scrape_leaderboard,
+    scrape_player_stats_page,
+    scrape_tournament_info,
+    setup_driver,
+    write_tournament_info,
+)
+
+
+def run_task(task, get_driver):
+    """
+    Scrape one task and return its JSON-serializable result.
+    """
+    url = generate_urls(task["tournament_id"])[0]
+
+    if task["kind"] == "leaderboard":
+        # scrape_leaderboard starts its own browser for each page
+        leaderboard_df = scrape_leaderboard(url)
+        if leaderboard_df is None:
+            raise RuntimeError("No leaderboard table found")
+        return leaderboard_df.to_json(orient="split", index=False)
+
+    if task["kind"] == "player_stats":
+        stats_df = scrape_player_stats_page(get_driver(), url)
+        if stats_df is None:
+            # Not a failure: collect records the tournament as having no stats
+            return {"no_stats": NO_STATS_BUTTON_REASON, "url": url}
+        return stats_df.to_json(orient="split", index=False)
+
+    info = scrape_tournament_info(get_driver(), url)
+    if info.get("Tournament name", "") == "Not found":
+        raise RuntimeError("Unable to scrape tournament details")
+    info["Tournament ID"] = task["tournament_id"]
+    info["Year"] = info.get("Date", "").split()[-1]  # Extract year from date
+    return info
+
+
+def work(queue_url, worker, kinds, lease_seconds, max_attempts, max_tasks, exit_idle):
+    """
+    Claim and scrape tasks until the queue is empty or max_tasks are done.
+    """
+    driver = None
+
+    def get_driver():
+        nonlocal driver
+        if driver is None:
+            driver = setup_driver()
+        return driver
+
+    completed = 0
+    try:
+        while max_tasks is None or completed < max_tasks:
+            task = claim_task(queue_url, worker, lease_seconds, kinds, max_attempts)
+            if task is None:
+                if exit_idle:
+                    break
+                time.sleep(5)
+                continue
+
+            print(
+                f"[{worker}] {task['kind']} {task['tournament_id']} "
+                f"(attempt {task['attempts']})"
+            )
+            try:
+                with throttled(task["tournament_id"]):
+                    result = run_task(task, get_driver)
+            except Exception as e:
+                print(f"[{worker}] failed: {e}")
+                fail_task(
+                    queue_url, task, f"{e}\n{traceback.format_exc()}", max_attempts
+                )
+                # A failed page can leave the browser in a bad state
+                if driver is not None:
+                    driver.quit()
+                    driver = None
+                continue
+
+            if not complete_task(queue_url, task, result):
+                print(f"[{worker}] lease on task {task['id']} expired, result dropped")
+            completed += 1
+    finally:
+        if driver is not None:
+            driver.quit()
+
+    print(f"[{worker}] finished {completed} tasks")
+    write_timing_report(f"scrape-worker-{worker}")
+
+
+def collect(queue_url, data_directory, no_stats_file=NO_STATS_FILE):
+    """
+    Merge finished task results into the data files.
+
+    Player stats tasks of tournaments without player stats are added to
+    no_stats_file, so the backfill planner does not queue them again.
+    Tasks are only acknowledged once their results have been written, so a
+    failed write leaves them in the queue for the next collect.
+    """
+    leaderboard_file = os.path.join(data_directory, "leaderboards_data.csv")
+    player_stats_dir = os.path.join(data_directory, "player-stats")
+
+    info = collect_results(queue_url, "tournament_info")
+    if info:
+        write_tournament_info([task["result"] for task in info], data_directory)
+        acknowledge_results(queue_url, info)
+
+    leaderboards = collect_results(queue_url, "leaderboard")
+    if leaderboards:
+        raw = pd.concat(
+            [
+                pd.read_json(StringIO(task["result"]), orient="split", dtype=False)
+                for task in leaderboards
+            ],
+            ignore_index=True,
+        )
+        leaderboard, extra_column_data = clean_leaderboard_batch(raw)
+        existing = None
+        if os.path.exists(leaderboard_file):
+            existing = pd.read_csv(leaderboard_file)
+        merge_leaderboards(existing, leaderboard).to_csv(leaderboard_file, index=False)
+        acknowledge_results(queue_url, leaderboards)
+        print(f"Merged {len(leaderboards)} leaderboards into {leaderboard_file}")
+        if extra_column_data:
+            print(f"Tournaments with extra columns: {extra_column_data}")
+
+    stats = collect_results(queue_url, "player_stats")
+    if stats:
+        no_stats = [task for task in stats if isinstance(task["result"], dict)]
+        scraped = [task for task in stats if not isinstance(task["result"], dict)]
+        paths = write_player_stats(
+            {
+                task["tournament_id"]: pd.read_json(
+                    StringIO(task["result"]), orient="split", dtype=False
+                )
+                for task in scraped
+            },
+            player_stats_dir,
+        )
+        record_tournaments_without_stats(
+            [
+                {
+                    "url": task["result"]["url"],
+                    "tournament_id": task["tournament_id"],
+                    "timestamp": datetime.fromtimestamp(task["updated_at"]).strftime(
+                        "%Y-%m-%d %H:%M:%S"
+                    ),
+                    "reason": task["result"]["no_stats"],
+                }
+                for task in no_stats
+            ],
+            [task["tournament_id"] for task in scraped],
+            no_stats_file,
+        )
+        acknowledge_results(queue_url, stats)
+        print(f"Wrote {len(paths)} player stats files to {player_stats_dir}")
+        if no_stats:
+            print(f"Recorded {len(no_stats)} tournaments without stats")
+
+    print(
+        f"Collected {len(info)} tournament info, {len(leaderboards)} leaderboard "
+        f"and {len(stats)} player stats results"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Share scraping across worker processes via a queue"
+    )
+    parser.add_argument(
+        "--queue",
+        default=DEFAULT_QUEUE_URL,
+        help=f"Queue URL (default: {DEFAULT_QUEUE_URL}). A sqlite:// queue is "
+        "only safe for workers on the host with the file on a local disk, not "
+        "on a network filesystem",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    enqueue = subparsers.add_parser("enqueue", help="Add scrape tasks")
+    enqueue.add_argument("--kind", choices=TASK_KINDS, action="append")
+    enqueue.add_argument("--priority", type=int, default=0)
+    ids = enqueue.add_mutually_exclusive_group(required=True)
+    ids.add_argument("--tournament-id", action="append", dest="tournament_ids")
+    ids.add_argument(
+        "--all", action="store_true", help="Every tournament in tournament_info.csv"
+    )
+
+    worker = subparsers.add_parser("work", help="Claim and scrape tasks")
+    worker.add_argument("--kind", choices=TASK_KINDS, action="append")
+    worker.add_argument("--processes", type=int, default=1)
+    worker.add_argument("--lease", type=float, default=DEFAULT_LEASE_SECONDS)
+    worker.add_argument("--max-attempts", type=int, default=DEFAULT_MAX_ATTEMPTS)
+    worker.add_argument("--max-tasks", type=int, help="Per process")
+    worker.add_argument(
+        "--wait", action="store_true", help="Keep polling when the queue is empty"
+    )
+
+    collector = subparsers.add_parser("collect", help="Merge results into data/")
+    collector.add_argument("--data-dir", default="data")
+
+    subparsers.add_parser("status", help="Show task counts and failures")
+    args = parser.parse_args()
+
+    if args.command == "enqueue":
+        if args.all:
+            tournament_ids = load_tournament_info("data/tournament_info.csv")[
+                "Tournament ID"
+            ].tolist()
+        else:
+            tournament_ids = args.tournament_ids
+        tasks = [
+            {"kind": kind, "tournament_id": tid, "priority": args.priority}
+            for kind in args.kind or TASK_KINDS
+            for tid in tournament_ids
+        ]
+        added = enqueue_tasks(args.queue, tasks)
+        print(f"Queued {added} tasks ({len(tasks) - added} already queued)")
+
+    elif args.command == "work":
+        worker_args = (
+            args.kind,
+            args.lease,
+            args.max_attempts,
+            args.max_tasks,
+            not args.wait,
+        )
+        if args.processes == 1:
+            work(args.queue, default_worker_id(), *worker_args)
+        else:
+            processes = [
+                Process(
+                    target=work,
+                    args=(args.queue, f"{default_worker_id()}-{i}", *worker_args),
+                )
+                for i in range(args.processes)
+            ]
+            for process in processes:
+                process.start()
+            for process in processes:
+                process.join()
+
+    elif args.command == "collect":
+        collect(args.queue, args.data_dir)
+
+    else:
+        print(json.dumps(queue_status(args.queue), indent=2))
+        for task in failed_tasks(args.queue):
+            error = task["error"].splitlines()[0] if task["error"] else ""
+            print(
+                f"Failed: {task['kind']} {task['tournament_id']} after "
+                f"{task['attempts']} attempts on {task['worker']}: {error}"
+            )
+
+
+if __name__ == "__main__":
+    main()
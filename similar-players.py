@@ -0,0 +1,60 @@
+import argparse
+import time
+
+from utils.player_utils import load_player_dimension, resolve_player_id
+from utils.similarity_utils import (
+    build_similarity_index,
+    find_similar_players,
+    refresh_similarity_index,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Find players with the most similar stat profiles"
+    )
+    parser.add_argument("player", help="Player name or ID")
+    parser.add_argument("season", help='Season label, e.g. "2024" or "2022-23"')
+    parser.add_argument("-k", type=int, default=10, help="Number of players")
+    parser.add_argument(
+        "--all-seasons", action="store_true", help="Compare against every season"
+    )
+    parser.add_argument(
+        "--approximate", action="store_true", help="Search the closest partitions only"
+    )
+    parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Rebuild the index even if its inputs have not changed",
+    )
+    args = parser.parse_args()
+
+    # The index is rebuilt automatically when the player stats or catalog change
+    index = build_similarity_index() if args.rebuild else refresh_similarity_index()
+
+    players = load_player_dimension()
+    player = int(args.player) if args.player.isdigit() else args.player
+    player_id = resolve_player_id(player, players)
+    if player_id is None:
+        raise ValueError(f"Unknown player: {args.player}")
+
+    start = time.perf_counter()
+    similar = find_similar_players(
+        index,
+        player_id,
+        args.season,
+        k=args.k,
+        same_season=not args.all_seasons,
+        approximate=args.approximate,
+    )
+    elapsed = time.perf_counter() - start
+
+    names = players.set_index("Player ID")["Player name"]
+    similar.insert(0, "PLAYER", similar["PLAYER_ID"].map(names))
+    print(f"Players most similar to {names[player_id]} in {args.season}:")
+    print(similar.round(3).to_string(index=False))
+    print(f"\nQuery took {elapsed * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+import argparse
+import time
+
+from utils.player_utils import load_player_dimension
+from utils.scoring_utils import refresh_round_scores_vs_field
+from utils.simulation_utils import player_round_models, simulate_tournament
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Simulate a tournament field from round-score history"
+    )
+    parser.add_argument(
+        "--tournament-id",
+        type=int,
+        help="Use this tournament's field (defaults to the latest leaderboard)",
+    )
+    parser.add_argument("--sims", type=int, default=100_000)
+    parser.add_argument("--cut-size", type=int, default=65)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--processes", type=int)
+    parser.add_argument("--top", type=int, default=20, help="Players to show")
+    args = parser.parse_args()
+
+    round_scores = refresh_round_scores_vs_field()
+    tournament_id = args.tournament_id or round_scores["TOURNAMENT_ID"].max()
+    field = round_scores.loc[
+        round_scores["TOURNAMENT_ID"] == tournament_id, "PLAYER_ID"
+    ].unique()
+    if not len(field):
+        raise ValueError(f"No leaderboard found for tournament ID {tournament_id}")
+
+    models = player_round_models(round_scores, field)
+    print(f"Simulating {args.sims} tournaments for a field of {len(field)} players")
+
+    start = time.perf_counter()
+    probabilities = simulate_tournament(
+        models,
+        n_sims=args.sims,
+        cut_size=args.cut_size,
+        seed=args.seed,
+        processes=args.processes,
+    )
+    print(f"Simulation took {time.perf_counter() - start:.2f}s")
+
+    players = load_player_dimension().set_index("Player ID")["Player name"]
+    probabilities.insert(0, "PLAYER", probabilities.index.map(players))
+    print(probabilities.head(args.top).round(4).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+import argparse
+import time
+
+from utils.snapshot_utils import list_snapshots, rebuild_leaderboard, record_snapshot
+from utils.throttle_utils import throttled
+from utils.tournament_utils import generate_urls, scrape_leaderboard
+
+
+def capture(tournament_ids):
+    for tournament_id, url in zip(
+        tournament_ids, generate_urls(tournament_ids), strict=True
+    ):
+        with throttled(url) as request:
+            leaderboard_df = scrape_leaderboard(url)
+            request["ok"] = leaderboard_df is not None
+        if leaderboard_df is None:
+            print(f"Failed to scrape leaderboard for tournament ID: {tournament_id}")
+            continue
+        result = record_snapshot(leaderboard_df, tournament_id)
+        if not result["stored"]:
+            print(f"{tournament_id}: no changes at {result['captured_at']}")
+        elif result["base"]:
+            print(
+                f"{tournament_id}: stored base leaderboard ({result['changes']} players)"
+            )
+        else:
+            print(f"{tournament_id}: stored {result['changes']} changes")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Capture in-progress leaderboards or rebuild them as of a time"
+    )
+    parser.add_argument(
+        "--tournament-id", action="append", dest="tournament_ids", required=True
+    )
+    parser.add_argument(
+        "--captures", type=int, default=1, help="Number of captures to take"
+    )
+    parser.add_argument(
+        "--interval", type=float, default=10, help="Minutes between captures"
+    )
+    parser.add_argument("--as-of", help="Print the leaderboard as of this time")
+    parser.add_argument("--list", action="store_true", help="List the captures")
+    parser.add_argument("--output", help="Save the rebuilt leaderboard to this CSV")
+    args = parser.parse_args()
+
+    if args.list or args.as_of:
+        for tournament_id in args.tournament_ids:
+            if args.list:
+                print(list_snapshots(tournament_id).to_string(index=False))
+            if args.as_of:
+                leaderboard = rebuild_leaderboard(tournament_id, args.as_of)
+                if args.output:
+                    leaderboard.to_csv(args.output, index=False)
+                    print(f"Saved leaderboard as of {args.as_of} to {args.output}")
+                else:
+                    print(leaderboard.to_string(index=False))
+        return
+
+    for i in range(args.captures):
+        if i:
+            time.sleep(args.interval * 60)
+        capture(args.tournament_ids)
+
+
+if __name__ == "__main__":
+    main()
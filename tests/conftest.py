@@ -0,0 +1,38 @@
+import contextlib
+import io
+import shutil
+
+import pytest
+
+from utils.catalog_utils import load_tournament_catalog
+from utils.player_utils import build_player_index
+from utils.store_utils import read_table
+
+
+@pytest.fixture(scope="session")
+def source_derived_dir(tmp_path_factory):
+    """Fact tables built once from the tracked data files."""
+    directory = tmp_path_factory.mktemp("derived")
+    with contextlib.redirect_stdout(io.StringIO()):
+        build_player_index(
+            players_file=str(directory / "players.csv"), derived_dir=str(directory)
+        )
+    return directory
+
+
+@pytest.fixture
+def derived_dir(source_derived_dir, tmp_path):
+    """A private copy of the fact tables for tests that write derived tables."""
+    directory = tmp_path / "derived"
+    shutil.copytree(source_derived_dir, directory)
+    return str(directory)
+
+
+@pytest.fixture(scope="session")
+def catalog():
+    return load_tournament_catalog()
+
+
+@pytest.fixture(scope="session")
+def player_stats_facts(source_derived_dir):
+    return read_table("player_stats_facts", str(source_derived_dir))
@@ -0,0 +1,105 @@
+import pandas as pd
+import pytest
+
+from utils.backfill_utils import plan_backfill, record_tournaments_without_stats
+
+TODAY = pd.Timestamp("2024-09-10")
+
+
+@pytest.fixture
+def data_directory(tmp_path):
+    """
+    A 2024 season of five tournaments:
+
+    1. Ended, every dataset scraped.
+    2. Ended, tournament info only; its player stats file needs rescraping.
+    3. Ended, leaderboard scraped and recorded as having no player stats.
+    4. Listed in the season file only, so dated by the end of the season.
+    5. Scraped tournament info, but it has not ended yet.
+    """
+    pd.DataFrame(
+        {
+            "name": [f"Tournament {tid}" for tid in range(1, 6)],
+            "id": range(1, 6),
+            "year": "2024",
+        }
+    ).to_csv(tmp_path / "golf_tournaments_2024.csv", index=False)
+    pd.DataFrame(
+        {
+            "Tournament ID": [1, 2, 3, 5],
+            "Year": 2024,
+            "Tournament name": [f"Tournament {tid}" for tid in (1, 2, 3, 5)],
+            "Date": [
+                "August 1 - 4, 2024",
+                "August 8 - 11, 2024",
+                "August 15 - 18, 2024",
+                "September 19 - 22, 2024",
+            ],
+        }
+    ).to_csv(tmp_path / "tournament_info.csv", index=False)
+    pd.DataFrame(
+        {"POS": ["1", "2"], "PLAYER": ["A", "B"], "TOURNAMENT_ID": [1, 3]}
+    ).to_csv(tmp_path / "leaderboards_data.csv", index=False)
+
+    stats_dir = tmp_path / "player-stats"
+    stats_dir.mkdir()
+    pd.DataFrame({"POS": ["1"], "PLAYER": ["A"], "GIR": [70.0]}).to_csv(
+        stats_dir / "player_stats_1.csv", index=False
+    )
+    pd.DataFrame([[1, 2, 3]], columns=["", "", "PLAYER"]).to_csv(
+        stats_dir / "player_stats_2.csv", index=False
+    )
+
+    record_tournaments_without_stats(
+        [{"url": "", "tournament_id": "3", "timestamp": "", "reason": "None"}],
+        no_stats_file=str(tmp_path / "no_stats.csv"),
+    )
+    return tmp_path
+
+
+def _tasks(plan):
+    return list(plan[["Tournament ID", "Kind"]].itertuples(index=False, name=None))
+
+
+def test_plan_backfill_lists_missing_scrapes_latest_first(data_directory):
+    plan = plan_backfill(
+        str(data_directory),
+        no_stats_file=str(data_directory / "no_stats.csv"),
+        today=TODAY,
+    )
+
+    assert _tasks(plan) == [
+        (4, "tournament_info"),
+        (2, "leaderboard"),
+        (2, "player_stats"),
+    ]
+    assert plan["Priority"].tolist() == [20241231, 20240811, 20240811]
+    assert plan["Tournament name"].tolist() == ["Tournament 4"] + 2 * ["Tournament 2"]
+
+
+def test_plan_backfill_retries_tournaments_without_stats(data_directory):
+    plan = plan_backfill(
+        str(data_directory),
+        kinds=["player_stats"],
+        no_stats_file=str(data_directory / "no_stats.csv"),
+        retry_no_stats=True,
+        today=TODAY,
+    )
+
+    assert _tasks(plan) == [(3, "player_stats"), (2, "player_stats")]
+
+
+def test_plan_backfill_plans_ended_tournaments_after_the_season(data_directory):
+    plan = plan_backfill(
+        str(data_directory),
+        kinds=["leaderboard"],
+        no_stats_file=str(data_directory / "no_stats.csv"),
+        today=pd.Timestamp("2025-01-01"),
+    )
+
+    assert _tasks(plan) == [(4, "leaderboard"), (5, "leaderboard"), (2, "leaderboard")]
+
+
+def test_plan_backfill_rejects_unknown_kinds(data_directory):
+    with pytest.raises(ValueError, match="Unknown task kinds: scores"):
+        plan_backfill(str(data_directory), kinds=["scores"], today=TODAY)
@@ -0,0 +1,94 @@
+import doctest
+import re
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import utils.date_utils
+from utils.date_utils import extract_and_format_end_date, parse_date_ranges
+
+INFO_FILE = "data/tournament_info.csv"
+
+
+def _date_format(date):
+    """Reduce a date string to its shape, e.g. "August 8 - 12, 2024" to "W 9 - 99, 9999"."""
+    return re.sub(r"[A-Za-z]+", "W", re.sub(r"\d", "9", date))
+
+
+def _format_examples():
+    dates = pd.read_csv(INFO_FILE)["Date"].dropna().drop_duplicates()
+    return list(dates.groupby(dates.map(_date_format)).first().items())
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    utils.date_utils._DATE_RANGE_CACHE.clear()
+    yield
+    utils.date_utils._DATE_RANGE_CACHE.clear()
+
+
+@pytest.mark.parametrize("date_format, date", _format_examples())
+def test_every_tournament_info_format_matches_the_per_string_parser(date_format, date):
+    parsed = parse_date_ranges(pd.Series([date]))
+    expected = pd.Timestamp(extract_and_format_end_date(date))
+    assert parsed["End Date"].iloc[0] == expected
+    assert parsed["Start Date"].iloc[0] <= expected
+
+
+def test_all_tournament_info_dates_match_the_per_string_parser():
+    dates = pd.read_csv(INFO_FILE)["Date"]
+    expected = pd.to_datetime(
+        [extract_and_format_end_date(d) if isinstance(d, str) else None for d in dates]
+    )
+    parsed = parse_date_ranges(dates)["End Date"]
+    np.testing.assert_array_equal(parsed.to_numpy(), expected.to_numpy())
+
+
+@pytest.mark.parametrize(
+    "date, start, end",
+    [
+        ("August 22 - 25, 2024", "2024-08-22", "2024-08-25"),
+        ("July 4 - 7, 2024", "2024-07-04", "2024-07-07"),
+        ("Aug 29 - September 1, 2024", "2024-08-29", "2024-09-01"),
+        ("August 29 - Sep 1, 2024", "2024-08-29", "2024-09-01"),
+        ("Feb 29 - March 3, 2024", "2024-02-29", "2024-03-03"),
+        ("Dec 29 - January 2, 2022", "2021-12-29", "2022-01-02"),
+        ("Sept. 5 - 8, 24", "2024-09-05", "2024-09-08"),
+        ("July 4, 2024", "2024-07-04", "2024-07-04"),
+        ("Feb 30 - March 2, 2023", None, "2023-03-02"),
+        ("Not found", None, None),
+        ("", None, None),
+    ],
+)
+def test_parse_date_ranges(date, start, end):
+    parsed = parse_date_ranges(pd.Series([date])).iloc[0]
+    assert parsed["Start Date"] is pd.NaT if start is None else pd.Timestamp(start)
+    assert parsed["End Date"] is pd.NaT if end is None else pd.Timestamp(end)
+
+
+def test_missing_values_and_index_are_kept():
+    dates = pd.Series(["July 4 - 7, 2024", None, "July 4 - 7, 2024"], index=[5, 3, 9])
+    parsed = parse_date_ranges(dates)
+    assert list(parsed.index) == [5, 3, 9]
+    assert parsed["End Date"].isna().tolist() == [False, True, False]
+    assert parsed["End Date"].dtype.kind == "M"
+
+
+def test_cached_values_give_the_same_result():
+    dates = pd.read_csv(INFO_FILE)["Date"]
+    cold = parse_date_ranges(dates)
+    assert utils.date_utils._DATE_RANGE_CACHE
+    pd.testing.assert_frame_equal(parse_date_ranges(dates), cold)
+
+
+def test_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(utils.date_utils, "_DATE_RANGE_CACHE_SIZE", 3)
+    dates = pd.Series([f"July {day} - 28, 2024" for day in range(1, 10)])
+    parsed = parse_date_ranges(dates)
+    assert len(utils.date_utils._DATE_RANGE_CACHE) == 3
+    assert parsed["Start Date"].dt.day.tolist() == list(range(1, 10))
+
+
+def test_docstring_examples():
+    assert doctest.testmod(utils.date_utils).failed == 0
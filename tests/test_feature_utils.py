@@ -0,0 +1,56 @@
+import pandas as pd
+import pytest
+
+from utils.feature_utils import (
+    compute_course_fit_features,
+    refresh_course_fit_features,
+)
+from utils.form_utils import compute_event_metrics
+
+
+def _sorted(features):
+    return features.sort_values(["PLAYER_ID", "TOURNAMENT_ID"], ignore_index=True)
+
+
+def test_adding_tournaments_equals_a_full_rebuild(
+    player_stats_facts, catalog, derived_dir
+):
+    dates = catalog["End Date"].reindex(player_stats_facts["TOURNAMENT_ID"].unique())
+    added = dates.dropna().sort_values().index[[-1, -5, len(dates) // 2]]
+    before = player_stats_facts[~player_stats_facts["TOURNAMENT_ID"].isin(added)]
+    refresh_course_fit_features(before, catalog, 5, derived_dir)
+
+    refreshed = refresh_course_fit_features(player_stats_facts, catalog, 5, derived_dir)
+
+    rebuilt = refresh_course_fit_features(
+        player_stats_facts, catalog, 5, derived_dir, force=True
+    )
+    pd.testing.assert_frame_equal(_sorted(refreshed), _sorted(rebuilt))
+
+
+def test_another_window_rebuilds_the_table(player_stats_facts, catalog, derived_dir):
+    refresh_course_fit_features(player_stats_facts, catalog, 8, derived_dir)
+
+    refreshed = refresh_course_fit_features(player_stats_facts, catalog, 3, derived_dir)
+
+    rebuilt = refresh_course_fit_features(
+        player_stats_facts, catalog, 3, derived_dir, force=True
+    )
+    assert refreshed["WINDOW"].eq(3).all()
+    pd.testing.assert_frame_equal(_sorted(refreshed), _sorted(rebuilt))
+
+
+def test_trailing_profile_only_uses_earlier_events(player_stats_facts, catalog):
+    events = compute_event_metrics(player_stats_facts, catalog)
+    features = compute_course_fit_features(events, catalog, window=3)
+
+    first = features.groupby("PLAYER_ID").head(1)
+    assert first["EVENTS BEFORE"].eq(0).all()
+    assert first["SCORE VS FIELD TRAILING"].isna().all()
+
+    # The profile going into an event is the mean of the 3 events before it
+    player = events["PLAYER_ID"].value_counts().index[0]
+    scores = events.loc[events["PLAYER_ID"] == player, "SCORE VS FIELD"]
+    trailing = features.loc[features["PLAYER_ID"] == player, "SCORE VS FIELD TRAILING"]
+    expected = scores.rolling(3, min_periods=1).mean().shift(1)
+    assert trailing.to_numpy() == pytest.approx(expected.to_numpy(), nan_ok=True)
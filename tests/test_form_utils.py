@@ -0,0 +1,68 @@
+import pandas as pd
+import pytest
+
+from utils.form_utils import (
+    build_player_form,
+    compute_player_form,
+    refresh_player_form,
+    update_player_form,
+)
+from utils.store_utils import read_table
+
+
+def _dated_tournaments(stats, catalog):
+    dates = catalog["End Date"].reindex(stats["TOURNAMENT_ID"].unique()).dropna()
+    return dates.sort_values().index
+
+
+def _assert_same_form(actual, expected):
+    pd.testing.assert_frame_equal(
+        actual.sort_values(["PLAYER_ID", "EVENT_INDEX"], ignore_index=True),
+        expected.sort_values(["PLAYER_ID", "EVENT_INDEX"], ignore_index=True),
+    )
+
+
+@pytest.mark.parametrize("position", ["latest", "middle"])
+def test_update_player_form_equals_a_full_rebuild(
+    player_stats_facts, catalog, position
+):
+    tournaments = _dated_tournaments(player_stats_facts, catalog)
+    added = (
+        tournaments[-1] if position == "latest" else tournaments[len(tournaments) // 2]
+    )
+    before = player_stats_facts[player_stats_facts["TOURNAMENT_ID"] != added]
+    new_stats = player_stats_facts[player_stats_facts["TOURNAMENT_ID"] == added]
+
+    form = compute_player_form(before, catalog, window=4)
+    updated = update_player_form(form, new_stats, catalog, window=4)
+
+    _assert_same_form(updated, compute_player_form(player_stats_facts, catalog, 4))
+
+
+def test_refresh_player_form_adds_missing_tournaments(
+    player_stats_facts, catalog, derived_dir
+):
+    tournaments = _dated_tournaments(player_stats_facts, catalog)
+    missing = player_stats_facts["TOURNAMENT_ID"].isin(tournaments[-3:])
+    build_player_form(6, player_stats_facts[~missing], catalog, derived_dir)
+
+    refreshed = refresh_player_form(
+        window=6, stats=player_stats_facts, catalog=catalog, derived_dir=derived_dir
+    )
+
+    expected = compute_player_form(player_stats_facts, catalog, 6)
+    _assert_same_form(refreshed, expected)
+    _assert_same_form(read_table("player_form", derived_dir), expected)
+
+
+def test_refresh_player_form_rebuilds_for_another_window(
+    player_stats_facts, catalog, derived_dir
+):
+    build_player_form(8, player_stats_facts, catalog, derived_dir)
+
+    refreshed = refresh_player_form(
+        window=3, stats=player_stats_facts, catalog=catalog, derived_dir=derived_dir
+    )
+
+    assert refreshed["WINDOW"].eq(3).all()
+    _assert_same_form(refreshed, compute_player_form(player_stats_facts, catalog, 3))
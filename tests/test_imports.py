@@ -0,0 +1,13 @@
+import pytest
+
+from benchmarks.run_benchmarks import IMPORT_BENCHMARKS, measure_import
+
+
+@pytest.mark.parametrize(
+    "name",
+    [name for name, (_, may_load) in IMPORT_BENCHMARKS.items() if not may_load],
+)
+def test_data_only_imports_do_not_load_selenium(name):
+    statement, _ = IMPORT_BENCHMARKS[name]
+    _, loads_selenium = measure_import(statement, repeat=1)
+    assert loads_selenium is False
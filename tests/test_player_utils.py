@@ -0,0 +1,30 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.player_utils import resolve_player_id
+
+
+@pytest.fixture
+def players():
+    return pd.DataFrame(
+        {
+            "Player ID": pd.Series([1, 2], dtype="int32"),
+            "Player name": ["Scottie Scheffler", "Ludvig Åberg"],
+            "Name key": ["scottie scheffler", "ludvig aberg"],
+        }
+    )
+
+
+@pytest.mark.parametrize("player", [2, np.int32(2), np.int64(2)])
+def test_resolve_player_id_accepts_integer_ids(players, player):
+    player_id = resolve_player_id(player, players)
+
+    assert player_id == 2
+    assert type(player_id) is int
+
+
+def test_resolve_player_id_matches_names_and_rejects_unknown_players(players):
+    assert resolve_player_id("Ludvig Aberg", players) == 2
+    assert resolve_player_id(np.int64(3), players) is None
+    assert resolve_player_id("Unknown Player", players) is None
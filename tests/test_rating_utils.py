@@ -0,0 +1,67 @@
+import doctest
+
+import pandas as pd
+import pytest
+
+import utils.rating_utils
+from utils.rating_utils import update_ratings
+from utils.store_utils import read_table
+
+
+@pytest.fixture
+def results(player_stats_facts, catalog):
+    """Dated player stats results, the default ratings source."""
+    results = player_stats_facts[["TOURNAMENT_ID", "PLAYER_ID", "POS"]]
+    return results[results["TOURNAMENT_ID"].isin(catalog.index)]
+
+
+def _latest_tournament(results, catalog):
+    dates = catalog["End Date"].reindex(results["TOURNAMENT_ID"].unique())
+    return dates.idxmax()
+
+
+def test_rerunning_update_ratings_is_idempotent(results, catalog, derived_dir):
+    first = update_ratings(results, catalog, derived_dir=derived_dir)
+    history = read_table("player_rating_history", derived_dir)
+
+    second = update_ratings(results, catalog, derived_dir=derived_dir)
+
+    pd.testing.assert_frame_equal(first, second)
+    pd.testing.assert_frame_equal(
+        read_table("player_rating_history", derived_dir), history
+    )
+
+
+def test_incremental_ratings_equal_a_rebuild(results, catalog, derived_dir):
+    latest = _latest_tournament(results, catalog)
+    update_ratings(
+        results[results["TOURNAMENT_ID"] != latest], catalog, derived_dir=derived_dir
+    )
+
+    incremental = update_ratings(results, catalog, derived_dir=derived_dir)
+
+    rebuilt = update_ratings(results, catalog, derived_dir=derived_dir, rebuild=True)
+    pd.testing.assert_frame_equal(incremental, rebuilt)
+
+
+def test_another_k_factor_replays_the_history(results, catalog, derived_dir, capsys):
+    latest = _latest_tournament(results, catalog)
+    update_ratings(
+        results[results["TOURNAMENT_ID"] != latest],
+        catalog,
+        k_factor=32,
+        derived_dir=derived_dir,
+    )
+
+    ratings = update_ratings(results, catalog, k_factor=16, derived_dir=derived_dir)
+
+    assert "replaying with 16" in capsys.readouterr().out
+    assert read_table("player_rating_history", derived_dir)["K FACTOR"].eq(16).all()
+    rebuilt = update_ratings(
+        results, catalog, k_factor=16, derived_dir=derived_dir, rebuild=True
+    )
+    pd.testing.assert_frame_equal(ratings, rebuilt)
+
+
+def test_doctests():
+    assert doctest.testmod(utils.rating_utils).failed == 0
@@ -0,0 +1,68 @@
+import pandas as pd
+import pytest
+
+from utils.player_utils import LEADERBOARD_FILE
+from utils.scoring_utils import refresh_round_scores_vs_field
+
+
+@pytest.fixture
+def leaderboards(catalog):
+    """Four tournaments built from the tracked leaderboard, one per catalog ID."""
+    source = pd.read_csv(LEADERBOARD_FILE)
+    tournament_ids = catalog.index[:4]
+    return {
+        tid: source.assign(
+            TOURNAMENT_ID=tid, R2=source["R2"] + i, R4=source["R4"].shift(i)
+        )
+        for i, tid in enumerate(tournament_ids)
+    }
+
+
+def _write(leaderboards, path):
+    pd.concat(leaderboards.values(), ignore_index=True).to_csv(path, index=False)
+    return str(path)
+
+
+def test_refresh_round_scores_equals_a_full_rebuild(
+    leaderboards, catalog, derived_dir, tmp_path, capsys
+):
+    kept, rescored, dropped, added = leaderboards
+    leaderboard_file = tmp_path / "leaderboard.csv"
+    refresh_round_scores_vs_field(
+        _write(
+            {tid: leaderboards[tid] for tid in (kept, rescored, dropped)},
+            leaderboard_file,
+        ),
+        catalog,
+        derived_dir,
+    )
+
+    changed = {
+        kept: leaderboards[kept],
+        rescored: leaderboards[rescored].assign(R1=leaderboards[rescored]["R1"] - 1),
+        added: leaderboards[added],
+    }
+    refreshed = refresh_round_scores_vs_field(
+        _write(changed, leaderboard_file), catalog, derived_dir
+    )
+    assert "Recomputing 2 of 3 tournaments (1 unchanged, 1 removed)" in (
+        capsys.readouterr().out
+    )
+
+    rebuilt = refresh_round_scores_vs_field(
+        str(leaderboard_file), catalog, str(tmp_path / "rebuilt"), force=True
+    )
+    pd.testing.assert_frame_equal(refreshed, rebuilt)
+    assert set(refreshed["TOURNAMENT_ID"]) == {kept, rescored, added}
+
+
+def test_refresh_round_scores_keeps_an_unchanged_table(
+    leaderboards, catalog, derived_dir, tmp_path, capsys
+):
+    leaderboard_file = _write(leaderboards, tmp_path / "leaderboard.csv")
+    built = refresh_round_scores_vs_field(leaderboard_file, catalog, derived_dir)
+
+    refreshed = refresh_round_scores_vs_field(leaderboard_file, catalog, derived_dir)
+
+    assert "Recomputing 0 of 4 tournaments" in capsys.readouterr().out
+    pd.testing.assert_frame_equal(refreshed, built)
@@ -0,0 +1,41 @@
+import shutil
+
+import pandas as pd
+import pytest
+
+from utils.season_utils import refresh_season_aggregates
+from utils.store_utils import read_table, write_table
+
+
+@pytest.mark.parametrize("position", ["latest", "middle"])
+def test_refresh_season_aggregates_equals_a_full_rebuild(
+    player_stats_facts, catalog, derived_dir, tmp_path, position
+):
+    dates = catalog["End Date"].reindex(player_stats_facts["TOURNAMENT_ID"].unique())
+    dates = dates.dropna().sort_values()
+    added = dates.index[-1] if position == "latest" else dates.index[len(dates) // 2]
+    rebuilt_dir = str(tmp_path / "rebuilt")
+    shutil.copytree(derived_dir, rebuilt_dir)
+
+    write_table(
+        player_stats_facts[player_stats_facts["TOURNAMENT_ID"] != added],
+        "player_stats_facts",
+        derived_dir,
+    )
+    before = refresh_season_aggregates(catalog=catalog, derived_dir=derived_dir)
+    write_table(player_stats_facts, "player_stats_facts", derived_dir)
+
+    refreshed = refresh_season_aggregates(
+        [added], catalog=catalog, derived_dir=derived_dir
+    )
+
+    rebuilt = refresh_season_aggregates(catalog=catalog, derived_dir=rebuilt_dir)
+    pd.testing.assert_frame_equal(refreshed, rebuilt)
+    pd.testing.assert_frame_equal(read_table("season_aggregates", derived_dir), rebuilt)
+
+    # Only the added tournament's season changed
+    season = catalog.loc[added, "Season"]
+    pd.testing.assert_frame_equal(
+        before[before["SEASON"] != season].reset_index(drop=True),
+        rebuilt[rebuilt["SEASON"] != season].reset_index(drop=True),
+    )
@@ -0,0 +1,54 @@
+import numpy as np
+
+from utils.similarity_utils import (
+    build_player_profiles,
+    build_similarity_index,
+    find_similar_players,
+    refresh_similarity_index,
+)
+from utils.store_utils import read_table, write_table
+
+
+def test_more_lists_than_profiles_are_clamped(player_stats_facts, catalog, tmp_path):
+    profiles = build_player_profiles(player_stats_facts, catalog).head(5)
+
+    index = build_similarity_index(profiles, n_lists=50, derived_dir=str(tmp_path))
+
+    assert len(index["centroids"]) == 5
+    assert set(index["lists"]) <= set(range(5))
+    player_id, season = profiles.iloc[0][["PLAYER_ID", "SEASON"]]
+    similar = find_similar_players(index, player_id, season, k=3, approximate=True)
+    assert len(similar) <= 3
+
+
+def test_refresh_similarity_index_rebuilds_when_stats_change(derived_dir, capsys):
+    built = refresh_similarity_index(derived_dir=derived_dir)
+    assert "Saved similarity index" in capsys.readouterr().out
+
+    kept = refresh_similarity_index(derived_dir=derived_dir)
+    assert "Saved similarity index" not in capsys.readouterr().out
+    np.testing.assert_array_equal(kept["vectors"], built["vectors"])
+
+    stats = read_table("player_stats_facts", derived_dir)
+    write_table(
+        stats[stats["TOURNAMENT_ID"] != stats["TOURNAMENT_ID"].iloc[0]],
+        "player_stats_facts",
+        derived_dir,
+    )
+
+    rebuilt = refresh_similarity_index(derived_dir=derived_dir)
+
+    assert "inputs changed; rebuilding" in capsys.readouterr().out
+    assert str(rebuilt["fingerprint"]) != str(built["fingerprint"])
+
+
+def test_refresh_similarity_index_rebuilds_for_another_partition_count(
+    derived_dir, capsys
+):
+    built = build_similarity_index(n_lists=4, derived_dir=derived_dir)
+
+    refreshed = refresh_similarity_index(n_lists=8, derived_dir=derived_dir)
+
+    assert "has 4 partitions; rebuilding" in capsys.readouterr().out
+    assert len(refreshed["centroids"]) == 8
+    np.testing.assert_array_equal(refreshed["vectors"], built["vectors"])
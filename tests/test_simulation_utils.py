@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.simulation_utils import player_round_models, simulate_tournament
+
+
+@pytest.fixture
+def models():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {"MEAN": rng.normal(0, 1, 80), "SD": rng.uniform(2.5, 3.5, 80)},
+        index=pd.RangeIndex(1, 81, name="PLAYER_ID"),
+    )
+
+
+def test_probabilities_sum_to_the_field(models):
+    probabilities = simulate_tournament(models, n_sims=5_000, cut_size=65, seed=1)
+
+    assert probabilities["WIN"].sum() == pytest.approx(1)
+    # Ties at the cut line and at 10th place can only add players
+    assert 65 <= probabilities["MAKE CUT"].sum() < 80
+    assert 10 <= probabilities["TOP 10"].sum() < 11
+    assert (probabilities["TOP 10"] <= probabilities["MAKE CUT"]).all()
+    assert probabilities.index.sort_values().equals(models.index)
+
+
+def test_probabilities_without_a_cut(models):
+    probabilities = simulate_tournament(models, n_sims=2_000, cut_after=0, seed=1)
+
+    assert probabilities["WIN"].sum() == pytest.approx(1)
+    assert probabilities["MAKE CUT"].eq(1).all()
+    assert probabilities["TOP 10"].sum() == pytest.approx(10, abs=0.01)
+
+
+def test_small_cut_limits_top_10_to_the_players_who_made_it(models):
+    probabilities = simulate_tournament(models, n_sims=2_000, cut_size=5, seed=1)
+
+    assert probabilities["WIN"].sum() == pytest.approx(1)
+    assert probabilities["TOP 10"].equals(probabilities["MAKE CUT"])
+
+
+def test_seeded_runs_are_reproducible(models):
+    first = simulate_tournament(models, n_sims=2_000, seed=7)
+    second = simulate_tournament(models, n_sims=2_000, seed=7)
+
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test_unseen_players_are_modelled_as_the_field():
+    round_scores = pd.DataFrame(
+        {"PLAYER_ID": [1, 1, 1], "VS FIELD": [-2.0, -2.0, -2.0]}
+    )
+
+    models = player_round_models(round_scores, [1, 2], prior_rounds=3, default_sd=3.0)
+
+    assert models.loc[1, "MEAN"] == pytest.approx(-1.0)
+    assert models.loc[2, ["ROUNDS", "MEAN", "SD"]].tolist() == [0, 0.0, 3.0]
@@ -0,0 +1,109 @@
+import pandas as pd
+import pytest
+
+from utils.player_utils import LEADERBOARD_FILE
+from utils.snapshot_utils import (
+    list_snapshots,
+    rebuild_leaderboard,
+    record_snapshot,
+)
+
+TOURNAMENT_ID = 401580366
+
+
+@pytest.fixture
+def captures():
+    """Leaderboards of one round as it was played, in capture order."""
+    start = pd.read_csv(LEADERBOARD_FILE).drop(columns=["R3", "R4", "TOT"])
+
+    # Scores change and two players swap places
+    moved = start.copy()
+    moved.loc[3, "SCORE"] = moved.loc[3, "SCORE"] - 2
+    moved = moved.iloc[[0, 1, 3, 2] + list(range(4, len(moved)))]
+
+    # Players withdraw, a late entry tees off and a repeated name is listed
+    changed_field = pd.concat(
+        [
+            moved.iloc[:-3],
+            pd.DataFrame(
+                {"POS": ["-", "-"], "PLAYER": ["Late Entry", moved.iloc[0]["PLAYER"]]}
+            ),
+        ],
+        ignore_index=True,
+    )
+    changed_field["TOURNAMENT_ID"] = TOURNAMENT_ID
+
+    # The third round starts: a new column, a reversed board and a dropped column
+    third_round = changed_field.drop(columns=["FEDEX PTS"]).iloc[::-1]
+    third_round.insert(5, "R3", range(len(third_round)))
+
+    return {
+        "2024-08-29T12:00:00": start,
+        "2024-08-29T13:00:00": moved,
+        "2024-08-29T14:00:00": changed_field,
+        "2024-08-29T15:00:00": third_round,
+    }
+
+
+def _assert_same_leaderboard(rebuilt, leaderboard):
+    pd.testing.assert_frame_equal(
+        rebuilt,
+        leaderboard.reset_index(drop=True).infer_objects(),
+        check_dtype=False,
+    )
+
+
+def test_rebuild_leaderboard_round_trips_every_capture(captures, tmp_path):
+    for captured_at, leaderboard in captures.items():
+        record_snapshot(leaderboard, captured_at=captured_at, snapshot_dir=tmp_path)
+
+    for captured_at, leaderboard in captures.items():
+        _assert_same_leaderboard(
+            rebuild_leaderboard(TOURNAMENT_ID, captured_at, snapshot_dir=tmp_path),
+            leaderboard,
+        )
+    _assert_same_leaderboard(
+        rebuild_leaderboard(TOURNAMENT_ID, snapshot_dir=tmp_path),
+        captures["2024-08-29T15:00:00"],
+    )
+
+
+def test_later_captures_store_only_the_changes(captures, tmp_path):
+    results = [
+        record_snapshot(leaderboard, captured_at=captured_at, snapshot_dir=tmp_path)
+        for captured_at, leaderboard in captures.items()
+    ]
+
+    assert [result["base"] for result in results] == [True, False, False, False]
+    # The player whose score changed also moved up, which counts once
+    assert results[1]["changes"] == 1
+
+    snapshots = list_snapshots(TOURNAMENT_ID, snapshot_dir=tmp_path)
+    assert snapshots["PLAYERS"].tolist() == [30, 30, 29, 29]
+    assert snapshots["BASE"].tolist() == [True, False, False, False]
+
+
+def test_identical_captures_are_not_stored(captures, tmp_path):
+    start = captures["2024-08-29T12:00:00"]
+    record_snapshot(start, captured_at="2024-08-29T12:00:00", snapshot_dir=tmp_path)
+
+    result = record_snapshot(
+        start, captured_at="2024-08-29T12:30:00", snapshot_dir=tmp_path
+    )
+
+    assert result["stored"] is False
+    assert len(list_snapshots(TOURNAMENT_ID, snapshot_dir=tmp_path)) == 1
+
+
+def test_captures_must_be_recorded_in_time_order(captures, tmp_path):
+    start = captures["2024-08-29T12:00:00"]
+    record_snapshot(start, captured_at="2024-08-29T12:00:00", snapshot_dir=tmp_path)
+
+    with pytest.raises(ValueError, match="older than the last capture"):
+        record_snapshot(
+            captures["2024-08-29T13:00:00"],
+            captured_at="2024-08-29T11:00:00",
+            snapshot_dir=tmp_path,
+        )
+    with pytest.raises(ValueError, match="No capture of tournament"):
+        rebuild_leaderboard(TOURNAMENT_ID, "2024-08-29T11:00:00", tmp_path)
@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.rating_utils import parse_positions
+from utils.tensor_utils import (
+    TENSOR_STATS,
+    build_player_stats_tensor,
+    load_player_stats_tensor,
+    player_stat_history,
+    tournament_stat_table,
+)
+
+
+@pytest.fixture(scope="module")
+def expected(player_stats_facts):
+    """The facts the tensor should hold, one float32 row per player and event."""
+    stats = player_stats_facts.dropna(subset=["PLAYER_ID"]).copy()
+    stats["FINISH"] = stats.groupby("TOURNAMENT_ID")["POS"].transform(parse_positions)
+    stats = stats.drop_duplicates(["TOURNAMENT_ID", "PLAYER_ID"])
+    stats["PLAYER_ID"] = stats["PLAYER_ID"].astype("int64")
+    return stats.set_index(["TOURNAMENT_ID", "PLAYER_ID"])[TENSOR_STATS].astype(
+        "float32"
+    )
+
+
+@pytest.fixture
+def tensor(player_stats_facts, derived_dir):
+    build_player_stats_tensor(player_stats_facts, derived_dir)
+    return load_player_stats_tensor(derived_dir)
+
+
+def test_tensor_cells_match_the_facts(tensor, expected):
+    array, axes = tensor
+
+    assert array.shape == (
+        expected.index.get_level_values(0).nunique(),
+        expected.index.get_level_values(1).nunique(),
+        len(TENSOR_STATS),
+    )
+    rows = [axes["tournament_index"][tid] for tid in expected.index.get_level_values(0)]
+    cols = [axes["player_index"][pid] for pid in expected.index.get_level_values(1)]
+    np.testing.assert_array_equal(array[rows, cols], expected.to_numpy())
+
+    # Every other cell is a player without stats for that tournament
+    assert np.isnan(array).all(axis=2).sum() == array.shape[0] * array.shape[1] - len(
+        expected
+    )
+
+
+def test_tournament_slices_match_the_facts(tensor, expected):
+    array, axes = tensor
+    for tournament_id in expected.index.get_level_values(0).unique()[::10]:
+        table = tournament_stat_table(array, axes, tournament_id)
+
+        facts = expected.loc[tournament_id].sort_index()
+        pd.testing.assert_frame_equal(
+            table.dropna(how="all", axis=1),
+            facts.dropna(how="all", axis=1),
+            check_names=False,
+            check_index_type=False,
+        )
+
+
+def test_player_slices_match_the_facts(tensor, expected):
+    array, axes = tensor
+    player_id = expected.index.get_level_values(1).value_counts().idxmax()
+
+    for stat in ["GIR", "SCORE", "FINISH"]:
+        history = player_stat_history(array, axes, player_id, stat)
+
+        facts = expected.xs(player_id, level="PLAYER_ID")[stat].dropna()
+        np.testing.assert_array_equal(history.index, facts.sort_index().index)
+        np.testing.assert_array_equal(history.to_numpy(), facts.sort_index().to_numpy())
+
+
+def test_slices_reject_unknown_ids(tensor):
+    array, axes = tensor
+
+    with pytest.raises(ValueError, match="Tournament not in the player stats tensor"):
+        tournament_stat_table(array, axes, 1)
+    with pytest.raises(ValueError, match="Not in the player stats tensor"):
+        player_stat_history(array, axes, axes["players"][0], "PUTTS")
@@ -0,0 +1,30 @@
+import pandas as pd
+
+from utils.tournament_utils import load_tournament_info
+
+INFO_FILE = "data/tournament_info.csv"
+
+
+def test_load_tournament_info_keeps_the_file_columns():
+    info = load_tournament_info(INFO_FILE)
+
+    assert info.columns.tolist() == pd.read_csv(INFO_FILE, nrows=0).columns.tolist()
+    assert info["Tournament ID"].dtype == "int64"
+
+
+def test_load_tournament_info_keeps_each_id_once(tmp_path):
+    info_file = tmp_path / "tournament_info.csv"
+    pd.DataFrame(
+        {
+            "Tournament ID": [3.0, None, 1.0, 3.0],
+            "Year": ["2024", "2024", "2023", "2024"],
+            "Tournament name": ["First", "No ID", "Second", "Rescraped"],
+            "Date": ["Aug 1 - 4, 2024", None, None, "Aug 1 - 4, 2024"],
+        }
+    ).to_csv(info_file, index=False)
+
+    info = load_tournament_info(str(info_file))
+
+    assert info["Tournament ID"].tolist() == [3, 1]
+    assert info["Tournament name"].tolist() == ["First", "Second"]
+    assert info["Year"].tolist() == [2024, 2023]
@@ -1,3 +1,8 @@
+import argparse
+import os
+import sys
+
+import pandas as pd
 from selenium import webdriver
 from selenium.common.exceptions import InvalidSelectorException, TimeoutException
 from selenium.webdriver.chrome.options import Options
@@ -7,6 +12,19 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 from webdriver_manager.chrome import ChromeDriverManager
 
+from utils.backfill_utils import NO_STATS_FILE
+from utils.selector_utils import (
+    PLAYER_STATS_BUTTON,
+    check_selectors_batch,
+    selector_drift_report,
+)
+from utils.tournament_utils import (
+    LEADERBOARD_URL,
+    extract_tournament_id,
+    generate_urls,
+    load_tournament_info,
+)
+
 
 def setup_driver():
     chrome_options = Options()
@@ -42,34 +60,35 @@ def check_selector(driver, selector, selector_type="css", timeout=10, element_na
             text = element.text.strip()
             return "Unique", f"Text: {text}"
         else:
+            # One script call for the XPaths of all matches
+            xpaths = driver.execute_script(
+                """
+                function getXPath(element) {
+                    if (element.id !== '')
+                        return 'id("' + element.id + '")';
+                    if (element === document.body)
+                        return element.tagName;
+                    var ix = 0;
+                    var siblings = element.parentNode.childNodes;
+                    for (var i = 0; i < siblings.length; i++) {
+                        var sibling = siblings[i];
+                        if (sibling === element)
+                            return getXPath(element.parentNode) + '/' + element.tagName + '[' + (ix + 1) + ']';
+                        if (sibling.nodeType === 1 && sibling.tagName === element.tagName)
+                            ix++;
+                    }
+                }
+                return arguments[0].map(getXPath);
+            """,
+                elements,
+            )
             element_info = []
-            for i, element in enumerate(elements, 1):
+            for i, (element, xpath) in enumerate(zip(elements, xpaths, strict=True), 1):
                 tag_name = element.tag_name
                 classes = element.get_attribute("class")
                 id_attr = element.get_attribute("id")
                 text = element.text.strip()
                 text = text[:50] + "..." if len(text) > 50 else text
-                xpath = driver.execute_script(
-                    """
-                    function getXPath(element) {
-                        if (element.id !== '')
-                            return 'id("' + element.id + '")';
-                        if (element === document.body)
-                            return element.tagName;
-                        var ix = 0;
-                        var siblings = element.parentNode.childNodes;
-                        for (var i = 0; i < siblings.length; i++) {
-                            var sibling = siblings[i];
-                            if (sibling === element)
-                                return getXPath(element.parentNode) + '/' + element.tagName + '[' + (ix + 1) + ']';
-                            if (sibling.nodeType === 1 && sibling.tagName === element.tagName)
-                                ix++;
-                        }
-                    }
-                    return getXPath(arguments[0]);
-                """,
-                    element,
-                )
                 element_info.append(
                     f"Element {i}:\n  Tag: {tag_name}\n  Classes: {classes}\n  ID: {id_attr}\n  Text: {text}\n  XPath: {xpath}"
                 )
@@ -100,9 +119,79 @@ def check_selectors(url, selectors):
     driver.quit()
 
 
+def sample_tournament_urls(sample, info_file="data/tournament_info.csv"):
+    """
+    Return the leaderboard URLs of the most recent scraped tournaments.
+    """
+    tournaments = load_tournament_info(info_file).sort_values(
+        "End Date", ascending=False
+    )
+    return generate_urls(tournaments["Tournament ID"].head(sample).astype(str).tolist())
+
+
+def pages_without_player_stats(urls, no_stats_file=NO_STATS_FILE):
+    """
+    Map the URLs of tournaments recorded as having no player stats to the
+    Player Stats button, which those pages do not have.
+    """
+    if not os.path.exists(no_stats_file):
+        return {}
+    no_stats = set(pd.read_csv(no_stats_file)["tournament_id"].astype(str))
+    return {
+        url: [PLAYER_STATS_BUTTON]
+        for url in urls
+        if extract_tournament_id(url) in no_stats
+    }
+
+
+def check_scraper_selectors(urls, workers, timeout):
+    """
+    Check the scrapers' selectors on many pages and print the drift report.
+
+    Returns:
+        bool: True if any selector drifted.
+    """
+    results = check_selectors_batch(
+        urls,
+        workers=workers,
+        timeout=timeout,
+        skip=pages_without_player_stats(urls),
+    )
+    report = selector_drift_report(results)
+
+    print("-" * 100)
+    print(report.drop(columns=["FAILING PAGES", "SAMPLE TEXT"]).to_string(index=False))
+    drifted = report[report["DRIFT"]]
+    for _, row in drifted.iterrows():
+        print(
+            f"\nDrift in {row['SELECTOR']} ({row['USED BY']}): {row['STATUS']} "
+            f"on {row['FAILING PAGES'] or 'no pages'}, "
+            f"previously {row['PREVIOUS STATUS']}"
+        )
+    if drifted.empty:
+        print("\nAll scraper selectors are healthy")
+    return not drifted.empty
+
+
 # Usage
 if __name__ == "__main__":
-    url = "https://www.espn.com/golf/leaderboard"
+    parser = argparse.ArgumentParser(description="Check the page selectors")
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Check the scrapers' selectors headless across recent tournaments",
+    )
+    parser.add_argument("--url", action="append", dest="urls")
+    parser.add_argument("--sample", type=int, default=8, help="Tournaments to check")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--timeout", type=float, default=10)
+    args = parser.parse_args()
+
+    if args.batch:
+        urls = args.urls or sample_tournament_urls(args.sample)
+        sys.exit(1 if check_scraper_selectors(urls, args.workers, args.timeout) else 0)
+
+    url = args.urls[0] if args.urls else LEADERBOARD_URL
     selectors_to_check = [
         ("Leaderboard__Event__Title", "class", "Tournament name"),
         ("Leaderboard__Event__Date", "class", "Date"),
@@ -2,81 +2,23 @@ import os
 
 import pandas as pd
 
-from utils.date_utils import extract_and_format_end_date
+from utils.feature_utils import refresh_course_fit_features
+from utils.form_utils import refresh_player_form
+from utils.player_utils import LEADERBOARD_FILE, build_player_index
+from utils.reparse_utils import merge_leaderboards
+from utils.scoring_utils import refresh_round_scores_vs_field
+from utils.season_utils import refresh_season_aggregates
+from utils.snapshot_utils import record_snapshot
+from utils.throttle_utils import throttled
+from utils.timing_utils import timed, write_timing_report
 from utils.tournament_utils import (
-    clean_leaderboard_data,
+    clean_leaderboard_batch,
     extract_tournament_id,
     generate_urls,
     scrape_leaderboard,
-    scrape_tournament_info,
-    setup_driver,
+    update_tournament_info,
 )
 
-
-def update_tournament_info(tournament_ids, data_directory="data"):
-    output_file = f"{data_directory}/tournament_info.csv"
-    existing_tournaments = set()
-
-    # Read existing tournaments if file exists
-    if os.path.exists(output_file):
-        df = pd.read_csv(output_file)
-        existing_tournaments = set(df["Tournament ID"].astype(str))
-    else:
-        df = pd.DataFrame()
-
-    driver = setup_driver()
-
-    new_tournaments = []
-    for tournament_id in tournament_ids:
-        if str(tournament_id) in existing_tournaments:
-            print(f"Tournament ID {tournament_id} already exists. Skipping.")
-            continue
-
-        url = f"https://www.espn.com/golf/leaderboard/_/tournamentId/{tournament_id}"
-        print(f"Scraping: {url}")
-
-        info = scrape_tournament_info(driver, url)
-        info["Tournament ID"] = tournament_id
-        info["Year"] = info.get("Date", "").split()[-1]  # Extract year from date
-        info["End Date"] = extract_and_format_end_date(info.get("Date", ""))
-
-        new_tournaments.append(info)
-        print(f"Scraped: {info.get('Tournament name', 'Unknown tournament')}")
-
-    driver.quit()
-
-    # Convert new tournaments to DataFrame
-    new_df = pd.DataFrame(new_tournaments)
-
-    # Combine existing and new data
-    df = pd.concat([df, new_df], ignore_index=True)
-
-    # Ensure all columns are present
-    columns = [
-        "Tournament ID",
-        "Year",
-        "Tournament name",
-        "Date",
-        "End Date",
-        "Location",
-        "Par",
-        "Yards",
-        "Purse",
-    ]
-    for col in columns:
-        if col not in df.columns:
-            df[col] = None
-
-    # Sort the DataFrame by Date
-    df["End Date"] = pd.to_datetime(df["End Date"], errors="coerce")
-    df = df.sort_values("End Date", ascending=False)
-
-    # Save the updated DataFrame to CSV
-    df.to_csv(output_file, index=False)
-
-    print(f"Added {len(new_tournaments)} new tournaments to {output_file}")
-
-
 if __name__ == "__main__":
 
     # Tournament IDs to add
@@ -88,38 +30,59 @@ if __name__ == "__main__":
     # Add leaderboard data
     tournament_urls = generate_urls(tournament_ids_to_update)
 
-    all_leaderboards = []
+    raw_leaderboards = []
     failed_tournament_ids = []
-    extra_column_data = []  # List to store information about extra columns
 
     for url in tournament_urls:
         print(f"Scraping tournament: {url}")
         tournament_id = extract_tournament_id(url)
-        leaderboard_df = scrape_leaderboard(url)
+        with throttled(url) as request:
+            leaderboard_df = scrape_leaderboard(url)
+            request["ok"] = leaderboard_df is not None
         if leaderboard_df is not None:
-            leaderboard_df, extra_info = clean_leaderboard_data(
-                leaderboard_df, tournament_id
-            )
-            if extra_info:
-                extra_column_data.append(extra_info)
-            if leaderboard_df is not None:
-                all_leaderboards.append(leaderboard_df)
-            else:
-                failed_tournament_ids.append(tournament_id)
-                print(f"Failed to clean data for tournament ID: {tournament_id}")
+            # Keep the history of events that are still in progress
+            record_snapshot(leaderboard_df, tournament_id)
+            raw_leaderboards.append(leaderboard_df)
         else:
             failed_tournament_ids.append(tournament_id)
             print(f"Failed to scrape data for tournament ID: {tournament_id}")
 
-    if all_leaderboards:
-        combined_leaderboard = pd.concat(all_leaderboards, ignore_index=True)
+    # Clean all scraped leaderboards together in one vectorized pass
+    extra_column_data = []  # List to store information about extra columns
+    if raw_leaderboards:
+        combined_leaderboard, extra_column_data = clean_leaderboard_batch(
+            pd.concat(raw_leaderboards, ignore_index=True)
+        )
 
         print(combined_leaderboard.head())
         print(combined_leaderboard.info())
 
-        db_name = "leaderboards_data.csv"
-        combined_leaderboard.to_csv(f"data/{db_name}", index=False)
-        print(f"Combined leaderboard data saved to {db_name}")
+        # Replace the updated tournaments' rows and keep every other tournament
+        existing = None
+        if os.path.exists(LEADERBOARD_FILE):
+            existing = pd.read_csv(LEADERBOARD_FILE)
+        with timed("write", "main"):
+            merge_leaderboards(existing, combined_leaderboard).to_csv(
+                LEADERBOARD_FILE, index=False
+            )
+        print(f"Merged leaderboard data into {LEADERBOARD_FILE}")
+
+        # Recompute round scores versus the field for changed tournaments only
+        refresh_round_scores_vs_field(LEADERBOARD_FILE)
+
+        # Season aggregates read player_stats_facts, so rebuild the player
+        # index and fact tables from the merged leaderboard first
+        build_player_index(LEADERBOARD_FILE)
+
+        # Only the season rows of players in the added tournaments change
+        refresh_season_aggregates(
+            combined_leaderboard["TOURNAMENT_ID"].unique(), LEADERBOARD_FILE
+        )
+
+        # Only the form windows and course fit features of players in
+        # tournaments with new player stats change
+        refresh_player_form()
+        refresh_course_fit_features()
     else:
         print("No leaderboard data was successfully scraped.")
 
@@ -142,3 +105,5 @@ if __name__ == "__main__":
         )
     else:
         print("No tournaments with extra columns detected.")
+
+    write_timing_report("update-data")
@@ -1,22 +1,134 @@
 # utils/__init__.py
 
 
+import importlib
 import logging
 
-from .csv_utils import (
-    combine_tournament_data,
-    identify_csv_files_for_rescrape,
-    load_and_compare_csv,
-)
-from .date_utils import extract_and_format_end_date
-from .tournament_utils import (
-    clean_leaderboard_data,
-    extract_tournament_id,
-    generate_urls,
-    load_tournament_info,
-    scrape_leaderboard,
-    scrape_tournament_info,
-    setup_driver,
-)
+# Submodules are imported on first use of one of their names, so data-only
+# tools do not pay for selenium, pandas or pyarrow unless they need them
+_EXPORTS = {
+    "api_utils": ["handle_request", "load_api_data", "serve"],
+    "archive_utils": ["archive_page", "load_archive_index", "read_archived_page"],
+    "backfill_utils": [
+        "enqueue_backfill",
+        "load_dataset_ids",
+        "plan_backfill",
+        "record_tournaments_without_stats",
+    ],
+    "catalog_utils": [
+        "build_tournament_catalog",
+        "get_tournament",
+        "load_tournament_catalog",
+        "tournaments_between",
+    ],
+    "csv_utils": [
+        "combine_tournament_data",
+        "identify_csv_files_for_rescrape",
+        "load_and_compare_csv",
+    ],
+    "date_utils": ["extract_and_format_end_date", "parse_date_ranges"],
+    "feature_utils": ["compute_course_fit_features", "refresh_course_fit_features"],
+    "form_utils": [
+        "build_player_form",
+        "compute_player_form",
+        "refresh_player_form",
+        "update_player_form",
+    ],
+    "pipeline_utils": ["run_pipeline"],
+    "player_utils": [
+        "assign_player_ids",
+        "build_player_index",
+        "get_player_history",
+        "load_player_dimension",
+        "load_player_stats",
+        "normalize_player_name",
+        "resolve_player_id",
+        "update_player_dimension",
+    ],
+    "queue_utils": [
+        "acknowledge_results",
+        "claim_task",
+        "collect_results",
+        "complete_task",
+        "enqueue_tasks",
+        "fail_task",
+        "queue_status",
+    ],
+    "rating_utils": ["elo_update", "parse_positions", "update_ratings"],
+    "reparse_utils": ["merge_leaderboards", "reparse_archive"],
+    "scoring_utils": ["compute_round_scores_vs_field", "refresh_round_scores_vs_field"],
+    "season_utils": [
+        "get_season_summary",
+        "load_season_aggregates",
+        "refresh_season_aggregates",
+    ],
+    "selector_utils": [
+        "check_page_selectors",
+        "check_selectors_batch",
+        "selector_drift_report",
+    ],
+    "similarity_utils": [
+        "build_similarity_index",
+        "find_similar_players",
+        "load_similarity_index",
+        "refresh_similarity_index",
+    ],
+    "simulation_utils": ["player_round_models", "simulate_tournament"],
+    "snapshot_utils": ["list_snapshots", "rebuild_leaderboard", "record_snapshot"],
+    "store_utils": ["read_table", "write_table"],
+    "tensor_utils": [
+        "build_player_stats_tensor",
+        "load_player_stats_tensor",
+        "player_stat_history",
+        "tournament_stat_table",
+    ],
+    "throttle_utils": [
+        "adaptive_timeout",
+        "get_throttle_state",
+        "reset_throttle",
+        "throttled",
+    ],
+    "timing_utils": [
+        "get_timings",
+        "reset_timings",
+        "summarize_timings",
+        "timed",
+        "write_timing_report",
+    ],
+    "tournament_utils": [
+        "LEADERBOARD_URL",
+        "clean_leaderboard_batch",
+        "clean_leaderboard_data",
+        "extract_tournament_id",
+        "generate_urls",
+        "load_tournament_info",
+        "parse_leaderboard_html",
+        "scrape_leaderboard",
+        "scrape_player_stats_page",
+        "scrape_tournament_info",
+        "setup_driver",
+        "update_tournament_info",
+        "write_tournament_info",
+    ],
+}
+
+_NAME_TO_MODULE = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = sorted(_NAME_TO_MODULE)
+
+
+def __getattr__(name):
+    module = _NAME_TO_MODULE.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    # Cache it so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 logging.getLogger(__name__).addHandler(logging.NullHandler())
@@ -0,0 +1,310 @@
+# utils/api_utils.py
+
+import asyncio
+import glob
+import hashlib
+import json
+import os
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import pandas as pd
+
+from .catalog_utils import build_tournament_catalog
+from .player_utils import (
+    assign_player_ids,
+    load_player_dimension,
+    load_player_stats,
+    resolve_player_id,
+    update_player_dimension,
+)
+from .store_utils import files_fingerprint
+
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 1000
+
+STATUS_TEXT = {
+    200: "OK",
+    304: "Not Modified",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+}
+
+
+def _data_files(data_directory: str) -> Dict[str, str]:
+    """
+    Return the paths of the data files the API reads within data_directory.
+    """
+    return {
+        "tournament_info": os.path.join(data_directory, "tournament_info.csv"),
+        "leaderboard": os.path.join(data_directory, "leaderboards_data.csv"),
+        "players": os.path.join(data_directory, "players.csv"),
+        "player_stats": os.path.join(data_directory, "player-stats"),
+    }
+
+
+def watched_files(data_directory: str = "data") -> list:
+    """
+    Return every file the API serves data from, for change detection.
+    """
+    files = _data_files(data_directory)
+    return (
+        [files["tournament_info"], files["leaderboard"], files["players"]]
+        + glob.glob(os.path.join(data_directory, "golf_tournaments_*.csv"))
+        + glob.glob(os.path.join(files["player_stats"], "player_stats_*.csv"))
+    )
+
+
+def load_api_data(data_directory: str = "data") -> Dict:
+    """
+    Parse the data files once and index them for the API.
+
+    Returns:
+        dict: "catalog" (indexed by tournament ID), "players" (the player
+        dimension), per-tournament "leaderboards" and "player_stats", per-player
+        "history" for each source, and the "fingerprint" of the files read.
+    """
+    files = _data_files(data_directory)
+    fingerprint = files_fingerprint(watched_files(data_directory))
+    catalog = build_tournament_catalog(data_directory)
+
+    leaderboard = pd.read_csv(files["leaderboard"])
+    leaderboard["TOURNAMENT_ID"] = leaderboard["TOURNAMENT_ID"].astype("int64")
+    stats = load_player_stats(files["player_stats"]).drop(columns=["ROW"])
+
+    # Players first seen since players.csv was written get their IDs now
+    known = len(load_player_dimension(files["players"]))
+    players = update_player_dimension(
+        pd.concat([leaderboard["PLAYER"], stats["PLAYER"]]), files["players"]
+    )
+    if len(players) != known:
+        # Do not reload just because players.csv was written here
+        fingerprint = files_fingerprint(watched_files(data_directory))
+    leaderboard = assign_player_ids(leaderboard, players)
+    stats = assign_player_ids(stats, players)
+
+    names = catalog["Tournament name"]
+    history = {}
+    for source, df in [("leaderboard", leaderboard), ("player_stats", stats)]:
+        df = df.assign(
+            **{"Tournament name": df["TOURNAMENT_ID"].map(names)},
+            **{"End Date": df["TOURNAMENT_ID"].map(catalog["End Date"])},
+        ).sort_values("End Date", kind="stable")
+        history[source] = {
+            int(player_id): rows for player_id, rows in df.groupby("PLAYER_ID")
+        }
+
+    print(
+        f"Loaded {len(catalog)} tournaments, {len(leaderboard)} leaderboard rows "
+        f"and {len(stats)} player stats rows"
+    )
+    return {
+        "catalog": catalog,
+        "players": players,
+        "leaderboards": dict(tuple(leaderboard.groupby("TOURNAMENT_ID"))),
+        "player_stats": dict(tuple(stats.groupby("TOURNAMENT_ID"))),
+        "history": history,
+        "fingerprint": fingerprint,
+    }
+
+
+def _paginate(df: pd.DataFrame, query: Dict[str, str]) -> Dict:
+    """
+    Slice a table by the "offset" and "limit" query parameters.
+    """
+    offset = max(0, int(query.get("offset", 0)))
+    limit = min(MAX_LIMIT, max(1, int(query.get("limit", DEFAULT_LIMIT))))
+    page = df.iloc[offset : offset + limit]
+    return {
+        "total": len(df),
+        "offset": offset,
+        "limit": limit,
+        "items": json.loads(page.to_json(orient="records", date_format="iso")),
+    }
+
+
+def _route(data: Dict, parts: list, query: Dict[str, str]) -> Tuple[int, Dict]:
+    """
+    Return the status and JSON payload of a GET request path.
+    """
+    catalog = data["catalog"]
+
+    if parts == ["tournaments"]:
+        tournaments = catalog.reset_index()
+        if "season" in query:
+            tournaments = tournaments[tournaments["Season"] == query["season"]]
+        return 200, _paginate(tournaments, query)
+
+    if len(parts) in (2, 3) and parts[0] == "tournaments":
+        if not parts[1].isdigit() or int(parts[1]) not in catalog.index:
+            return 404, {"error": f"Unknown tournament: {parts[1]}"}
+        tournament_id = int(parts[1])
+        if len(parts) == 2:
+            return 200, _paginate(catalog.loc[[tournament_id]].reset_index(), query)
+
+        tables = {"leaderboard": "leaderboards", "player-stats": "player_stats"}
+        if parts[2] not in tables:
+            return 404, {"error": f"Unknown resource: {parts[2]}"}
+        rows = data[tables[parts[2]]].get(tournament_id)
+        if rows is None:
+            return 404, {"error": f"No {parts[2]} for tournament {tournament_id}"}
+        return 200, _paginate(rows, query)
+
+    if len(parts) == 3 and parts[0] == "players" and parts[2] == "history":
+        player = int(parts[1]) if parts[1].isdigit() else parts[1]
+        player_id = resolve_player_id(player, data["players"])
+        source = query.get("source", "player_stats")
+        if source not in data["history"]:
+            return 400, {"error": f"Unknown source: {source}"}
+        if player_id is None:
+            return 404, {"error": f"Unknown player: {parts[1]}"}
+        rows = data["history"][source].get(player_id, pd.DataFrame())
+        return 200, _paginate(rows, query)
+
+    return 404, {"error": "Not found"}
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    Whether an If-None-Match list names etag, using weak comparison.
+    """
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return etag in [tag[2:] if tag.startswith("W/") else tag for tag in tags]
+
+
+def handle_request(
+    data: Dict, method: str, target: str, headers: Dict[str, str]
+) -> Tuple[int, Dict[str, str], bytes]:
+    """
+    Answer one HTTP request from the loaded data.
+
+    Endpoints (all GET, paginated with "offset" and "limit"):
+        /tournaments?season=2024
+        /tournaments/{id}
+        /tournaments/{id}/leaderboard
+        /tournaments/{id}/player-stats
+        /players/{id or name}/history?source=player_stats|leaderboard
+
+    The ETag is derived from the data fingerprint and the request target, so an
+    If-None-Match list naming it (weak "W/" tags included) is answered with 304
+    before any JSON is rendered. If-None-Match: * is answered with 304 only if
+    the resource exists. HEAD gets the headers of GET, including its
+    Content-Length, without the body.
+
+    Returns:
+        tuple: (status code, response headers, body).
+    """
+    if method not in ("GET", "HEAD"):
+        return 405, {"Allow": "GET, HEAD"}, b""
+
+    etag = '"{}"'.format(
+        hashlib.sha1(f"{data['fingerprint']} {target}".encode()).hexdigest()
+    )
+    if_none_match = headers.get("if-none-match", "")
+    if _etag_matches(if_none_match, etag):
+        return 304, {"ETag": etag}, b""
+
+    url = urlsplit(target)
+    parts = [unquote(part) for part in url.path.strip("/").split("/") if part]
+    query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+    try:
+        status, payload = _route(data, parts, query)
+    except ValueError as e:
+        status, payload = 400, {"error": str(e)}
+
+    # "*" matches any current representation, so only resources that exist
+    if status == 200 and if_none_match.strip() == "*":
+        return 304, {"ETag": etag}, b""
+
+    body = json.dumps(payload).encode()
+    response_headers = {
+        "Content-Type": "application/json",
+        "Content-Length": str(len(body)),
+    }
+    if status == 200:
+        response_headers["ETag"] = etag
+    return status, response_headers, b"" if method == "HEAD" else body
+
+
+async def _handle_connection(state: Dict, reader, writer):
+    """
+    Serve requests on one connection until the client closes it.
+    """
+    try:
+        while True:
+            request_line = await reader.readline()
+            if not request_line.strip():
+                break
+            method, target, version = request_line.decode("latin-1").split()
+
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if not line.strip():
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+            status, response_headers, body = handle_request(
+                state["data"], method, target, headers
+            )
+            keep_alive = version == "HTTP/1.1" and headers.get("connection") != "close"
+            response_headers.setdefault("Content-Length", str(len(body)))
+            response_headers["Connection"] = "keep-alive" if keep_alive else "close"
+
+            head = f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}\r\n"
+            head += "".join(f"{k}: {v}\r\n" for k, v in response_headers.items())
+            writer.write(head.encode("latin-1") + b"\r\n" + body)
+            await writer.drain()
+            if not keep_alive:
+                break
+    except (ConnectionError, ValueError):
+        pass
+    finally:
+        writer.close()
+
+
+async def _reload_on_change(state: Dict, data_directory: str, poll_interval: float):
+    """
+    Poll the data files and swap in a freshly loaded copy when they change.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        await asyncio.sleep(poll_interval)
+        fingerprint = files_fingerprint(watched_files(data_directory))
+        if fingerprint == state["data"]["fingerprint"]:
+            continue
+        print("Data files changed, reloading")
+        try:
+            # Parse off the event loop; requests keep using the old copy meanwhile
+            state["data"] = await loop.run_in_executor(
+                None, load_api_data, data_directory
+            )
+        except Exception as e:
+            print(f"Reload failed, keeping the previous data: {e}")
+
+
+async def serve(
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    data_directory: str = "data",
+    poll_interval: Optional[float] = 5.0,
+):
+    """
+    Run the read-only HTTP API until cancelled.
+
+    All connections share one parsed copy of the data. If poll_interval is set,
+    the data files are checked that often and reloaded when they change.
+    """
+    state = {"data": load_api_data(data_directory)}
+    server = await asyncio.start_server(
+        lambda reader, writer: _handle_connection(state, reader, writer), host, port
+    )
+    print(f"Serving on http://{host}:{port}")
+
+    tasks = [server.serve_forever()]
+    if poll_interval:
+        tasks.append(_reload_on_change(state, data_directory, poll_interval))
+    async with server:
+        await asyncio.gather(*tasks)
@@ -0,0 +1,115 @@
+# utils/archive_utils.py
+
+import gzip
+import hashlib
+import json
+import os
+from datetime import datetime
+from typing import Optional
+from urllib.parse import urlsplit
+
+import pandas as pd
+
+ARCHIVE_DIR = os.path.join("data", "archive")
+
+# Set to an archive directory to make the scrapers record every page they fetch
+RECORD_ENV = "ESPN_RECORD_DIR"
+
+INDEX_FILE = "index.jsonl"
+
+
+def recording_dir() -> Optional[str]:
+    """
+    Return the archive directory pages are recorded to, or None if not recording.
+    """
+    return os.environ.get(RECORD_ENV) or None
+
+
+def url_key(url: str) -> str:
+    """
+    Return the path and query of a URL, so archives do not depend on the host.
+
+    Examples:
+        >>> url_key("https://www.espn.com/golf/leaderboard/_/tournamentId/401580366")
+        '/golf/leaderboard/_/tournamentId/401580366'
+        >>> url_key("http://127.0.0.1:8001/golf/leaderboard?season=2024")
+        '/golf/leaderboard?season=2024'
+    """
+    parts = urlsplit(url)
+    return parts.path + (f"?{parts.query}" if parts.query else "")
+
+
+def archive_page(
+    url: str, html: str, view: str = "page", archive_dir: Optional[str] = None
+) -> Optional[str]:
+    """
+    Store a fetched page gzip-compressed and add it to the archive index.
+
+    Pages are keyed by URL path and view, where the view tells apart different
+    states of the same URL, e.g. "page" for the leaderboard as loaded and
+    "player-stats" after clicking the Player Stats button. A later recording of
+    the same key replaces the earlier one.
+
+    Args:
+        url (str): The URL the page was loaded from.
+        html (str): The page source.
+        view (str, optional): The page state. Defaults to "page".
+        archive_dir (str, optional): Archive directory. Defaults to the
+            ESPN_RECORD_DIR environment variable; nothing is stored if unset.
+
+    Returns:
+        str: Path of the stored page, or None if not recording.
+    """
+    archive_dir = archive_dir or recording_dir()
+    if not archive_dir:
+        return None
+
+    key = url_key(url)
+    name = hashlib.sha1(f"{view}\n{key}".encode()).hexdigest()[:20]
+    relative_path = os.path.join("pages", f"{name}.html.gz")
+    path = os.path.join(archive_dir, relative_path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    data = html.encode("utf-8")
+    tmp_path = f"{path}.tmp"
+    with gzip.open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+    entry = {
+        "url": url,
+        "key": key,
+        "view": view,
+        "file": relative_path,
+        "bytes": len(data),
+        "fetched_at": datetime.now().isoformat(timespec="seconds"),
+    }
+    with open(os.path.join(archive_dir, INDEX_FILE), "a") as f:
+        f.write(json.dumps(entry) + "\n")
+    return path
+
+
+def load_archive_index(archive_dir: str = ARCHIVE_DIR) -> pd.DataFrame:
+    """
+    Load the latest archive entry of every (key, view).
+
+    Returns:
+        pd.DataFrame: Columns "url", "key", "view", "file", "bytes" and
+        "fetched_at".
+
+    Raises:
+        FileNotFoundError: If the archive has no index.
+    """
+    path = os.path.join(archive_dir, INDEX_FILE)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Archive index not found: {path}")
+    index = pd.read_json(path, lines=True, dtype={"key": str, "view": str})
+    return index.drop_duplicates(["key", "view"], keep="last").reset_index(drop=True)
+
+
+def read_archived_page(file: str, archive_dir: str = ARCHIVE_DIR) -> str:
+    """
+    Return the page source stored at an index entry's "file".
+    """
+    with gzip.open(os.path.join(archive_dir, file), "rb") as f:
+        return f.read().decode("utf-8")
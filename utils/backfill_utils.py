@@ -0,0 +1,204 @@
+# utils/backfill_utils.py
+
+import os
+from typing import Dict, Iterable, List, Optional, Set
+
+import pandas as pd
+
+from .catalog_utils import _season_end_year, build_tournament_catalog
+from .csv_utils import identify_csv_files_for_rescrape
+from .queue_utils import TASK_KINDS, enqueue_tasks
+
+NO_STATS_FILE = "tournaments_without_player_stats.csv"
+
+# Reason recorded for tournaments whose page has no Player Stats button
+NO_STATS_BUTTON_REASON = "No Player Stats button"
+
+
+NO_STATS_COLUMNS = ["url", "tournament_id", "timestamp", "reason"]
+
+
+def record_tournaments_without_stats(
+    tournaments: List[Dict],
+    scraped_ids: Iterable = (),
+    no_stats_file: str = NO_STATS_FILE,
+) -> pd.DataFrame:
+    """
+    Merge tournaments found without player stats into no_stats_file.
+
+    Rows are keyed by tournament ID: a new row replaces the earlier one of its
+    tournament and every other row is kept, so scraping a subset of
+    tournaments does not forget the rest. Tournaments whose stats were scraped
+    are dropped from the file.
+
+    Args:
+        tournaments (list): Dicts with "url", "tournament_id", "timestamp" and
+            "reason".
+        scraped_ids (Iterable, optional): IDs of tournaments whose player stats
+            were scraped.
+        no_stats_file (str, optional): CSV of tournaments without player stats.
+
+    Returns:
+        pd.DataFrame: The rows now in the file.
+    """
+    existing = pd.DataFrame(columns=NO_STATS_COLUMNS)
+    if os.path.exists(no_stats_file):
+        existing = pd.read_csv(no_stats_file, dtype={"tournament_id": str})
+    new = pd.DataFrame(tournaments, columns=NO_STATS_COLUMNS).astype(
+        {"tournament_id": str}
+    )
+    replaced = set(new["tournament_id"]) | {str(tid) for tid in scraped_ids}
+
+    merged = pd.concat(
+        [existing[~existing["tournament_id"].isin(replaced)], new],
+        ignore_index=True,
+    ).drop_duplicates("tournament_id", keep="last")
+    merged.to_csv(no_stats_file, index=False)
+    return merged
+
+
+def _read_ids(path: str, column: str) -> Set[int]:
+    if not os.path.exists(path):
+        return set()
+    ids = pd.read_csv(path, usecols=[column])[column].dropna()
+    return set(ids.astype("int64"))
+
+
+def load_dataset_ids(
+    data_directory: str = "data", no_stats_file: str = NO_STATS_FILE
+) -> Dict[str, Set[int]]:
+    """
+    Return the set of tournament IDs each dataset has.
+
+    Returns:
+        dict: "tournament_info" (scraped into tournament_info.csv),
+        "leaderboard" (in leaderboards_data.csv), "player_stats" (with a
+        player stats file that does not need rescraping) and "no_stats"
+        (recorded in no_stats_file as having no player stats to scrape).
+    """
+    info_file = os.path.join(data_directory, "tournament_info.csv")
+    info_ids = set()
+    if os.path.exists(info_file):
+        info = pd.read_csv(info_file).dropna(subset=["Tournament ID", "Date"])
+        info_ids = set(info["Tournament ID"].astype("int64"))
+
+    stats_ids = set()
+    stats_dir = os.path.join(data_directory, "player-stats")
+    if os.path.isdir(stats_dir):
+        invalid = {f for f, _ in identify_csv_files_for_rescrape(stats_dir)}
+        stats_ids = {
+            int(f[len("player_stats_") : -len(".csv")])
+            for f in os.listdir(stats_dir)
+            if f.startswith("player_stats_") and f.endswith(".csv")
+            if f not in invalid
+        }
+
+    return {
+        "tournament_info": info_ids,
+        "leaderboard": _read_ids(
+            os.path.join(data_directory, "leaderboards_data.csv"), "TOURNAMENT_ID"
+        ),
+        "player_stats": stats_ids,
+        "no_stats": _read_ids(no_stats_file, "tournament_id"),
+    }
+
+
+def plan_backfill(
+    data_directory: str = "data",
+    kinds: Optional[List[str]] = None,
+    no_stats_file: str = NO_STATS_FILE,
+    retry_no_stats: bool = False,
+    today: Optional[pd.Timestamp] = None,
+) -> pd.DataFrame:
+    """
+    List the (tournament, dataset) scrapes still needed, most recent first.
+
+    Every tournament in the catalog (season files and tournament_info.csv) or
+    in any dataset is checked against each dataset. Leaderboards and player stats are only
+    planned for tournaments that have ended, and player stats are skipped for
+    tournaments recorded as having none unless retry_no_stats is set.
+
+    Args:
+        data_directory (str, optional): Directory holding the data files.
+            Defaults to "data".
+        kinds (list, optional): Only plan these task kinds. Defaults to
+            TASK_KINDS.
+        no_stats_file (str, optional): CSV of tournaments without player stats,
+            as written by player-stats.py.
+        retry_no_stats (bool, optional): Plan player stats for those too.
+        today (pd.Timestamp, optional): Tournaments ending after this have not
+            finished. Defaults to today.
+
+    Returns:
+        pd.DataFrame: One row per task with "Tournament ID", "Tournament name",
+        "End Date" (estimated from the season for unscraped tournaments),
+        "Kind" and "Priority" (the end date as YYYYMMDD, so later tournaments
+        are claimed first from the scrape queue).
+    """
+    kinds = kinds or TASK_KINDS
+    unknown = set(kinds) - set(TASK_KINDS)
+    if unknown:
+        raise ValueError(f"Unknown task kinds: {', '.join(sorted(unknown))}")
+    today = today if today is not None else pd.Timestamp.today().normalize()
+
+    catalog = build_tournament_catalog(data_directory)
+    have = load_dataset_ids(data_directory, no_stats_file)
+
+    # Tournaments found only in a dataset are missing from the catalog
+    tournament_ids = set(catalog.index).union(*have.values())
+
+    # Unscraped tournaments are dated by the end of their season, and ones
+    # without a season have data, so they have ended
+    season_end = pd.to_datetime(
+        catalog["Season"].dropna().map(lambda s: f"{_season_end_year(s)}-12-31")
+    )
+    end_dates = catalog["End Date"].fillna(season_end.reindex(catalog.index))
+    end_dates = end_dates.reindex(sorted(tournament_ids))
+    ended = set(end_dates.index[~(end_dates > today)])
+
+    skip = {"tournament_info": set(), "leaderboard": set(), "player_stats": set()}
+    if not retry_no_stats:
+        skip["player_stats"] = have["no_stats"]
+
+    tasks = []
+    for kind in kinds:
+        candidates = set(tournament_ids)
+        if kind != "tournament_info":
+            candidates &= ended
+        for tournament_id in candidates - have[kind] - skip[kind]:
+            tasks.append({"Tournament ID": tournament_id, "Kind": kind})
+
+    plan = pd.DataFrame(tasks, columns=["Tournament ID", "Kind"])
+    plan["Tournament name"] = plan["Tournament ID"].map(catalog["Tournament name"])
+    plan["End Date"] = plan["Tournament ID"].map(end_dates)
+    plan["Priority"] = (
+        plan["End Date"].dt.strftime("%Y%m%d").fillna("0").astype("int64")
+    )
+    plan["Kind"] = pd.Categorical(plan["Kind"], categories=TASK_KINDS)
+    plan = plan.sort_values(
+        ["Priority", "Tournament ID", "Kind"], ascending=[False, False, True]
+    )
+    plan["Kind"] = plan["Kind"].astype(str)
+    return plan[
+        ["Tournament ID", "Tournament name", "End Date", "Kind", "Priority"]
+    ].reset_index(drop=True)
+
+
+def enqueue_backfill(queue_url: str, plan: pd.DataFrame) -> int:
+    """
+    Queue the planned tasks for the scrape workers, with their priorities.
+
+    Returns:
+        int: How many tasks were added (tasks already queued are skipped).
+    """
+    return enqueue_tasks(
+        queue_url,
+        [
+            {
+                "kind": row["Kind"],
+                "tournament_id": str(row["Tournament ID"]),
+                "priority": int(row["Priority"]),
+            }
+            for _, row in plan.iterrows()
+        ],
+    )
@@ -0,0 +1,241 @@
+# utils/catalog_utils.py
+
+import os
+import re
+from typing import Dict, Optional, Tuple
+
+import pandas as pd
+
+from .date_utils import parse_date_ranges
+
+SEASON_FILE_PATTERN = r"golf_tournaments_(.+)\.csv"
+
+# The first option of the ESPN tournament dropdown is a "Tournaments" placeholder
+# that carries whatever event is currently selected, not one from that season
+PLACEHOLDER_NAME = "Tournaments"
+
+_CATALOG_CACHE: Dict[Tuple, pd.DataFrame] = {}
+
+
+def _season_end_year(season: str) -> int:
+    """
+    Return the calendar year a season label ends in, e.g. 2023 for "2022-23".
+    """
+    parts = str(season).split("-")
+    end = parts[-1]
+    if len(end) == 2:
+        end = parts[0][:2] + end
+    return int(end)
+
+
+def load_season_listings(data_directory: str = "data") -> pd.DataFrame:
+    """
+    Load every golf_tournaments_*.csv season file into one table.
+
+    Args:
+        data_directory (str, optional): Directory holding the season files.
+            Defaults to "data".
+
+    Returns:
+        pd.DataFrame: One row per listing with columns "name", "id" (int) and
+        "year" (the season label). Rows without an ID are dropped.
+    """
+    dfs = []
+    for filename in sorted(os.listdir(data_directory)):
+        if re.fullmatch(SEASON_FILE_PATTERN, filename):
+            dfs.append(pd.read_csv(os.path.join(data_directory, filename), dtype=str))
+
+    if not dfs:
+        raise FileNotFoundError(f"No season files found in {data_directory}")
+
+    listings = pd.concat(dfs, ignore_index=True).dropna(subset=["id"])
+    listings["id"] = listings["id"].astype("int64")
+    return listings
+
+
+def _canonical_seasons(listings: pd.DataFrame, end_dates: pd.Series) -> pd.Series:
+    """
+    Pick one season per tournament ID from its (possibly repeated) listings.
+
+    Placeholder listings are ignored when the ID is also listed by name. If the
+    end date is known, the earliest listed season ending in or after the end
+    date's year is chosen, otherwise the latest listed season.
+    """
+    listings = listings.assign(
+        placeholder=listings["name"] == PLACEHOLDER_NAME,
+        season_end=listings["year"].map(_season_end_year),
+    )
+    has_named = (~listings["placeholder"]).groupby(listings["id"]).transform("any")
+    listings = listings[~(listings["placeholder"] & has_named)]
+
+    end_year = listings["id"].map(end_dates.dt.year)
+    listings = listings.assign(
+        covers=end_year.isna() | (listings["season_end"] >= end_year)
+    )
+
+    # Covering seasons first, earliest first when dated, latest first otherwise
+    listings = listings.assign(
+        order=listings["season_end"].where(end_year.notna(), -listings["season_end"])
+    )
+    listings = listings.sort_values(
+        ["id", "covers", "order"], ascending=[True, False, True]
+    )
+    return listings.drop_duplicates("id").set_index("id")["year"]
+
+
+def build_tournament_catalog(
+    data_directory: str = "data", info_file: Optional[str] = None
+) -> pd.DataFrame:
+    """
+    Build the canonical tournament catalog from the season files and tournament info.
+
+    Season overlaps in the ESPN year selector list some tournaments in more than
+    one golf_tournaments_*.csv file (see data/data-dictionary.md). The catalog has
+    exactly one row per tournament ID with a canonical season, the metadata from
+    tournament_info.csv when it exists, and parsed start and end dates.
+
+    The result is indexed by "Tournament ID" for O(1) lookups and sorted by
+    "End Date" so date ranges can be found by binary search; see get_tournament
+    and tournaments_between.
+
+    Args:
+        data_directory (str, optional): Directory holding the season files.
+            Defaults to "data".
+        info_file (str, optional): Path to the tournament info CSV. Defaults to
+            tournament_info.csv in data_directory. Skipped if it does not exist.
+
+    Returns:
+        pd.DataFrame: The catalog with columns "Season", "Tournament name", "Date",
+        "Start Date", "End Date", "Location", "Par", "Yards", "Purse", "Listings"
+        (how many season-file rows list the ID) and "Seasons listed".
+    """
+    if info_file is None:
+        info_file = os.path.join(data_directory, "tournament_info.csv")
+
+    listings = load_season_listings(data_directory)
+
+    if os.path.exists(info_file):
+        info = pd.read_csv(info_file).dropna(subset=["Tournament ID"])
+        info["Tournament ID"] = info["Tournament ID"].astype("int64")
+        info = info.drop_duplicates("Tournament ID").set_index("Tournament ID")
+        info = info.drop(columns=["End Date"], errors="ignore")
+        info = info.join(parse_date_ranges(info["Date"]))
+    else:
+        info = pd.DataFrame(
+            columns=["Tournament name", "Date", "Start Date", "End Date"],
+            index=pd.Index([], dtype="int64", name="Tournament ID"),
+        )
+        info["End Date"] = pd.to_datetime(info["End Date"])
+
+    named = listings[listings["name"] != PLACEHOLDER_NAME]
+    catalog = pd.DataFrame(
+        {
+            "Season": _canonical_seasons(listings, info["End Date"]),
+            "Listed name": named.drop_duplicates("id").set_index("id")["name"],
+            "Listings": listings.groupby("id").size(),
+            "Seasons listed": listings.groupby("id")["year"].agg(
+                lambda years: ", ".join(pd.unique(years))
+            ),
+        }
+    )
+    catalog.index.name = "Tournament ID"
+
+    # Tournaments scraped into tournament_info.csv but missing from season files
+    catalog = catalog.join(info, how="outer")
+    if "Year" in catalog.columns:
+        catalog["Season"] = catalog["Season"].fillna(catalog["Year"].astype(str))
+    catalog["Tournament name"] = catalog["Tournament name"].fillna(
+        catalog["Listed name"]
+    )
+    catalog["Listings"] = catalog["Listings"].fillna(0).astype(int)
+    catalog = catalog.drop(columns=["Listed name", "Year"], errors="ignore")
+
+    catalog = catalog.reset_index().sort_values(
+        ["End Date", "Tournament ID"], na_position="last"
+    )
+    catalog = catalog.set_index("Tournament ID")
+    if not catalog.index.is_unique:
+        raise ValueError("Tournament IDs are not unique in the catalog")
+
+    columns = ["Season", "Tournament name", "Date", "Start Date", "End Date"]
+    columns += [col for col in catalog.columns if col not in columns]
+    return catalog[columns]
+
+
+def load_tournament_catalog(
+    data_directory: str = "data", info_file: Optional[str] = None
+) -> pd.DataFrame:
+    """
+    Return the tournament catalog, building it only when its inputs have changed.
+
+    The catalog is cached per process and keyed on the modification times of the
+    season files and tournament_info.csv.
+
+    Args:
+        data_directory (str, optional): Directory holding the season files.
+            Defaults to "data".
+        info_file (str, optional): Path to the tournament info CSV. Defaults to
+            tournament_info.csv in data_directory.
+
+    Returns:
+        pd.DataFrame: The catalog as returned by build_tournament_catalog.
+    """
+    if info_file is None:
+        info_file = os.path.join(data_directory, "tournament_info.csv")
+
+    inputs = [
+        os.path.join(data_directory, f)
+        for f in sorted(os.listdir(data_directory))
+        if re.fullmatch(SEASON_FILE_PATTERN, f)
+    ]
+    if os.path.exists(info_file):
+        inputs.append(info_file)
+    key = tuple((path, os.path.getmtime(path)) for path in inputs)
+
+    if key not in _CATALOG_CACHE:
+        _CATALOG_CACHE.clear()
+        _CATALOG_CACHE[key] = build_tournament_catalog(data_directory, info_file)
+    return _CATALOG_CACHE[key]
+
+
+def get_tournament(catalog: pd.DataFrame, tournament_id) -> Optional[pd.Series]:
+    """
+    Look up one tournament by ID.
+
+    Args:
+        catalog (pd.DataFrame): The tournament catalog.
+        tournament_id (Union[int, str]): The tournament ID.
+
+    Returns:
+        pd.Series: The catalog row, or None if the ID is not in the catalog.
+    """
+    try:
+        return catalog.loc[int(tournament_id)]
+    except KeyError:
+        return None
+
+
+def tournaments_between(catalog: pd.DataFrame, start=None, end=None) -> pd.DataFrame:
+    """
+    Return the tournaments whose end date falls within [start, end].
+
+    Args:
+        catalog (pd.DataFrame): The tournament catalog.
+        start (optional): First end date to include. Defaults to no lower bound.
+        end (optional): Last end date to include. Defaults to no upper bound.
+
+    Returns:
+        pd.DataFrame: The matching catalog rows in end date order.
+
+    Example:
+        catalog = load_tournament_catalog()
+        tournaments_between(catalog, "2024-01-01", "2024-03-31")
+    """
+    # The catalog is sorted by End Date with undated tournaments last
+    end_dates = catalog["End Date"]
+    dated = int(end_dates.notna().sum())
+    sorted_dates = end_dates.iloc[:dated]
+
+    lo = 0 if start is None else sorted_dates.searchsorted(pd.Timestamp(start), "left")
+    hi = dated if end is None else sorted_dates.searchsorted(pd.Timestamp(end), "right")
+    return catalog.iloc[lo:hi]
@@ -1,3 +1,10 @@
+import re
+from itertools import islice
+
+import numpy as np
+import pandas as pd
+
+
 def extract_and_format_end_date(date_range):
     months = {
         "January": "01",
@@ -55,3 +62,161 @@ def extract_and_format_end_date(date_range):
         year = "20" + year
 
     return f"{year}-{month_num}-{day}"
+
+
+_MONTH_NUMBERS = {
+    "jan": 1,
+    "feb": 2,
+    "mar": 3,
+    "apr": 4,
+    "may": 5,
+    "jun": 6,
+    "jul": 7,
+    "aug": 8,
+    "sep": 9,
+    "oct": 10,
+    "nov": 11,
+    "dec": 12,
+}
+
+_DATE_RANGE_PATTERN = (
+    r"^\s*(?P<start_month>[A-Za-z]+)\.?\s+(?P<start_day>\d{1,2})"
+    r"(?:\s*-\s*(?:(?P<end_month>[A-Za-z]+)\.?\s+)?(?P<end_day>\d{1,2}))?"
+    r",?\s+(?P<year>\d{4}|\d{2})\s*$"
+)
+_DATE_RANGE_REGEX = re.compile(_DATE_RANGE_PATTERN)
+
+# Parsed (start, end) datetime64[ns] dates keyed by the raw date
+# string, shared across calls. Bounded so long-running processes do not grow it
+# forever; the oldest entries are dropped first.
+_DATE_RANGE_CACHE = {}
+_DATE_RANGE_CACHE_SIZE = 4096
+
+
+def _remember_date_ranges(parsed):
+    _DATE_RANGE_CACHE.update(parsed)
+    excess = len(_DATE_RANGE_CACHE) - _DATE_RANGE_CACHE_SIZE
+    for key in list(islice(_DATE_RANGE_CACHE, max(excess, 0))):
+        del _DATE_RANGE_CACHE[key]
+
+
+def _month_number(name):
+    return _MONTH_NUMBERS.get(name[:3].lower(), np.nan) if name else np.nan
+
+
+def _to_days(year, month, day):
+    """
+    Assemble datetime64[D] dates from float arrays, NaT where any part is
+    missing or the day is not in the month.
+    """
+    valid = ~(np.isnan(year) | np.isnan(month) | np.isnan(day))
+    months = np.where(valid, (year - 1970) * 12 + month - 1, 0).astype("int64")
+    first = months.astype("datetime64[M]").astype("datetime64[D]")
+    month_days = (months + 1).astype("datetime64[M]").astype("datetime64[D]") - first
+    offset = np.where(valid, day, 1).astype("int64") - 1
+    valid &= (offset >= 0) & (offset < month_days.astype("int64"))
+    return np.where(valid, first + offset, np.datetime64("NaT"))
+
+
+def _parse_new_date_ranges(values):
+    """
+    Parse distinct date strings into arrays of start and end dates.
+
+    The regex runs once per distinct string; the calendar arithmetic is done
+    on all of them at once.
+    """
+    fields = np.full((len(values), 5), np.nan)
+    for i, value in enumerate(values):
+        match = _DATE_RANGE_REGEX.match(value)
+        if match is None:
+            continue
+        start_month, start_day, end_month, end_day, year = match.groups()
+        fields[i] = (
+            _month_number(start_month),
+            int(start_day),
+            _month_number(end_month or start_month),
+            int(end_day or start_day),
+            int(year),
+        )
+    start_month, start_day, end_month, end_day, year = fields.T
+
+    year = np.where(year >= 100, year, year + 2000)
+    # A range like "Dec 29 - January 2, 2022" starts in the previous year
+    start_year = year - (start_month > end_month)
+
+    return (
+        _to_days(start_year, start_month, start_day).astype("datetime64[ns]"),
+        _to_days(year, end_month, end_day).astype("datetime64[ns]"),
+    )
+
+
+def parse_date_ranges(dates):
+    """
+    Parse a Series of tournament date strings into start and end dates.
+
+    All formats found in tournament_info.csv are handled by a single regex:
+    ranges within one month, ranges across months with an abbreviated or full
+    start month, ranges across a year end, and single days.
+    Only the distinct strings are looked at: each is parsed once and remembered
+    (up to _DATE_RANGE_CACHE_SIZE strings), and the rows take their dates from
+    the distinct values by position, so repeated calls (and the many repeated
+    strings in season files) only parse new values.
+
+    Args:
+        dates (pd.Series): Date strings such as "August 22 - 25, 2024".
+
+    Returns:
+        pd.DataFrame: A frame with the same index as dates and datetime64 columns
+        "Start Date" and "End Date". Unparseable strings give NaT.
+
+    Examples:
+        >>> corpus = pd.Series([
+        ...     "August 22 - 25, 2024",
+        ...     "Aug 29 - September 1, 2024",
+        ...     "Nov 30 - December 3, 2023",
+        ...     "Feb 29 - March 3, 2024",
+        ...     "Sep 30 - October 3, 2021",
+        ...     "Dec 29 - January 2, 2022",
+        ...     "July 4, 2024",
+        ...     "Not found",
+        ... ])
+        >>> parse_date_ranges(corpus)
+          Start Date   End Date
+        0 2024-08-22 2024-08-25
+        1 2024-08-29 2024-09-01
+        2 2023-11-30 2023-12-03
+        3 2024-02-29 2024-03-03
+        4 2021-09-30 2021-10-03
+        5 2021-12-29 2022-01-02
+        6 2024-07-04 2024-07-04
+        7        NaT        NaT
+    """
+    dates = pd.Series(dates)
+    codes, uniques = pd.factorize(dates)
+    keys = [str(value) for value in uniques]
+
+    # One extra slot holds NaT for missing values, which factorize codes as -1
+    starts = np.full(len(keys) + 1, np.datetime64("NaT"), dtype="datetime64[ns]")
+    ends = starts.copy()
+    new = []
+    for i, key in enumerate(keys):
+        cached = _DATE_RANGE_CACHE.get(key)
+        if cached is None:
+            new.append(i)
+        else:
+            starts[i], ends[i] = cached
+
+    if new:
+        new_starts, new_ends = _parse_new_date_ranges([keys[i] for i in new])
+        starts[new] = new_starts
+        ends[new] = new_ends
+        _remember_date_ranges(
+            {
+                keys[i]: (start, end)
+                for i, start, end in zip(new, new_starts, new_ends, strict=True)
+            }
+        )
+
+    return pd.DataFrame(
+        {"Start Date": starts[codes], "End Date": ends[codes]}, index=dates.index
+    )
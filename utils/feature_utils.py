@@ -0,0 +1,133 @@
+# utils/feature_utils.py
+
+from typing import Optional
+
+import pandas as pd
+
+from .catalog_utils import load_tournament_catalog
+from .form_utils import FORM_METRICS, add_form_columns, compute_event_metrics
+from .store_utils import DERIVED_DIR, read_table, table_exists, write_table
+
+COURSE_COLUMNS = ["Season", "Location", "Par", "Yards"]
+
+TRAILING_COLUMNS = ["EVENTS BEFORE"] + [f"{metric} TRAILING" for metric in FORM_METRICS]
+
+
+def compute_course_fit_features(
+    events: pd.DataFrame, catalog: pd.DataFrame, window: int = 8
+) -> pd.DataFrame:
+    """
+    Join course attributes with each player's stat profile going into an event.
+
+    The trailing profile of a (player, tournament) row is the player's form over
+    their previous `window` events, so it only uses information available
+    before the tournament started. Course attributes are joined from the
+    catalog with a hash join on the tournament ID.
+
+    Args:
+        events (pd.DataFrame): Per-event metrics from compute_event_metrics,
+            sorted by player and event.
+        catalog (pd.DataFrame): The tournament catalog.
+        window (int, optional): Number of events in the trailing window.
+            Defaults to 8.
+
+    Returns:
+        pd.DataFrame: One row per player and tournament with "PLAYER_ID",
+        "TOURNAMENT_ID", "End Date", the event's "SCORE VS FIELD", the
+        TRAILING_COLUMNS, the COURSE_COLUMNS and "WINDOW".
+    """
+    form = add_form_columns(events, window)
+    form_columns = ["EVENTS IN WINDOW"] + [f"{metric} FORM" for metric in FORM_METRICS]
+
+    # The form after a player's previous event is their profile going into this one
+    trailing = form.groupby("PLAYER_ID")[form_columns].shift(1)
+    trailing.columns = TRAILING_COLUMNS
+    trailing["EVENTS BEFORE"] = trailing["EVENTS BEFORE"].fillna(0).astype("int64")
+
+    features = pd.concat(
+        [
+            events[["PLAYER_ID", "TOURNAMENT_ID", "End Date", "SCORE VS FIELD"]],
+            trailing,
+        ],
+        axis=1,
+    )
+    course = catalog[COURSE_COLUMNS].rename_axis("TOURNAMENT_ID").reset_index()
+    features = features.merge(course, on="TOURNAMENT_ID", how="left", validate="m:1")
+    features["WINDOW"] = window
+    return features
+
+
+def refresh_course_fit_features(
+    stats: Optional[pd.DataFrame] = None,
+    catalog: Optional[pd.DataFrame] = None,
+    window: int = 8,
+    derived_dir: str = DERIVED_DIR,
+    force: bool = False,
+) -> pd.DataFrame:
+    """
+    Materialize the "course_fit_features" table, adding only new tournaments.
+
+    Tournaments already in the stored table are kept as they are. For the
+    players of new tournaments, rows from the earliest new tournament onward
+    are recomputed, since a new event also moves their later trailing windows;
+    only the tournaments those players played in are read. The whole table is
+    rebuilt if it was built with a different window.
+
+    Args:
+        stats (pd.DataFrame, optional): Player stats facts. Defaults to the
+            "player_stats_facts" table built by build_player_index.
+        catalog (pd.DataFrame, optional): The tournament catalog. Defaults to
+            load_tournament_catalog().
+        window (int, optional): Number of events in the trailing window.
+            Defaults to 8.
+        derived_dir (str, optional): Directory holding derived tables.
+        force (bool, optional): Rebuild the whole table. Defaults to False.
+
+    Returns:
+        pd.DataFrame: The full course fit feature table.
+    """
+    if stats is None:
+        stats = read_table("player_stats_facts", derived_dir)
+    if catalog is None:
+        catalog = load_tournament_catalog()
+
+    stored = None
+    if not force and table_exists("course_fit_features", derived_dir):
+        stored = read_table("course_fit_features", derived_dir)
+        if "WINDOW" not in stored or not stored["WINDOW"].eq(window).all():
+            print(
+                f"Course fit features were built with another window, rebuilding for {window}"
+            )
+            stored = None
+
+    if stored is None:
+        features = compute_course_fit_features(
+            compute_event_metrics(stats, catalog), catalog, window
+        )
+        write_table(features, "course_fit_features", derived_dir)
+        return features
+
+    dated = catalog.index[catalog["End Date"].notna()]
+    new_ids = stats["TOURNAMENT_ID"].isin(dated) & ~stats["TOURNAMENT_ID"].isin(
+        stored["TOURNAMENT_ID"].unique()
+    )
+    print(f"Adding {stats.loc[new_ids, 'TOURNAMENT_ID'].nunique()} new tournaments")
+    if not new_ids.any():
+        return stored
+
+    # SCORE VS FIELD needs the whole field, so every row of the tournaments
+    # the affected players played in is read
+    players = stats.loc[new_ids, "PLAYER_ID"].dropna().unique()
+    played = stats.loc[stats["PLAYER_ID"].isin(players), "TOURNAMENT_ID"].unique()
+    events = compute_event_metrics(stats[stats["TOURNAMENT_ID"].isin(played)], catalog)
+    events = events[events["PLAYER_ID"].isin(players)].reset_index(drop=True)
+    first_date = catalog["End Date"].reindex(stats.loc[new_ids, "TOURNAMENT_ID"]).min()
+
+    recomputed = compute_course_fit_features(events, catalog, window)
+    recomputed = recomputed[recomputed["End Date"] >= first_date]
+
+    is_stale = stored["PLAYER_ID"].isin(players) & (stored["End Date"] >= first_date)
+    features = pd.concat([stored[~is_stale], recomputed], ignore_index=True)
+    features = features.sort_values(["PLAYER_ID", "End Date"], ignore_index=True)
+    write_table(features, "course_fit_features", derived_dir)
+    return features
@@ -0,0 +1,280 @@
+# utils/form_utils.py
+
+from typing import Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .catalog_utils import load_tournament_catalog
+from .store_utils import DERIVED_DIR, read_table, table_exists, write_table
+
+FORM_METRICS: List[str] = ["SCORE VS FIELD", "GIR", "DRV ACC", "YDS/DRV", "PP GIR"]
+
+
+def add_event_order(stats: pd.DataFrame, catalog: pd.DataFrame) -> pd.DataFrame:
+    """
+    Attach each tournament's "End Date" and chronological "EVENT_INDEX".
+
+    Rows for tournaments without a known end date are dropped.
+
+    Args:
+        stats (pd.DataFrame): Player stats facts with a "TOURNAMENT_ID" column.
+        catalog (pd.DataFrame): The tournament catalog.
+
+    Returns:
+        pd.DataFrame: The dated rows with "End Date" and "EVENT_INDEX" columns.
+    """
+    dated = catalog["End Date"].dropna()
+    order = pd.Series(np.arange(len(dated)), index=dated.index)
+
+    stats = stats.assign(
+        **{
+            "End Date": stats["TOURNAMENT_ID"].map(dated),
+            "EVENT_INDEX": stats["TOURNAMENT_ID"].map(order),
+        }
+    )
+    stats = stats.dropna(subset=["EVENT_INDEX"])
+    return stats.astype({"EVENT_INDEX": "int64"})
+
+
+def add_score_vs_field(stats: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add "SCORE VS FIELD": the player's score to par minus the tournament mean.
+
+    Negative values are better than the field. The field is every player in the
+    tournament's player stats table.
+    """
+    field_mean = stats.groupby("TOURNAMENT_ID")["SCORE"].transform("mean")
+    return stats.assign(**{"SCORE VS FIELD": stats["SCORE"] - field_mean})
+
+
+def _rolling_group_means(
+    group_ids: np.ndarray, values: np.ndarray, window: int
+) -> tuple:
+    """
+    Mean of the last `window` rows within each group, for every row.
+
+    Rows must be sorted by group and then chronologically. NaN values are
+    skipped. Computed from cumulative sums, so there is no per-group loop.
+
+    Returns:
+        tuple: (means with the same shape as values, number of events in each
+        row's window).
+    """
+    n = len(group_ids)
+    positions = np.arange(n)
+
+    # Index of the first row of each row's group
+    is_start = np.ones(n, dtype=bool)
+    is_start[1:] = group_ids[1:] != group_ids[:-1]
+    group_start = np.maximum.accumulate(np.where(is_start, positions, 0))
+
+    window_start = np.maximum(group_start, positions - window + 1)
+
+    valid = ~np.isnan(values)
+    sums = np.vstack(
+        [np.zeros(values.shape[1]), np.cumsum(np.where(valid, values, 0), 0)]
+    )
+    counts = np.vstack([np.zeros(values.shape[1]), np.cumsum(valid, 0)])
+
+    window_sums = sums[positions + 1] - sums[window_start]
+    window_counts = counts[positions + 1] - counts[window_start]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = np.where(window_counts > 0, window_sums / window_counts, np.nan)
+
+    return means, positions - window_start + 1
+
+
+def compute_event_metrics(stats: pd.DataFrame, catalog: pd.DataFrame) -> pd.DataFrame:
+    """
+    Return the per-event form metrics of every player, in chronological order.
+
+    Args:
+        stats (pd.DataFrame): Player stats facts with "PLAYER_ID",
+            "TOURNAMENT_ID", "SCORE" and the stat columns. Must hold the whole
+            field of each tournament, since SCORE VS FIELD uses the field mean.
+        catalog (pd.DataFrame): The tournament catalog.
+
+    Returns:
+        pd.DataFrame: "PLAYER_ID", "TOURNAMENT_ID", "End Date", "EVENT_INDEX"
+        and the FORM_METRICS columns, sorted by player and event.
+    """
+    stats = add_score_vs_field(add_event_order(stats, catalog))
+    stats = stats.dropna(subset=["PLAYER_ID"])
+    stats = stats.sort_values(["PLAYER_ID", "EVENT_INDEX"], ignore_index=True)
+    return stats[
+        ["PLAYER_ID", "TOURNAMENT_ID", "End Date", "EVENT_INDEX"] + FORM_METRICS
+    ]
+
+
+def add_form_columns(events: pd.DataFrame, window: int = 8) -> pd.DataFrame:
+    """
+    Add rolling form columns to per-event metrics sorted by player and event.
+
+    For every row, "<metric> FORM" is the mean of the metric over that event and
+    the player's previous window - 1 events, "EVENTS IN WINDOW" is the number
+    of events the window covers and "WINDOW" is window.
+    """
+    values = events[FORM_METRICS].to_numpy(dtype=float)
+    means, counts = _rolling_group_means(events["PLAYER_ID"].to_numpy(), values, window)
+
+    form = events.copy()
+    form["EVENTS IN WINDOW"] = counts
+    form["WINDOW"] = window
+    form[[f"{metric} FORM" for metric in FORM_METRICS]] = means
+    return form
+
+
+def compute_player_form(
+    stats: pd.DataFrame, catalog: pd.DataFrame, window: int = 8
+) -> pd.DataFrame:
+    """
+    Compute rolling form over each player's last `window` events.
+
+    Args:
+        stats (pd.DataFrame): Player stats facts with "PLAYER_ID",
+            "TOURNAMENT_ID", "SCORE" and the stat columns.
+        catalog (pd.DataFrame): The tournament catalog, used for End Date order.
+        window (int, optional): Number of events in the window. Defaults to 8.
+
+    Returns:
+        pd.DataFrame: One row per player and tournament with the per-event
+        metrics (SCORE VS FIELD, GIR, DRV ACC, YDS/DRV, PP GIR),
+        "EVENTS IN WINDOW", "WINDOW" and a "<metric> FORM" column per metric.
+    """
+    return add_form_columns(compute_event_metrics(stats, catalog), window)
+
+
+def build_player_form(
+    window: int = 8,
+    stats: Optional[pd.DataFrame] = None,
+    catalog: Optional[pd.DataFrame] = None,
+    derived_dir: str = DERIVED_DIR,
+) -> pd.DataFrame:
+    """
+    Compute player form for every tournament and save it as "player_form".
+
+    Args:
+        window (int, optional): Number of events in the window. Defaults to 8.
+        stats (pd.DataFrame, optional): Player stats facts. Defaults to the
+            "player_stats_facts" table built by build_player_index.
+        catalog (pd.DataFrame, optional): The tournament catalog. Defaults to
+            load_tournament_catalog().
+        derived_dir (str, optional): Directory holding derived tables.
+
+    Returns:
+        pd.DataFrame: The player form table.
+    """
+    if stats is None:
+        stats = read_table("player_stats_facts", derived_dir)
+    if catalog is None:
+        catalog = load_tournament_catalog()
+
+    form = compute_player_form(stats, catalog, window)
+    write_table(form, "player_form", derived_dir)
+    return form
+
+
+def update_player_form(
+    form: pd.DataFrame,
+    new_stats: pd.DataFrame,
+    catalog: pd.DataFrame,
+    window: int = 8,
+) -> pd.DataFrame:
+    """
+    Update a player form table after a tournament has been added.
+
+    Only the players in the new tournament are affected, and only their windows
+    from the new event onward change. Their earlier per-event metrics are taken
+    from the existing table, so no other tournament is reread or recomputed.
+
+    Args:
+        form (pd.DataFrame): The current player form table.
+        new_stats (pd.DataFrame): Player stats facts of the new tournament.
+        catalog (pd.DataFrame): The tournament catalog, including the new
+            tournament's end date.
+        window (int, optional): Number of events in the window. Defaults to 8.
+
+    Returns:
+        pd.DataFrame: The updated player form table.
+    """
+    new_events = compute_event_metrics(new_stats, catalog)
+    players = new_events["PLAYER_ID"].unique()
+    first_event = new_events["EVENT_INDEX"].min()
+
+    columns = form.columns
+
+    # Event indexes shift if the new tournament is not the latest one
+    form = form[~form["TOURNAMENT_ID"].isin(new_events["TOURNAMENT_ID"].unique())]
+    form = add_event_order(form.drop(columns=["End Date", "EVENT_INDEX"]), catalog)
+
+    is_affected = form["PLAYER_ID"].isin(players)
+    affected = pd.concat(
+        [form.loc[is_affected, new_events.columns], new_events], ignore_index=True
+    )
+    affected = add_form_columns(
+        affected.sort_values(["PLAYER_ID", "EVENT_INDEX"], ignore_index=True), window
+    )
+    affected = affected[affected["EVENT_INDEX"] >= first_event]
+
+    unchanged = form[~(is_affected & (form["EVENT_INDEX"] >= first_event))]
+    form = pd.concat([unchanged, affected[unchanged.columns]], ignore_index=True)
+    return form.sort_values(["PLAYER_ID", "EVENT_INDEX"], ignore_index=True)[columns]
+
+
+def refresh_player_form(
+    tournament_ids: Optional[Iterable] = None,
+    window: int = 8,
+    stats: Optional[pd.DataFrame] = None,
+    catalog: Optional[pd.DataFrame] = None,
+    derived_dir: str = DERIVED_DIR,
+) -> pd.DataFrame:
+    """
+    Update the stored "player_form" table after tournaments were added.
+
+    Only the windows of the players in those tournaments change, from the
+    tournaments onward (see update_player_form). If the table does not exist
+    yet or was built with a different window, every row is built.
+
+    Args:
+        tournament_ids (Iterable, optional): IDs of the added or rescraped
+            tournaments. Defaults to the dated tournaments in the player stats
+            facts that are not in the table yet.
+        window (int, optional): Number of events in the window. Defaults to 8.
+        stats (pd.DataFrame, optional): Player stats facts. Defaults to the
+            "player_stats_facts" table built by build_player_index.
+        catalog (pd.DataFrame, optional): The tournament catalog. Defaults to
+            load_tournament_catalog().
+        derived_dir (str, optional): Directory holding derived tables.
+
+    Returns:
+        pd.DataFrame: The full player form table.
+    """
+    if stats is None:
+        stats = read_table("player_stats_facts", derived_dir)
+    if catalog is None:
+        catalog = load_tournament_catalog()
+
+    if not table_exists("player_form", derived_dir):
+        return build_player_form(window, stats, catalog, derived_dir)
+    form = read_table("player_form", derived_dir)
+    if "WINDOW" not in form or not form["WINDOW"].eq(window).all():
+        print(f"Player form was built with another window, rebuilding for {window}")
+        return build_player_form(window, stats, catalog, derived_dir)
+
+    if tournament_ids is None:
+        dated = catalog.index[catalog["End Date"].notna()]
+        tournament_ids = set(stats["TOURNAMENT_ID"]) - set(form["TOURNAMENT_ID"])
+        tournament_ids &= set(dated)
+    tournament_ids = [int(tid) for tid in tournament_ids]
+    new_stats = stats[stats["TOURNAMENT_ID"].isin(tournament_ids)]
+    if new_stats.empty:
+        print("Player form is up to date")
+        return form
+
+    print(
+        f"Updating player form for {new_stats['TOURNAMENT_ID'].nunique()} tournaments"
+    )
+    form = update_player_form(form, new_stats, catalog, window)
+    write_table(form, "player_form", derived_dir)
+    return form
@@ -0,0 +1,287 @@
+# utils/pipeline_utils.py
+
+import glob
+import io
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, List, Optional, Tuple
+
+from .store_utils import DERIVED_DIR, files_fingerprint
+
+PIPELINE_STATE_FILE = os.path.join(DERIVED_DIR, "pipeline_state.json")
+
+# Key of stages that are not run per tournament
+GLOBAL_KEY = "*"
+
+
+def expand_paths(patterns: List[str]) -> List[str]:
+    """
+    Expand glob patterns, keeping plain paths even if they do not exist yet.
+    """
+    paths = []
+    for pattern in patterns:
+        if glob.has_magic(pattern):
+            paths.extend(sorted(glob.glob(pattern)))
+        else:
+            paths.append(pattern)
+    return paths
+
+
+def _outputs_exist(stage: Dict) -> bool:
+    return all(
+        glob.glob(pattern) if glob.has_magic(pattern) else os.path.exists(pattern)
+        for pattern in stage.get("outputs", [])
+    )
+
+
+def load_pipeline_state(state_file: str = PIPELINE_STATE_FILE) -> Dict:
+    """
+    Return the input fingerprints recorded per stage and key at the last run.
+    """
+    if not os.path.exists(state_file):
+        return {}
+    with open(state_file) as f:
+        return json.load(f)
+
+
+def _save_pipeline_state(state: Dict, state_file: str):
+    os.makedirs(os.path.dirname(state_file) or ".", exist_ok=True)
+    tmp_path = f"{state_file}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, state_file)
+
+
+def stale_keys(
+    stage: Dict, state: Dict, force: bool = False
+) -> Tuple[Dict[str, str], List[str]]:
+    """
+    Work out which keys of a stage have to run.
+
+    A key (a tournament ID, or GLOBAL_KEY for stages that run as a whole) is
+    stale if its outputs are missing, or if its input fingerprint differs from
+    the one recorded when it last ran. Keys with outputs but no recorded
+    fingerprint, i.e. data produced before the pipeline ran, are up to date.
+
+    Args:
+        stage (dict): The stage, see run_pipeline.
+        state (dict): Recorded fingerprints, as returned by load_pipeline_state.
+        force (bool, optional): Treat every key as stale. Defaults to False.
+
+    Returns:
+        tuple: The current fingerprint of every key, and the stale keys.
+    """
+    if "fingerprints" in stage:
+        fingerprints = {str(k): str(v) for k, v in stage["fingerprints"]().items()}
+    else:
+        inputs = expand_paths(stage.get("inputs", []))
+        fingerprints = {GLOBAL_KEY: files_fingerprint(inputs)}
+
+    if "done" in stage:
+        done = {str(key) for key in stage["done"](list(fingerprints))}
+    else:
+        done = set(fingerprints) if _outputs_exist(stage) else set()
+
+    recorded = state.get(stage["name"], {})
+    stale = [
+        key
+        for key, fingerprint in fingerprints.items()
+        if force or key not in done or recorded.get(key, fingerprint) != fingerprint
+    ]
+    return fingerprints, stale
+
+
+class _StageOutput(io.TextIOBase):
+    """
+    Stand-in for sys.stdout while stages run concurrently.
+
+    Output of a thread running a stage is written line by line, each line
+    prefixed with the stage name, so lines of concurrent stages do not run
+    into each other. Other threads write through unchanged.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.lock = threading.Lock()
+        self.local = threading.local()
+
+    def start(self, name: str):
+        self.local.prefix = f"[{name}] "
+        self.local.pending = ""
+
+    def finish(self):
+        if getattr(self.local, "pending", ""):
+            self.write("\n")
+        self.local.prefix = None
+
+    def write(self, text: str) -> int:
+        prefix = getattr(self.local, "prefix", None)
+        if prefix is None:
+            with self.lock:
+                self.stream.write(text)
+            return len(text)
+        *lines, self.local.pending = (self.local.pending + text).split("\n")
+        if lines:
+            with self.lock:
+                self.stream.write("".join(f"{prefix}{line}\n" for line in lines))
+        return len(text)
+
+    def flush(self):
+        self.stream.flush()
+
+
+def _topological_order(stages: Dict[str, Dict]) -> List[str]:
+    order, visiting = [], set()
+
+    def visit(name, path):
+        if name in order:
+            return
+        if name in visiting:
+            raise ValueError(f"Stage dependencies form a cycle: {' -> '.join(path)}")
+        if name not in stages:
+            raise ValueError(f"Unknown stage: {name}")
+        visiting.add(name)
+        for dependency in stages[name].get("after", []):
+            visit(dependency, path + [dependency])
+        visiting.discard(name)
+        order.append(name)
+
+    for name in stages:
+        visit(name, [name])
+    return order
+
+
+def run_pipeline(
+    stages: List[Dict],
+    targets: Optional[List[str]] = None,
+    force: bool = False,
+    dry_run: bool = False,
+    max_workers: int = 4,
+    state_file: str = PIPELINE_STATE_FILE,
+) -> Dict[str, str]:
+    """
+    Run the stale parts of a DAG of stages, independent stages concurrently.
+
+    Each stage is a dict with:
+        "name": Unique stage name.
+        "after": Names of the stages it depends on.
+        "inputs", "outputs": Paths or glob patterns it reads and writes. Stages
+            without "fingerprints" are fingerprinted from their input files and
+            are stale when any output is missing.
+        "fingerprints" (optional): Callable returning {key: fingerprint}, e.g.
+            one fingerprint per tournament ID.
+        "done" (optional): Callable taking the keys and returning those whose
+            outputs exist.
+        "run": Callable taking the list of stale keys.
+
+    A stage starts as soon as all of its dependencies have finished, so its
+    fingerprints see their outputs. When a stage fails, the stages that depend
+    on it are skipped and its fingerprints are not recorded, so the next run
+    retries it.
+
+    Args:
+        stages (list): The stages.
+        targets (list, optional): Only run these stages and their dependencies.
+            Defaults to every stage.
+        force (bool, optional): Run every key of every selected stage.
+        dry_run (bool, optional): Only report what is stale. Stages downstream
+            of stale ones may show as up to date until those have run.
+        max_workers (int, optional): Stages run at the same time. Defaults to 4.
+        state_file (str, optional): Where fingerprints are recorded.
+            Defaults to "data/derived/pipeline_state.json".
+
+    Returns:
+        dict: The outcome of each stage: "up to date", "stale" (dry run),
+        "ran", "failed" or "skipped".
+
+    Raises:
+        ValueError: If a stage depends on an unknown stage or on itself.
+    """
+    by_name = {stage["name"]: stage for stage in stages}
+    order = _topological_order(by_name)
+    if targets:
+        selected, to_visit = set(), list(targets)
+        while to_visit:
+            name = to_visit.pop()
+            if name not in by_name:
+                raise ValueError(f"Unknown stage: {name}")
+            if name not in selected:
+                selected.add(name)
+                to_visit.extend(by_name[name].get("after", []))
+        order = [name for name in order if name in selected]
+
+    state = load_pipeline_state(state_file)
+    lock = threading.Lock()
+
+    def run_stage(stage):
+        output.start(stage["name"])
+        try:
+            return _run_stage(stage)
+        finally:
+            output.finish()
+
+    def _run_stage(stage):
+        name = stage["name"]
+        fingerprints, stale = stale_keys(stage, state, force)
+        if not stale:
+            print("up to date")
+            if not dry_run and state.get(name) != fingerprints:
+                with lock:
+                    state[name] = fingerprints
+                    _save_pipeline_state(state, state_file)
+            return "up to date"
+        keys = ""
+        if stale != [GLOBAL_KEY]:
+            keys = f" for {len(stale)} of {len(fingerprints)} keys"
+        if dry_run:
+            print(f"stale{keys}")
+            return "stale"
+
+        print(f"running{keys}")
+        start = time.perf_counter()
+        stage["run"](stale)
+        print(f"finished in {time.perf_counter() - start:.1f}s")
+
+        with lock:
+            state[name] = fingerprints
+            _save_pipeline_state(state, state_file)
+        return "ran"
+
+    results: Dict[str, str] = {}
+    pending = list(order)
+    running = {}
+    # Lines printed by the stages are prefixed with their name
+    output = _StageOutput(sys.stdout)
+    sys.stdout = output
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while pending or running:
+                for name in list(pending):
+                    dependencies = by_name[name].get("after", [])
+                    if any(
+                        results.get(d) in ("failed", "skipped") for d in dependencies
+                    ):
+                        print(f"[{name}] skipped, a dependency did not complete")
+                        results[name] = "skipped"
+                        pending.remove(name)
+                    elif all(d in results for d in dependencies):
+                        running[executor.submit(run_stage, by_name[name])] = name
+                        pending.remove(name)
+
+                if not running:
+                    continue
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    try:
+                        results[name] = future.result()
+                    except Exception as e:
+                        print(f"[{name}] failed: {e}")
+                        results[name] = "failed"
+    finally:
+        sys.stdout = output.stream
+    return results
@@ -0,0 +1,362 @@
+# utils/player_utils.py
+
+import numbers
+import os
+import re
+import unicodedata
+from typing import Dict, Iterable, Optional, Union
+
+import pandas as pd
+
+from .store_utils import DERIVED_DIR, read_table, write_table
+
+PLAYERS_FILE = os.path.join("data", "players.csv")
+LEADERBOARD_FILE = os.path.join("data", "leaderboards_data.csv")
+PLAYER_STATS_DIR = os.path.join("data", "player-stats")
+
+# Display-name variants that normalization alone cannot reconcile, mapped to the
+# canonical display name. Add entries here when ESPN spells a player two ways.
+PLAYER_ALIASES: Dict[str, str] = {}
+
+# Letters that do not decompose into an ASCII base letter under NFKD
+_NAME_TRANSLATION = str.maketrans(
+    {"ø": "o", "Ø": "O", "æ": "ae", "Æ": "AE", "ß": "ss", "ł": "l", "Ł": "L", "đ": "d"}
+)
+
+
+def normalize_player_name(name: str) -> str:
+    """
+    Reduce a player display name to a key that is shared by its spelling variants.
+
+    Accents are stripped, punctuation is removed and whitespace is collapsed, so
+    "Ludvig Åberg" and "Ludvig Aberg", or "Ted Potter Jr." and "Ted Potter, Jr.",
+    produce the same key.
+
+    Args:
+        name (str): The player name as it appears in the scraped data.
+
+    Returns:
+        str: The normalized name key.
+
+    Examples:
+        >>> normalize_player_name("Thorbjørn Olesen")
+        'thorbjorn olesen'
+        >>> normalize_player_name("Blaine Hale, Jr.")
+        'blaine hale jr'
+        >>> normalize_player_name("J.J. Spaun")
+        'jj spaun'
+    """
+    name = unicodedata.normalize("NFKD", str(name).translate(_NAME_TRANSLATION))
+    name = "".join(c for c in name if not unicodedata.combining(c))
+    name = re.sub(r"[.,'`]", "", name.lower())
+    name = re.sub(r"[\s-]+", " ", name)
+    return name.strip()
+
+
+def load_player_dimension(players_file: str = PLAYERS_FILE) -> pd.DataFrame:
+    """
+    Load the player dimension table.
+
+    Args:
+        players_file (str, optional): Path to the players CSV file.
+            Defaults to "data/players.csv".
+
+    Returns:
+        pd.DataFrame: One row per player with columns "Player ID", "Player name"
+        and "Name key". Empty if the file does not exist yet.
+    """
+    if not os.path.exists(players_file):
+        return pd.DataFrame(
+            {
+                "Player ID": pd.Series(dtype="int32"),
+                "Player name": pd.Series(dtype="object"),
+                "Name key": pd.Series(dtype="object"),
+            }
+        )
+
+    players = pd.read_csv(players_file, dtype={"Player ID": "int32"})
+    return players
+
+
+def update_player_dimension(
+    names: Iterable[str],
+    players_file: str = PLAYERS_FILE,
+    aliases: Optional[Dict[str, str]] = None,
+) -> pd.DataFrame:
+    """
+    Add any unseen player names to the player dimension and save it.
+
+    Existing players keep their IDs. New players are numbered after the current
+    maximum ID in order of first appearance, so IDs are stable as long as
+    players.csv is kept.
+
+    Args:
+        names (Iterable[str]): Player display names from the scraped data.
+        players_file (str, optional): Path to the players CSV file.
+            Defaults to "data/players.csv".
+        aliases (dict, optional): Mapping of display-name variants to canonical
+            names. Defaults to PLAYER_ALIASES.
+
+    Returns:
+        pd.DataFrame: The updated player dimension.
+    """
+    aliases = PLAYER_ALIASES if aliases is None else aliases
+    players = load_player_dimension(players_file)
+    known_keys = set(players["Name key"])
+    next_id = int(players["Player ID"].max()) + 1 if len(players) else 1
+
+    new_players = []
+    for name in pd.unique(pd.Series(list(names), dtype="object").dropna()):
+        canonical = aliases.get(name, name)
+        key = normalize_player_name(canonical)
+        if key in known_keys:
+            continue
+        new_players.append(
+            {"Player ID": next_id, "Player name": canonical, "Name key": key}
+        )
+        known_keys.add(key)
+        next_id += 1
+
+    if new_players:
+        players = pd.concat([players, pd.DataFrame(new_players)], ignore_index=True)
+        players["Player ID"] = players["Player ID"].astype("int32")
+        players.to_csv(players_file, index=False)
+        print(f"Added {len(new_players)} new players to {players_file}")
+
+    return players
+
+
+def assign_player_ids(
+    df: pd.DataFrame,
+    players: pd.DataFrame,
+    name_column: str = "PLAYER",
+    aliases: Optional[Dict[str, str]] = None,
+) -> pd.DataFrame:
+    """
+    Add a compact "PLAYER_ID" column to a table keyed by player display name.
+
+    Args:
+        df (pd.DataFrame): Table with a player name column.
+        players (pd.DataFrame): The player dimension.
+        name_column (str, optional): Column holding player names. Defaults to "PLAYER".
+        aliases (dict, optional): Mapping of display-name variants to canonical
+            names. Defaults to PLAYER_ALIASES.
+
+    Returns:
+        pd.DataFrame: A copy of df with "PLAYER_ID" inserted before the name column.
+        Names missing from the dimension get a null ID.
+    """
+    aliases = PLAYER_ALIASES if aliases is None else aliases
+    key_to_id = dict(zip(players["Name key"], players["Player ID"], strict=True))
+
+    # Normalize each distinct name once rather than once per row
+    names = df[name_column]
+    unique_names = pd.unique(names.dropna())
+    name_to_id = {
+        name: key_to_id.get(normalize_player_name(aliases.get(name, name)))
+        for name in unique_names
+    }
+
+    df = df.copy()
+    df.insert(
+        df.columns.get_loc(name_column),
+        "PLAYER_ID",
+        names.map(name_to_id).astype("Int32"),
+    )
+    return df
+
+
+def load_player_stats(player_stats_dir: str = PLAYER_STATS_DIR) -> pd.DataFrame:
+    """
+    Load every player_stats_*.csv file into a single long table.
+
+    Args:
+        player_stats_dir (str, optional): Directory holding the player stats files.
+            Defaults to "data/player-stats".
+
+    Returns:
+        pd.DataFrame: All player stats rows with "TOURNAMENT_ID" and "ROW" (the
+        row position within its source file) columns added and the numeric
+        "SCORE" relative to par.
+    """
+    dfs = []
+    for filename in sorted(os.listdir(player_stats_dir)):
+        match = re.fullmatch(r"player_stats_(\d+)\.csv", filename)
+        if not match:
+            continue
+        df = pd.read_csv(os.path.join(player_stats_dir, filename))
+        df = df.loc[:, ~df.columns.str.startswith("Unnamed:")]
+        df.insert(0, "TOURNAMENT_ID", int(match.group(1)))
+        df.insert(1, "ROW", range(len(df)))
+        dfs.append(df)
+
+    if not dfs:
+        raise FileNotFoundError(f"No player stats files found in {player_stats_dir}")
+
+    stats = pd.concat(dfs, ignore_index=True)
+    stats["SCORE"] = pd.to_numeric(
+        stats["SCORE"].astype(str).replace("E", "0"), errors="coerce"
+    )
+    return stats
+
+
+def build_player_index(
+    leaderboard_file: str = LEADERBOARD_FILE,
+    player_stats_dir: str = PLAYER_STATS_DIR,
+    players_file: str = PLAYERS_FILE,
+    derived_dir: str = DERIVED_DIR,
+) -> pd.DataFrame:
+    """
+    Build the player dimension, the player appearance index and the fact tables.
+
+    Every player name in the leaderboard and player stats data is resolved to a
+    stable integer ID. The appearance index records, for every player, the
+    tournaments and source rows they appear in, so history queries only read the
+    rows they need. The leaderboard and player stats are also written to the
+    store as fact tables keyed by "PLAYER_ID" instead of the display name.
+
+    Args:
+        leaderboard_file (str, optional): Path to the combined leaderboard CSV.
+        player_stats_dir (str, optional): Directory holding the player stats files.
+        players_file (str, optional): Path to the players CSV file.
+        derived_dir (str, optional): Directory holding derived tables.
+
+    Returns:
+        pd.DataFrame: The appearance index with columns "PLAYER_ID",
+        "TOURNAMENT_ID", "SOURCE", "FILE" and "ROW".
+    """
+    leaderboard = pd.read_csv(leaderboard_file)
+    leaderboard.insert(0, "ROW", range(len(leaderboard)))
+    stats = load_player_stats(player_stats_dir)
+
+    players = update_player_dimension(
+        pd.concat([leaderboard["PLAYER"], stats["PLAYER"]]), players_file
+    )
+    leaderboard = assign_player_ids(leaderboard, players)
+    stats = assign_player_ids(stats, players)
+
+    leaderboard_index = pd.DataFrame(
+        {
+            "PLAYER_ID": leaderboard["PLAYER_ID"],
+            "TOURNAMENT_ID": leaderboard["TOURNAMENT_ID"].astype("int64"),
+            "SOURCE": "leaderboard",
+            "FILE": leaderboard_file,
+            "ROW": leaderboard["ROW"],
+        }
+    )
+    stats_index = pd.DataFrame(
+        {
+            "PLAYER_ID": stats["PLAYER_ID"],
+            "TOURNAMENT_ID": stats["TOURNAMENT_ID"],
+            "SOURCE": "player_stats",
+            "FILE": [
+                os.path.join(player_stats_dir, f"player_stats_{tid}.csv")
+                for tid in stats["TOURNAMENT_ID"]
+            ],
+            "ROW": stats["ROW"],
+        }
+    )
+    index = pd.concat([leaderboard_index, stats_index], ignore_index=True)
+    index["SOURCE"] = index["SOURCE"].astype("category")
+    index["FILE"] = index["FILE"].astype("category")
+    index = index.sort_values(["PLAYER_ID", "TOURNAMENT_ID"], ignore_index=True)
+
+    write_table(index, "player_appearances", derived_dir)
+    write_table(
+        leaderboard.drop(columns=["ROW", "PLAYER"]), "leaderboard_facts", derived_dir
+    )
+    write_table(
+        stats.drop(columns=["ROW", "PLAYER"]), "player_stats_facts", derived_dir
+    )
+
+    print(f"Indexed {len(players)} players across {len(index)} appearances")
+    return index
+
+
+def resolve_player_id(
+    player: Union[int, str],
+    players: pd.DataFrame,
+    aliases: Optional[Dict[str, str]] = None,
+) -> Optional[int]:
+    """
+    Resolve a player ID or display name (in any known spelling) to a player ID.
+
+    Args:
+        player (Union[int, str]): A player ID or display name.
+        players (pd.DataFrame): The player dimension.
+        aliases (dict, optional): Mapping of display-name variants to canonical
+            names. Defaults to PLAYER_ALIASES.
+
+    Returns:
+        int: The player ID, or None if the player is unknown.
+    """
+    # Also matches NumPy integers, e.g. IDs taken from a DataFrame
+    if isinstance(player, numbers.Integral):
+        player = int(player)
+        return player if (players["Player ID"] == player).any() else None
+
+    aliases = PLAYER_ALIASES if aliases is None else aliases
+    key = normalize_player_name(aliases.get(player, player))
+    matches = players.loc[players["Name key"] == key, "Player ID"]
+    return int(matches.iloc[0]) if len(matches) else None
+
+
+def get_player_history(
+    player: Union[int, str],
+    source: str = "player_stats",
+    index: Optional[pd.DataFrame] = None,
+    players_file: str = PLAYERS_FILE,
+    derived_dir: str = DERIVED_DIR,
+) -> pd.DataFrame:
+    """
+    Return every row for one player from the leaderboard or player stats data.
+
+    The appearance index is used to open only the files the player appears in and
+    to read only their rows from each file.
+
+    Args:
+        player (Union[int, str]): A player ID or display name.
+        source (str, optional): "player_stats" or "leaderboard".
+            Defaults to "player_stats".
+        index (pd.DataFrame, optional): A preloaded appearance index. Defaults to
+            reading it from the store.
+        players_file (str, optional): Path to the players CSV file.
+        derived_dir (str, optional): Directory holding derived tables.
+
+    Returns:
+        pd.DataFrame: The player's rows with "TOURNAMENT_ID" and "PLAYER_ID" columns.
+
+    Raises:
+        ValueError: If the player or source is unknown.
+
+    Example:
+        >>> history = get_player_history("Tony Finau")
+        >>> history[["TOURNAMENT_ID", "POS", "GIR", "SCORE"]].head()
+    """
+    if source not in ("player_stats", "leaderboard"):
+        raise ValueError("Invalid source. Choose from: player_stats, leaderboard")
+
+    player_id = resolve_player_id(player, load_player_dimension(players_file))
+    if player_id is None:
+        raise ValueError(f"Unknown player: {player}")
+
+    if index is None:
+        index = read_table("player_appearances", derived_dir)
+    rows = index[(index["PLAYER_ID"] == player_id) & (index["SOURCE"] == source)]
+
+    dfs = []
+    for file_path, group in rows.groupby("FILE", observed=True):
+        wanted = {row + 1 for row in group["ROW"]}  # +1 for the header line
+        df = pd.read_csv(
+            file_path, skiprows=lambda i, wanted=wanted: i != 0 and i not in wanted
+        )
+        df = df.loc[:, ~df.columns.str.startswith("Unnamed:")]
+        if "TOURNAMENT_ID" not in df.columns:
+            # Player stats files hold a single tournament each
+            df.insert(0, "TOURNAMENT_ID", group["TOURNAMENT_ID"].iloc[0])
+        df.insert(1, "PLAYER_ID", player_id)
+        dfs.append(df)
+
+    if not dfs:
+        return pd.DataFrame(columns=["TOURNAMENT_ID", "PLAYER_ID"])
+    return pd.concat(dfs, ignore_index=True)
@@ -0,0 +1,376 @@
+# utils/queue_utils.py
+
+import json
+import os
+import socket
+import sqlite3
+import time
+from contextlib import closing
+from typing import Callable, Dict, Iterable, List, Optional
+from urllib.parse import urlsplit
+
+DEFAULT_QUEUE_URL = "sqlite:///data/scrape_queue.sqlite"
+
+# Kinds of scrape task a worker knows how to run
+TASK_KINDS = ["tournament_info", "leaderboard", "player_stats"]
+
+# Task states: pending -> claimed -> done -> collected, or failed after
+# max_attempts; claimed tasks whose lease expired are claimed again
+TASK_STATES = ["pending", "claimed", "done", "failed", "collected"]
+
+DEFAULT_LEASE_SECONDS = 600
+DEFAULT_MAX_ATTEMPTS = 3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    tournament_id TEXT NOT NULL,
+    priority INTEGER NOT NULL DEFAULT 0,
+    state TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker TEXT,
+    lease_until REAL,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    result TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS tasks_by_state ON tasks (state, priority, id);
+CREATE INDEX IF NOT EXISTS tasks_by_key ON tasks (kind, tournament_id, state);
+"""
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+# SQLite broker: one database file shared by every worker process. Writes that
+# must not interleave run in an IMMEDIATE transaction, which takes the write
+# lock up front. WAL mode needs shared memory between the processes, so every
+# worker must run on the host that has the file on a local disk; SQLite locking
+# is not reliable over a network filesystem. Workers on several hosts need a
+# backend added with register_queue_backend.
+
+
+def _sqlite_connect(path: str) -> sqlite3.Connection:
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    connection = sqlite3.connect(path, timeout=30, isolation_level=None)
+    connection.row_factory = sqlite3.Row
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.executescript(_SCHEMA)
+    return connection
+
+
+def _sqlite_enqueue(path: str, tasks: List[Dict]) -> int:
+    now = time.time()
+    added = 0
+    with closing(_sqlite_connect(path)) as connection:
+        connection.execute("BEGIN IMMEDIATE")
+        for task in tasks:
+            # A tournament is only queued once per kind until it is finished
+            queued = connection.execute(
+                "SELECT 1 FROM tasks WHERE kind = ? AND tournament_id = ? "
+                "AND state IN ('pending', 'claimed')",
+                (task["kind"], str(task["tournament_id"])),
+            ).fetchone()
+            if queued:
+                continue
+            connection.execute(
+                "INSERT INTO tasks (kind, tournament_id, priority, created_at, "
+                "updated_at) VALUES (?, ?, ?, ?, ?)",
+                (
+                    task["kind"],
+                    str(task["tournament_id"]),
+                    int(task.get("priority", 0)),
+                    now,
+                    now,
+                ),
+            )
+            added += 1
+        connection.execute("COMMIT")
+    return added
+
+
+def _sqlite_claim(
+    path: str,
+    worker: str,
+    lease_seconds: float,
+    kinds: Optional[List[str]],
+    max_attempts: int,
+) -> Optional[Dict]:
+    now = time.time()
+    kinds = kinds or TASK_KINDS
+    placeholders = ", ".join("?" * len(kinds))
+    with closing(_sqlite_connect(path)) as connection:
+        connection.execute("BEGIN IMMEDIATE")
+        # A task whose worker died on its last attempt is not retried again
+        connection.execute(
+            "UPDATE tasks SET state = 'failed', lease_until = NULL, updated_at = ?, "
+            "error = 'Lease expired on attempt ' || attempts || ' (' || worker || ')' "
+            "WHERE state = 'claimed' AND lease_until < ? AND attempts >= ?",
+            (now, now, max_attempts),
+        )
+        row = connection.execute(
+            "SELECT * FROM tasks WHERE kind IN (%s) AND (state = 'pending' OR "
+            "(state = 'claimed' AND lease_until < ?)) "
+            "ORDER BY priority DESC, id LIMIT 1" % placeholders,
+            (*kinds, now),
+        ).fetchone()
+        if row is None:
+            connection.execute("COMMIT")
+            return None
+        connection.execute(
+            "UPDATE tasks SET state = 'claimed', worker = ?, lease_until = ?, "
+            "attempts = attempts + 1, updated_at = ? WHERE id = ?",
+            (worker, now + lease_seconds, now, row["id"]),
+        )
+        connection.execute("COMMIT")
+    task = dict(row)
+    task.update(worker=worker, attempts=row["attempts"] + 1)
+    return task
+
+
+def _sqlite_complete(path: str, task_id: int, worker: str, result: str) -> bool:
+    with closing(_sqlite_connect(path)) as connection:
+        updated = connection.execute(
+            "UPDATE tasks SET state = 'done', result = ?, error = NULL, "
+            "lease_until = NULL, updated_at = ? "
+            "WHERE id = ? AND worker = ? AND state = 'claimed'",
+            (result, time.time(), task_id, worker),
+        ).rowcount
+    return updated == 1
+
+
+def _sqlite_fail(
+    path: str, task_id: int, worker: str, error: str, max_attempts: int
+) -> bool:
+    with closing(_sqlite_connect(path)) as connection:
+        updated = connection.execute(
+            "UPDATE tasks SET state = CASE WHEN attempts >= ? THEN 'failed' "
+            "ELSE 'pending' END, error = ?, lease_until = NULL, updated_at = ? "
+            "WHERE id = ? AND worker = ? AND state = 'claimed'",
+            (max_attempts, error, time.time(), task_id, worker),
+        ).rowcount
+    return updated == 1
+
+
+def _sqlite_status(path: str) -> Dict[str, Dict[str, int]]:
+    with closing(_sqlite_connect(path)) as connection:
+        rows = connection.execute(
+            "SELECT kind, state, COUNT(*) AS n FROM tasks GROUP BY kind, state"
+        ).fetchall()
+    status: Dict[str, Dict[str, int]] = {}
+    for row in rows:
+        status.setdefault(row["kind"], {})[row["state"]] = row["n"]
+    return status
+
+
+def _sqlite_collect(path: str, kind: str) -> List[Dict]:
+    with closing(_sqlite_connect(path)) as connection:
+        rows = connection.execute(
+            "SELECT * FROM tasks WHERE kind = ? AND state = 'done' ORDER BY id",
+            (kind,),
+        ).fetchall()
+    return [dict(row) for row in rows]
+
+
+def _sqlite_ack(path: str, task_ids: List[int]) -> int:
+    with closing(_sqlite_connect(path)) as connection:
+        connection.execute("BEGIN IMMEDIATE")
+        updated = connection.executemany(
+            "UPDATE tasks SET state = 'collected', result = NULL, updated_at = ? "
+            "WHERE id = ? AND state = 'done'",
+            [(time.time(), task_id) for task_id in task_ids],
+        ).rowcount
+        connection.execute("COMMIT")
+    return updated
+
+
+def _sqlite_failures(path: str) -> List[Dict]:
+    with closing(_sqlite_connect(path)) as connection:
+        rows = connection.execute(
+            "SELECT id, kind, tournament_id, attempts, worker, error FROM tasks "
+            "WHERE state = 'failed' ORDER BY id"
+        ).fetchall()
+    return [dict(row) for row in rows]
+
+
+# Queue backends by URL scheme. Each maps an operation to a function taking the
+# URL's location (for SQLite, the database path) followed by its arguments.
+QUEUE_BACKENDS: Dict[str, Dict[str, Callable]] = {
+    "sqlite": {
+        "enqueue": _sqlite_enqueue,
+        "claim": _sqlite_claim,
+        "complete": _sqlite_complete,
+        "fail": _sqlite_fail,
+        "status": _sqlite_status,
+        "collect": _sqlite_collect,
+        "ack": _sqlite_ack,
+        "failures": _sqlite_failures,
+    }
+}
+
+
+def register_queue_backend(scheme: str, operations: Dict[str, Callable]):
+    """
+    Make a queue backend available under a URL scheme, e.g. "redis".
+
+    Args:
+        scheme (str): The URL scheme of queues served by the backend.
+        operations (dict): The functions "enqueue", "claim", "complete", "fail",
+            "status", "collect", "ack" and "failures", with the same arguments
+            as the SQLite backend's.
+
+    Raises:
+        ValueError: If an operation is missing.
+    """
+    missing = set(QUEUE_BACKENDS["sqlite"]) - set(operations)
+    if missing:
+        raise ValueError(f"Queue backend is missing: {', '.join(sorted(missing))}")
+    QUEUE_BACKENDS[scheme] = operations
+
+
+def _backend(queue_url: str, operation: str):
+    """
+    Return the backend function for an operation and the queue's location.
+    """
+    parts = urlsplit(queue_url)
+    if parts.scheme not in QUEUE_BACKENDS:
+        raise ValueError(f"Unknown queue backend: {parts.scheme or queue_url}")
+    if parts.scheme == "sqlite":
+        # sqlite:///relative/path and sqlite:////absolute/path
+        location = parts.path[1:] if parts.path.startswith("/") else parts.path
+    else:
+        location = queue_url
+    return QUEUE_BACKENDS[parts.scheme][operation], location
+
+
+def enqueue_tasks(queue_url: str, tasks: Iterable[Dict]) -> int:
+    """
+    Add scrape tasks to the queue.
+
+    Args:
+        queue_url (str): The queue, e.g. "sqlite:///data/scrape_queue.sqlite".
+        tasks (Iterable[dict]): Tasks with "kind" (one of TASK_KINDS),
+            "tournament_id" and optionally "priority" (higher runs first).
+
+    Returns:
+        int: How many tasks were added. Tasks already pending or claimed for the
+        same kind and tournament are skipped.
+
+    Raises:
+        ValueError: If a task has an unknown kind.
+    """
+    tasks = list(tasks)
+    for task in tasks:
+        if task["kind"] not in TASK_KINDS:
+            raise ValueError(f"Unknown task kind: {task['kind']}")
+    function, location = _backend(queue_url, "enqueue")
+    return function(location, tasks)
+
+
+def claim_task(
+    queue_url: str,
+    worker: Optional[str] = None,
+    lease_seconds: float = DEFAULT_LEASE_SECONDS,
+    kinds: Optional[List[str]] = None,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+) -> Optional[Dict]:
+    """
+    Claim the highest priority pending task for a worker.
+
+    The claim is a lease: if the worker does not complete or fail the task
+    within lease_seconds, e.g. because its host died, another worker can claim
+    it, unless it has been attempted max_attempts times, in which case it is
+    marked failed.
+
+    Args:
+        queue_url (str): The queue.
+        worker (str, optional): Worker ID. Defaults to "<hostname>-<pid>".
+        lease_seconds (float, optional): How long the claim lasts.
+        kinds (list, optional): Only claim tasks of these kinds.
+        max_attempts (int, optional): Attempts before an expired task fails.
+
+    Returns:
+        dict: The task with "id", "kind", "tournament_id", "attempts" and
+        "worker", or None if no task is available.
+    """
+    function, location = _backend(queue_url, "claim")
+    return function(
+        location, worker or default_worker_id(), lease_seconds, kinds, max_attempts
+    )
+
+
+def complete_task(queue_url: str, task: Dict, result) -> bool:
+    """
+    Store a claimed task's result, which must be JSON serializable.
+
+    Returns:
+        bool: False if the worker's lease expired and the task was claimed by
+        another worker, in which case the result is discarded.
+    """
+    function, location = _backend(queue_url, "complete")
+    return function(location, task["id"], task["worker"], json.dumps(result))
+
+
+def fail_task(
+    queue_url: str, task: Dict, error: str, max_attempts: int = DEFAULT_MAX_ATTEMPTS
+) -> bool:
+    """
+    Record a claimed task's failure.
+
+    The task goes back to pending to be retried, unless it has been attempted
+    max_attempts times, in which case it is marked failed.
+
+    Returns:
+        bool: False if the worker no longer held the task.
+    """
+    function, location = _backend(queue_url, "fail")
+    return function(location, task["id"], task["worker"], error, max_attempts)
+
+
+def queue_status(queue_url: str) -> Dict[str, Dict[str, int]]:
+    """
+    Return the number of tasks per kind and state.
+    """
+    function, location = _backend(queue_url, "status")
+    return function(location)
+
+
+def collect_results(queue_url: str, kind: str) -> List[Dict]:
+    """
+    Return the results of every finished task of a kind.
+
+    The tasks stay finished until acknowledge_results is called for them, so
+    results are not lost if writing them out fails.
+
+    Returns:
+        list: The tasks with their decoded "result".
+    """
+    function, location = _backend(queue_url, "collect")
+    tasks = function(location, kind)
+    for task in tasks:
+        task["result"] = json.loads(task["result"])
+    return tasks
+
+
+def acknowledge_results(queue_url: str, tasks: Iterable[Dict]) -> int:
+    """
+    Mark collected tasks as "collected" once their results have been written.
+
+    Their results are dropped from the queue, so each result is collected once.
+
+    Returns:
+        int: How many tasks were marked.
+    """
+    function, location = _backend(queue_url, "ack")
+    return function(location, [task["id"] for task in tasks])
+
+
+def failed_tasks(queue_url: str) -> List[Dict]:
+    """
+    Return the tasks that failed max_attempts times, with their last "error".
+    """
+    function, location = _backend(queue_url, "failures")
+    return function(location)
@@ -0,0 +1,169 @@
+# utils/rating_utils.py
+
+import numpy as np
+import pandas as pd
+
+from .store_utils import DERIVED_DIR, read_table, table_exists, write_table
+
+INITIAL_RATING = 1500.0
+K_FACTOR = 32.0
+
+# Positions that mean a player did not finish; they tie below every finisher
+NON_FINISHES = ["CUT", "MC", "WD", "DQ", "MDF"]
+
+
+def parse_positions(positions: pd.Series) -> pd.Series:
+    """
+    Convert leaderboard positions like "1", "T4" or "CUT" to finishing ranks.
+
+    Players who did not finish share the rank after the last finisher.
+
+    Examples:
+        >>> parse_positions(pd.Series(["1", "T2", "T2", "CUT", "WD"])).tolist()
+        [1.0, 2.0, 2.0, 3.0, 3.0]
+    """
+    text = positions.astype(str).str.strip().str.upper()
+    ranks = pd.to_numeric(text.str.lstrip("T"), errors="coerce")
+    last = ranks.max() if ranks.notna().any() else 0
+    return ranks.where(~text.isin(NON_FINISHES) & ranks.notna(), last + 1)
+
+
+def elo_update(
+    ratings: np.ndarray, ranks: np.ndarray, k_factor: float = K_FACTOR
+) -> np.ndarray:
+    """
+    Rate one tournament as every pairwise result between its players.
+
+    Each pair scores 1 for the better finisher, 0 for the worse and 0.5 for a
+    tie. The whole field is updated at once from (n x n) score and expectation
+    matrices, and each player's change is scaled by n - 1 so a tournament is
+    worth one K-sized game.
+
+    Args:
+        ratings (np.ndarray): Ratings before the tournament.
+        ranks (np.ndarray): Finishing ranks (lower is better).
+        k_factor (float, optional): Elo K factor. Defaults to 32.
+
+    Returns:
+        np.ndarray: Ratings after the tournament.
+    """
+    n = len(ratings)
+    if n < 2:
+        return ratings.copy()
+
+    actual = (ranks[:, None] < ranks[None, :]) + 0.5 * (
+        ranks[:, None] == ranks[None, :]
+    )
+    expected = 1 / (1 + 10 ** ((ratings[None, :] - ratings[:, None]) / 400))
+
+    # The diagonal is 0.5 - 0.5 and drops out of the sum
+    return ratings + k_factor * (actual - expected).sum(axis=1) / (n - 1)
+
+
+def update_ratings(
+    results: pd.DataFrame,
+    catalog: pd.DataFrame,
+    k_factor: float = K_FACTOR,
+    derived_dir: str = DERIVED_DIR,
+    rebuild: bool = False,
+    history_table: str = "player_rating_history",
+) -> pd.DataFrame:
+    """
+    Process unrated tournaments in End Date order and checkpoint the ratings.
+
+    The history table holds every player's rating after every
+    rated tournament, so the ratings after any tournament can be restored. Only
+    tournaments not yet in the history are processed, starting from the latest
+    checkpoint, so adding a new event runs a single incremental step. If a new
+    tournament ends before the last rated one, or the history was rated with a
+    different K factor, it is replayed from the start so every rating uses the
+    same order and K factor.
+
+    Args:
+        results (pd.DataFrame): Results with "TOURNAMENT_ID", "PLAYER_ID" and
+            "POS" columns, e.g. the leaderboard facts.
+        catalog (pd.DataFrame): The tournament catalog, used for End Date order.
+        k_factor (float, optional): Elo K factor. Defaults to 32.
+        derived_dir (str, optional): Directory holding derived tables.
+        rebuild (bool, optional): Ignore checkpoints and replay every tournament.
+            Defaults to False.
+        history_table (str, optional): Name of the checkpoint table, so ratings
+            from different result sources are kept apart.
+
+    Returns:
+        pd.DataFrame: Current ratings with "PLAYER_ID", "RATING", "EVENTS" and
+        "LAST TOURNAMENT_ID", best first.
+    """
+    results = results.dropna(subset=["PLAYER_ID"])
+    results = results.assign(
+        TOURNAMENT_ID=results["TOURNAMENT_ID"].astype("int64"),
+        RANK=results.groupby("TOURNAMENT_ID")["POS"].transform(parse_positions),
+    )
+
+    end_dates = catalog["End Date"].reindex(results["TOURNAMENT_ID"].unique())
+    end_dates = end_dates.dropna().sort_values(kind="stable")
+
+    history = None
+    if not rebuild and table_exists(history_table, derived_dir):
+        history = read_table(history_table, derived_dir)
+        new = end_dates.index.difference(history["TOURNAMENT_ID"].unique())
+        if "K FACTOR" not in history or not history["K FACTOR"].eq(k_factor).all():
+            print(f"History was rated with another K factor; replaying with {k_factor}")
+            history = None
+        elif len(new) and end_dates[new].min() < history["End Date"].max():
+            print("New tournament predates the last checkpoint; replaying history")
+            history = None
+
+    if history is None:
+        history = pd.DataFrame(
+            {
+                "TOURNAMENT_ID": pd.Series(dtype="int64"),
+                "End Date": pd.Series(dtype="datetime64[ns]"),
+                "PLAYER_ID": pd.Series(dtype="int32"),
+                "RATING BEFORE": pd.Series(dtype="float64"),
+                "RATING": pd.Series(dtype="float64"),
+                "K FACTOR": pd.Series(dtype="float64"),
+            }
+        )
+
+    # Latest rating of every player as of the last checkpoint
+    latest = history.drop_duplicates("PLAYER_ID", keep="last")
+    ratings = dict(zip(latest["PLAYER_ID"], latest["RATING"], strict=True))
+
+    pending = end_dates[~end_dates.index.isin(history["TOURNAMENT_ID"].unique())]
+    print(f"Rating {len(pending)} new tournaments")
+
+    grouped = results.groupby("TOURNAMENT_ID")
+    checkpoints = [history]
+    for tournament_id, end_date in pending.items():
+        field = grouped.get_group(tournament_id)
+        player_ids = field["PLAYER_ID"].to_numpy(dtype=np.int32)
+        before = np.array([ratings.get(pid, INITIAL_RATING) for pid in player_ids])
+        after = elo_update(before, field["RANK"].to_numpy(dtype=float), k_factor)
+        ratings.update(zip(player_ids, after, strict=True))
+
+        checkpoints.append(
+            pd.DataFrame(
+                {
+                    "TOURNAMENT_ID": tournament_id,
+                    "End Date": end_date,
+                    "PLAYER_ID": player_ids,
+                    "RATING BEFORE": before,
+                    "RATING": after,
+                    "K FACTOR": float(k_factor),
+                }
+            )
+        )
+
+    history = pd.concat(checkpoints, ignore_index=True)
+    if len(pending):
+        write_table(history, history_table, derived_dir)
+
+    current = history.groupby("PLAYER_ID").agg(
+        **{
+            "RATING": ("RATING", "last"),
+            "EVENTS": ("TOURNAMENT_ID", "size"),
+            "LAST TOURNAMENT_ID": ("TOURNAMENT_ID", "last"),
+        }
+    )
+    return current.sort_values("RATING", ascending=False).reset_index()
@@ -0,0 +1,156 @@
+# utils/reparse_utils.py
+
+import contextlib
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from io import StringIO
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+from .archive_utils import ARCHIVE_DIR, load_archive_index, read_archived_page
+from .tournament_utils import (
+    clean_leaderboard_batch,
+    extract_tournament_id,
+    parse_leaderboard_html,
+)
+
+# Archive views the reparse knows how to extract
+REPARSE_VIEWS = ["page", "player-stats"]
+
+
+def _parse_archived_page(task: Tuple[str, str, str, str]):
+    """
+    Extract the raw table of one archived page; runs in a worker process.
+
+    Returns:
+        tuple: (view, tournament ID, raw DataFrame or None, error or None).
+    """
+    view, tournament_id, file, archive_dir = task
+    try:
+        # The parsers report every step; thousands of pages would flood the log
+        with contextlib.redirect_stdout(io.StringIO()):
+            html = read_archived_page(file, archive_dir)
+            if view == "page":
+                df = parse_leaderboard_html(html, tournament_id)
+            else:
+                # The main stats table is the last one, as in player-stats.py
+                df = pd.read_html(StringIO(html))[-1]
+    except Exception as e:
+        return view, tournament_id, None, str(e)
+    if df is None:
+        return view, tournament_id, None, "No leaderboard table found"
+    return view, tournament_id, df, None
+
+
+def reparse_archive(
+    archive_dir: str = ARCHIVE_DIR,
+    tournament_ids: Optional[Iterable] = None,
+    workers: Optional[int] = None,
+    chunksize: int = 8,
+) -> Dict:
+    """
+    Re-extract and clean the leaderboards and player stats of archived pages.
+
+    Every archived leaderboard page ("page" view) and Player Stats page
+    ("player-stats" view) is parsed across a process pool with the same
+    functions the scrapers use, then the leaderboards are cleaned together with
+    clean_leaderboard_batch. Nothing is fetched.
+
+    Args:
+        archive_dir (str, optional): The page archive. Defaults to "data/archive".
+        tournament_ids (Iterable, optional): Only reparse these tournaments.
+            Defaults to every archived tournament.
+        workers (int, optional): Worker processes. Defaults to the CPU count.
+        chunksize (int, optional): Pages sent to a worker at a time.
+
+    Returns:
+        dict: "leaderboard" (the cleaned leaderboards, or None if no leaderboard
+        page was archived), "extra_columns" (as returned by
+        clean_leaderboard_batch), "player_stats" (raw stats table per
+        tournament ID) and "failed" (a DataFrame of pages that could not be
+        parsed, with "view", "tournament_id" and "reason").
+    """
+    index = load_archive_index(archive_dir)
+    index = index[index["view"].isin(REPARSE_VIEWS)]
+    with contextlib.redirect_stdout(io.StringIO()):
+        index = index.assign(
+            tournament_id=index["key"].map(extract_tournament_id)
+        ).dropna(subset=["tournament_id"])
+    if tournament_ids is not None:
+        wanted = {str(tournament_id) for tournament_id in tournament_ids}
+        index = index[index["tournament_id"].isin(wanted)]
+
+    tasks = [
+        (row.view, row.tournament_id, row.file, archive_dir)
+        for row in index.itertuples(index=False)
+    ]
+    print(f"Reparsing {len(tasks)} archived pages from {archive_dir}")
+
+    raw_leaderboards: List[pd.DataFrame] = []
+    player_stats: Dict[str, pd.DataFrame] = {}
+    failed = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for view, tournament_id, df, error in executor.map(
+            _parse_archived_page, tasks, chunksize=chunksize
+        ):
+            if error:
+                failed.append(
+                    {"view": view, "tournament_id": tournament_id, "reason": error}
+                )
+            elif view == "page":
+                raw_leaderboards.append(df)
+            else:
+                player_stats[tournament_id] = df
+
+    leaderboard, extra_columns = None, []
+    if raw_leaderboards:
+        leaderboard, extra_columns = clean_leaderboard_batch(
+            pd.concat(raw_leaderboards, ignore_index=True)
+        )
+
+    print(
+        f"Parsed {len(raw_leaderboards)} leaderboards and {len(player_stats)} "
+        f"player stats tables ({len(failed)} failed)"
+    )
+    return {
+        "leaderboard": leaderboard,
+        "extra_columns": extra_columns,
+        "player_stats": player_stats,
+        "failed": pd.DataFrame(failed, columns=["view", "tournament_id", "reason"]),
+    }
+
+
+def merge_leaderboards(
+    existing: Optional[pd.DataFrame], reparsed: pd.DataFrame
+) -> pd.DataFrame:
+    """
+    Replace the rows of every reparsed tournament in an existing leaderboard.
+
+    Tournaments that were not reparsed keep their current rows, so a partial
+    archive never drops data.
+    """
+    if existing is None or existing.empty:
+        return reparsed
+    reparsed_ids = set(reparsed["TOURNAMENT_ID"].astype(str))
+    kept = existing[~existing["TOURNAMENT_ID"].astype(str).isin(reparsed_ids)]
+    return pd.concat([kept, reparsed], ignore_index=True)
+
+
+def write_player_stats(
+    player_stats: Dict[str, pd.DataFrame], player_stats_dir: str
+) -> List[str]:
+    """
+    Write each tournament's stats table as player_stats_<id>.csv.
+
+    Returns:
+        list: Paths of the files written.
+    """
+    os.makedirs(player_stats_dir, exist_ok=True)
+    paths = []
+    for tournament_id, stats_df in player_stats.items():
+        path = os.path.join(player_stats_dir, f"player_stats_{tournament_id}.csv")
+        stats_df.to_csv(path, index=False)
+        paths.append(path)
+    return paths
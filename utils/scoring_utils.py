@@ -0,0 +1,151 @@
+# utils/scoring_utils.py
+
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from .catalog_utils import load_tournament_catalog
+from .player_utils import LEADERBOARD_FILE, assign_player_ids, update_player_dimension
+from .store_utils import DERIVED_DIR, read_table, table_exists, write_table
+
+ROUND_COLUMNS = ["R1", "R2", "R3", "R4"]
+
+
+def tournament_fingerprints(
+    df: pd.DataFrame, tournament_column: str = "TOURNAMENT_ID"
+) -> pd.Series:
+    """
+    Hash the rows of each tournament into a single fingerprint.
+
+    Row hashes are summed per tournament, so the fingerprint does not depend on
+    row order but changes whenever any value of the tournament changes.
+
+    Args:
+        df (pd.DataFrame): A table with one or more rows per tournament.
+        tournament_column (str, optional): Column holding the tournament ID.
+            Defaults to "TOURNAMENT_ID".
+
+    Returns:
+        pd.Series: uint64 fingerprints indexed by tournament ID.
+    """
+    row_hashes = pd.util.hash_pandas_object(df, index=False)
+    with np.errstate(over="ignore"):
+        return row_hashes.groupby(df[tournament_column].to_numpy()).sum()
+
+
+def compute_round_scores_vs_field(
+    leaderboard: pd.DataFrame, catalog: Optional[pd.DataFrame] = None
+) -> pd.DataFrame:
+    """
+    Compute every player's strokes versus the field average for each round.
+
+    The leaderboard's R1-R4 columns are reshaped into one row per player and
+    round, and the field average of each (tournament, round) is computed in a
+    single grouped pass across all tournaments.
+
+    Args:
+        leaderboard (pd.DataFrame): Cleaned leaderboards with "TOURNAMENT_ID",
+            "PLAYER_ID", "PLAYER" and R1-R4 columns.
+        catalog (pd.DataFrame, optional): The tournament catalog. If given, the
+            course "PAR" is added along with strokes "TO PAR".
+
+    Returns:
+        pd.DataFrame: Long-format table with columns "TOURNAMENT_ID",
+        "PLAYER_ID", "PLAYER", "ROUND", "STROKES", "FIELD AVG", "FIELD SIZE" and
+        "VS FIELD" (negative is better than the field), plus "PAR" and "TO PAR"
+        when a catalog is given.
+    """
+    rounds = [col for col in ROUND_COLUMNS if col in leaderboard.columns]
+    long = leaderboard.melt(
+        id_vars=["TOURNAMENT_ID", "PLAYER_ID", "PLAYER"],
+        value_vars=rounds,
+        var_name="ROUND",
+        value_name="STROKES",
+    )
+    long["STROKES"] = pd.to_numeric(long["STROKES"], errors="coerce")
+    long = long.dropna(subset=["STROKES"])
+    long["TOURNAMENT_ID"] = long["TOURNAMENT_ID"].astype("int64")
+    long["ROUND"] = long["ROUND"].str[1:].astype("int8")
+
+    field = long.groupby(["TOURNAMENT_ID", "ROUND"])["STROKES"]
+    long["FIELD AVG"] = field.transform("mean")
+    long["FIELD SIZE"] = field.transform("size").astype("int32")
+    long["VS FIELD"] = long["STROKES"] - long["FIELD AVG"]
+
+    if catalog is not None:
+        long["PAR"] = long["TOURNAMENT_ID"].map(catalog["Par"])
+        long["TO PAR"] = long["STROKES"] - long["PAR"]
+
+    return long.sort_values(["TOURNAMENT_ID", "ROUND", "STROKES"], ignore_index=True)
+
+
+def refresh_round_scores_vs_field(
+    leaderboard_file: str = LEADERBOARD_FILE,
+    catalog: Optional[pd.DataFrame] = None,
+    derived_dir: str = DERIVED_DIR,
+    force: bool = False,
+) -> pd.DataFrame:
+    """
+    Materialize the round-versus-field table, recomputing only changed tournaments.
+
+    Each tournament's leaderboard rows are fingerprinted and compared with the
+    fingerprints stored at the last refresh. Only new or changed tournaments are
+    recomputed; tournaments no longer in the leaderboard are dropped.
+
+    Args:
+        leaderboard_file (str, optional): Path to the combined leaderboard CSV.
+        catalog (pd.DataFrame, optional): The tournament catalog. Defaults to
+            load_tournament_catalog().
+        derived_dir (str, optional): Directory holding derived tables.
+        force (bool, optional): Recompute every tournament. Defaults to False.
+
+    Returns:
+        pd.DataFrame: The full "round_scores_vs_field" table.
+    """
+    if catalog is None:
+        catalog = load_tournament_catalog()
+
+    leaderboard = pd.read_csv(leaderboard_file)
+    leaderboard["TOURNAMENT_ID"] = leaderboard["TOURNAMENT_ID"].astype("int64")
+    fingerprints = tournament_fingerprints(leaderboard)
+
+    stored = None
+    removed = pd.Index([])
+    unchanged = pd.Index([], dtype="int64")
+    if not force and table_exists("round_scores_vs_field", derived_dir):
+        stored = read_table("round_scores_vs_field", derived_dir)
+        stored_fingerprints = read_table(
+            "round_scores_fingerprints", derived_dir
+        ).set_index("TOURNAMENT_ID")["FINGERPRINT"]
+        unchanged = fingerprints.index[
+            fingerprints.eq(stored_fingerprints.reindex(fingerprints.index))
+        ]
+        removed = stored_fingerprints.index.difference(fingerprints.index)
+        stored = stored[stored["TOURNAMENT_ID"].isin(unchanged)]
+
+    changed = fingerprints.index.difference(unchanged)
+    print(
+        f"Recomputing {len(changed)} of {len(fingerprints)} tournaments "
+        f"({len(unchanged)} unchanged, {len(removed)} removed)"
+    )
+    if stored is not None and not len(changed) and not len(removed):
+        return stored
+
+    leaderboard = leaderboard[leaderboard["TOURNAMENT_ID"].isin(changed)]
+    players = update_player_dimension(leaderboard["PLAYER"])
+    recomputed = compute_round_scores_vs_field(
+        assign_player_ids(leaderboard, players), catalog
+    )
+    scores = pd.concat([stored, recomputed], ignore_index=True)
+    scores = scores.sort_values(
+        ["TOURNAMENT_ID", "ROUND", "STROKES"], ignore_index=True
+    )
+
+    write_table(scores, "round_scores_vs_field", derived_dir)
+    write_table(
+        fingerprints.rename("FINGERPRINT").rename_axis("TOURNAMENT_ID").reset_index(),
+        "round_scores_fingerprints",
+        derived_dir,
+    )
+    return scores
@@ -0,0 +1,242 @@
+# utils/season_utils.py
+
+from typing import Iterable, Optional, Tuple
+
+import pandas as pd
+
+from .catalog_utils import load_tournament_catalog
+from .player_utils import LEADERBOARD_FILE, assign_player_ids, update_player_dimension
+from .rating_utils import NON_FINISHES
+from .scoring_utils import ROUND_COLUMNS
+from .store_utils import DERIVED_DIR, read_table, table_exists, write_table
+
+SEASON_STATS = ["YDS/DRV", "DRV ACC", "GIR", "PP GIR"]
+
+SEASON_KEY = ["SEASON", "PLAYER_ID"]
+
+AGGREGATE_COLUMNS = [
+    "EVENTS",
+    "MADE CUTS",
+    "ROUNDS",
+    "SCORING AVG",
+    "EARNINGS",
+    "FEDEX PTS",
+] + SEASON_STATS
+
+
+def compute_season_aggregates(
+    leaderboard: pd.DataFrame, stats: pd.DataFrame, catalog: pd.DataFrame
+) -> pd.DataFrame:
+    """
+    Summarize every player's season from the leaderboard and player stats facts.
+
+    A player's events are the tournaments they appear in from either source.
+    Player stats only list players who made the cut, so an appearance there
+    counts as a made cut; on the leaderboard, positions like "CUT" or "WD" do
+    not.
+
+    Args:
+        leaderboard (pd.DataFrame): Leaderboard facts with "TOURNAMENT_ID",
+            "PLAYER_ID", "POS", R1-R4, "FEDEX PTS" and optionally "EARNINGS".
+        stats (pd.DataFrame): Player stats facts with "TOURNAMENT_ID",
+            "PLAYER_ID" and the SEASON_STATS columns.
+        catalog (pd.DataFrame): The tournament catalog, used for seasons.
+
+    Returns:
+        pd.DataFrame: One row per season and player with "SEASON", "PLAYER_ID",
+        "EVENTS", "MADE CUTS", "ROUNDS", "SCORING AVG", "EARNINGS", "FEDEX PTS"
+        and the season average of each SEASON_STATS column, sorted by the key.
+    """
+    leaderboard = leaderboard.dropna(subset=["PLAYER_ID"])
+    stats = stats.dropna(subset=["PLAYER_ID"])
+
+    positions = leaderboard["POS"].astype(str).str.strip().str.upper()
+    appearances = pd.concat(
+        [
+            pd.DataFrame(
+                {
+                    "TOURNAMENT_ID": leaderboard["TOURNAMENT_ID"],
+                    "PLAYER_ID": leaderboard["PLAYER_ID"],
+                    "MADE CUT": ~positions.isin(NON_FINISHES),
+                }
+            ),
+            pd.DataFrame(
+                {
+                    "TOURNAMENT_ID": stats["TOURNAMENT_ID"],
+                    "PLAYER_ID": stats["PLAYER_ID"],
+                    "MADE CUT": True,
+                }
+            ),
+        ],
+        ignore_index=True,
+    )
+    appearances = appearances.groupby(["TOURNAMENT_ID", "PLAYER_ID"], as_index=False)[
+        "MADE CUT"
+    ].max()
+    appearances["SEASON"] = appearances["TOURNAMENT_ID"].map(catalog["Season"])
+    events = appearances.groupby(SEASON_KEY).agg(
+        **{"EVENTS": ("TOURNAMENT_ID", "size"), "MADE CUTS": ("MADE CUT", "sum")}
+    )
+
+    rounds = leaderboard.melt(
+        id_vars=["TOURNAMENT_ID", "PLAYER_ID"],
+        value_vars=[col for col in ROUND_COLUMNS if col in leaderboard.columns],
+        value_name="STROKES",
+    )
+    rounds["STROKES"] = pd.to_numeric(rounds["STROKES"], errors="coerce")
+    rounds["SEASON"] = rounds["TOURNAMENT_ID"].map(catalog["Season"])
+    scoring = rounds.dropna(subset=["STROKES"]).groupby(SEASON_KEY)["STROKES"]
+
+    leaderboard = leaderboard.assign(
+        SEASON=leaderboard["TOURNAMENT_ID"].map(catalog["Season"])
+    )
+    money_columns = [col for col in ["EARNINGS", "FEDEX PTS"] if col in leaderboard]
+    money = leaderboard.groupby(SEASON_KEY)[money_columns].sum()
+
+    stats = stats.assign(SEASON=stats["TOURNAMENT_ID"].map(catalog["Season"]))
+    averages = stats.groupby(SEASON_KEY)[SEASON_STATS].mean()
+
+    aggregates = pd.concat(
+        [
+            events,
+            scoring.size().rename("ROUNDS"),
+            scoring.mean().rename("SCORING AVG"),
+            money,
+            averages,
+        ],
+        axis=1,
+    )
+    aggregates["ROUNDS"] = aggregates["ROUNDS"].fillna(0).astype("int64")
+    aggregates = aggregates.reindex(columns=AGGREGATE_COLUMNS)
+    aggregates[["EARNINGS", "FEDEX PTS"]] = aggregates[
+        ["EARNINGS", "FEDEX PTS"]
+    ].fillna(0)
+    aggregates = aggregates.reset_index().astype({"PLAYER_ID": "int32"})
+    return aggregates.sort_values(SEASON_KEY, ignore_index=True)
+
+
+def _load_sources(
+    leaderboard_file: str, derived_dir: str
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Read the leaderboard CSV with player IDs and the stored player stats facts.
+    """
+    leaderboard = pd.read_csv(leaderboard_file)
+    leaderboard["TOURNAMENT_ID"] = leaderboard["TOURNAMENT_ID"].astype("int64")
+    players = update_player_dimension(leaderboard["PLAYER"])
+    leaderboard = assign_player_ids(leaderboard, players)
+
+    if table_exists("player_stats_facts", derived_dir):
+        stats = read_table("player_stats_facts", derived_dir)
+    else:
+        stats = pd.DataFrame(columns=["TOURNAMENT_ID", "PLAYER_ID"] + SEASON_STATS)
+    return leaderboard, stats
+
+
+def refresh_season_aggregates(
+    tournament_ids: Optional[Iterable] = None,
+    leaderboard_file: str = LEADERBOARD_FILE,
+    catalog: Optional[pd.DataFrame] = None,
+    derived_dir: str = DERIVED_DIR,
+) -> pd.DataFrame:
+    """
+    Materialize the "season_aggregates" table after tournaments were added.
+
+    Only the rows of the seasons those tournaments belong to and the players
+    who appear in them are recomputed; every other row is kept as stored. If
+    the table does not exist yet or no tournament IDs are given, every row is
+    built.
+
+    Args:
+        tournament_ids (Iterable, optional): IDs of the added tournaments.
+        leaderboard_file (str, optional): Path to the combined leaderboard CSV.
+        catalog (pd.DataFrame, optional): The tournament catalog, including the
+            added tournaments. Defaults to load_tournament_catalog().
+        derived_dir (str, optional): Directory holding derived tables.
+
+    Returns:
+        pd.DataFrame: The full season aggregates table.
+    """
+    if catalog is None:
+        catalog = load_tournament_catalog()
+    leaderboard, stats = _load_sources(leaderboard_file, derived_dir)
+
+    if tournament_ids is None or not table_exists("season_aggregates", derived_dir):
+        aggregates = compute_season_aggregates(leaderboard, stats, catalog)
+        write_table(aggregates, "season_aggregates", derived_dir)
+        return aggregates
+
+    tournament_ids = [int(tid) for tid in tournament_ids]
+    seasons = catalog["Season"].reindex(tournament_ids).dropna().unique()
+    players = pd.concat(
+        [
+            leaderboard.loc[
+                leaderboard["TOURNAMENT_ID"].isin(tournament_ids), "PLAYER_ID"
+            ],
+            stats.loc[stats["TOURNAMENT_ID"].isin(tournament_ids), "PLAYER_ID"],
+        ]
+    ).dropna()
+
+    # Only source rows of the affected seasons and players are read
+    season_tournaments = catalog.index[catalog["Season"].isin(seasons)]
+    recomputed = compute_season_aggregates(
+        leaderboard[
+            leaderboard["TOURNAMENT_ID"].isin(season_tournaments)
+            & leaderboard["PLAYER_ID"].isin(players)
+        ],
+        stats[
+            stats["TOURNAMENT_ID"].isin(season_tournaments)
+            & stats["PLAYER_ID"].isin(players)
+        ],
+        catalog,
+    )
+
+    stored = read_table("season_aggregates", derived_dir)
+    is_affected = stored["SEASON"].isin(seasons) & stored["PLAYER_ID"].isin(players)
+    print(
+        f"Refreshing {len(recomputed)} season rows for {len(seasons)} seasons "
+        f"({(~is_affected).sum()} unchanged)"
+    )
+    aggregates = pd.concat([stored[~is_affected], recomputed], ignore_index=True)
+    aggregates = aggregates.sort_values(SEASON_KEY, ignore_index=True)
+    write_table(aggregates, "season_aggregates", derived_dir)
+    return aggregates
+
+
+def load_season_aggregates(derived_dir: str = DERIVED_DIR) -> pd.DataFrame:
+    """
+    Load the season aggregates indexed by ("SEASON", "PLAYER_ID").
+
+    The index is unique, so get_season_summary lookups are hash lookups that do
+    not depend on the size of the table.
+    """
+    return read_table("season_aggregates", derived_dir).set_index(SEASON_KEY)
+
+
+def get_season_summary(
+    aggregates: pd.DataFrame, player_id: int, season: str
+) -> pd.Series:
+    """
+    Return one player's aggregates for a season.
+
+    Args:
+        aggregates (pd.DataFrame): The table from load_season_aggregates.
+        player_id (int): The player ID.
+        season (str): The season label, e.g. "2024" or "2022-23".
+
+    Returns:
+        pd.Series: The player's season aggregates.
+
+    Raises:
+        ValueError: If the player has no aggregates for the season.
+
+    Example:
+        aggregates = load_season_aggregates()
+        get_season_summary(aggregates, player_id=1, season="2024")
+    """
+    try:
+        return aggregates.loc[(str(season), player_id)]
+    except KeyError:
+        raise ValueError(
+            f"No aggregates for player {player_id} in season {season}"
+        ) from None
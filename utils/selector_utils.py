@@ -0,0 +1,289 @@
+# utils/selector_utils.py
+
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional
+
+import pandas as pd
+
+from .store_utils import DERIVED_DIR, read_table, table_exists, write_table
+from .throttle_utils import throttled
+from .tournament_utils import (
+    LEADERBOARD_TABLE_SELECTOR,
+    PLAYER_STATS_BUTTON_SELECTOR,
+    TOURNAMENT_INFO_SELECTORS,
+    setup_driver,
+)
+
+# Text the element must contain for its scraper to parse it
+_TEXT_PATTERNS = {
+    "Date": r"\d{4}",
+    "Details": r"Par",
+    "Purse": r"Purse",
+}
+
+# Not on the pages of tournaments without player stats
+PLAYER_STATS_BUTTON = "Player Stats button"
+
+# Every selector the scrapers use; "unique" selectors must match one element
+SCRAPER_SELECTORS = [
+    {
+        "name": name,
+        "selector": selector,
+        "type": selector_type,
+        "used_by": "scrape_tournament_info",
+        "unique": True,
+        "pattern": _TEXT_PATTERNS.get(name),
+    }
+    for name, (selector, selector_type) in TOURNAMENT_INFO_SELECTORS.items()
+] + [
+    {
+        "name": "Leaderboard table",
+        "selector": LEADERBOARD_TABLE_SELECTOR[0],
+        "type": LEADERBOARD_TABLE_SELECTOR[1],
+        "used_by": "scrape_leaderboard",
+        # Playoff tables use the same markup
+        "unique": False,
+        "pattern": None,
+    },
+    {
+        "name": PLAYER_STATS_BUTTON,
+        "selector": PLAYER_STATS_BUTTON_SELECTOR[0],
+        "type": PLAYER_STATS_BUTTON_SELECTOR[1],
+        "used_by": "scrape_player_stats_page",
+        "unique": True,
+        "pattern": None,
+    },
+]
+
+# Evaluates every selector inside the page, polling until all of them match or
+# the timeout passes, so a page costs one WebDriver round trip
+SELECTOR_CHECK_SCRIPT = """
+var selectors = arguments[0];
+var timeout = arguments[1] * 1000;
+var done = arguments[arguments.length - 1];
+
+function find(s) {
+  try {
+    if (s.type === "xpath") {
+      var result = document.evaluate(s.selector, document, null,
+        XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+      var nodes = [];
+      for (var i = 0; i < result.snapshotLength; i++) {
+        nodes.push(result.snapshotItem(i));
+      }
+      return nodes;
+    }
+    var css = s.selector;
+    if (s.type === "class") css = "." + s.selector.trim().split(/\\s+/).join(".");
+    if (s.type === "id") css = "#" + CSS.escape(s.selector);
+    if (s.type === "name") css = '[name="' + s.selector + '"]';
+    return Array.prototype.slice.call(document.querySelectorAll(css));
+  } catch (e) {
+    return null;
+  }
+}
+
+var start = Date.now();
+(function poll() {
+  var results = selectors.map(function (s) {
+    var nodes = find(s);
+    var text = nodes && nodes.length ? (nodes[0].innerText || "").trim() : null;
+    return {
+      name: s.name,
+      count: nodes === null ? -1 : nodes.length,
+      text: text === null ? null : text.slice(0, 200)
+    };
+  });
+  var missing = results.some(function (r) { return r.count === 0; });
+  if (missing && Date.now() - start < timeout) {
+    setTimeout(poll, 250);
+  } else {
+    done(results);
+  }
+})();
+"""
+
+
+def _selector_status(selector: Dict, count: int, text: Optional[str]) -> str:
+    if count < 0:
+        return "INVALID"
+    if count == 0:
+        return "MISSING"
+    if selector["pattern"] and not re.search(selector["pattern"], text or ""):
+        return "CHANGED"
+    if selector["unique"] and count > 1:
+        return "AMBIGUOUS"
+    return "OK"
+
+
+def check_page_selectors(
+    driver,
+    url: str,
+    selectors: List[Dict] = SCRAPER_SELECTORS,
+    timeout: float = 10,
+    skip: Iterable[str] = (),
+) -> List[Dict]:
+    """
+    Check every selector on one page with a single script call.
+
+    Selectors named in skip are not looked for, e.g. the Player Stats button on
+    the page of a tournament without player stats, so they neither count as
+    missing nor hold the check until the timeout.
+
+    Returns:
+        list: One dict per selector with "url", "name", "used_by", "count"
+        (-1 for an invalid selector), "text" (of the first match) and "status"
+        (OK, MISSING, INVALID, CHANGED when the text no longer looks parseable,
+        or AMBIGUOUS when a unique selector matches several elements).
+    """
+    selectors = [s for s in selectors if s["name"] not in set(skip)]
+    with throttled(url):
+        driver.get(url)
+    driver.set_script_timeout(timeout + 10)
+    results = driver.execute_async_script(
+        SELECTOR_CHECK_SCRIPT,
+        [{key: s[key] for key in ("name", "selector", "type")} for s in selectors],
+        timeout,
+    )
+    rows = []
+    for selector, result in zip(selectors, results, strict=True):
+        rows.append(
+            {
+                "url": url,
+                "name": selector["name"],
+                "used_by": selector["used_by"],
+                "count": result["count"],
+                "text": result["text"],
+                "status": _selector_status(selector, result["count"], result["text"]),
+            }
+        )
+    return rows
+
+
+def check_selectors_batch(
+    urls: List[str],
+    selectors: List[Dict] = SCRAPER_SELECTORS,
+    workers: int = 4,
+    timeout: float = 10,
+    skip: Optional[Dict[str, List[str]]] = None,
+) -> pd.DataFrame:
+    """
+    Check every selector on many pages in parallel headless browsers.
+
+    Each worker thread keeps one browser for all the pages it checks. A page
+    that fails to load is reported with status "ERROR" for every selector.
+    skip maps a URL to the names of selectors not expected on that page; they
+    get no rows for it.
+
+    Returns:
+        pd.DataFrame: The rows of check_page_selectors for every page.
+    """
+    skip = skip or {}
+    local = threading.local()
+    drivers = []
+    lock = threading.Lock()
+
+    def check(url):
+        if not hasattr(local, "driver"):
+            local.driver = setup_driver()
+            with lock:
+                drivers.append(local.driver)
+        print(f"Checking selectors on {url}")
+        try:
+            return check_page_selectors(
+                local.driver, url, selectors, timeout, skip.get(url, ())
+            )
+        except Exception as e:
+            print(f"Error checking {url}: {e}")
+            return [
+                {
+                    "url": url,
+                    "name": s["name"],
+                    "used_by": s["used_by"],
+                    "count": None,
+                    "text": str(e)[:200],
+                    "status": "ERROR",
+                }
+                for s in selectors
+                if s["name"] not in skip.get(url, ())
+            ]
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pages = list(executor.map(check, urls))
+    finally:
+        for driver in drivers:
+            driver.quit()
+
+    return pd.DataFrame([row for rows in pages for row in rows])
+
+
+def selector_drift_report(
+    results: pd.DataFrame, derived_dir: str = DERIVED_DIR, save: bool = True
+) -> pd.DataFrame:
+    """
+    Summarize selector checks per selector and compare with the last report.
+
+    Args:
+        results (pd.DataFrame): Rows as returned by check_selectors_batch.
+        derived_dir (str, optional): Directory holding derived tables.
+        save (bool, optional): Store the report as "selector_health" for the
+            next comparison. Defaults to True.
+
+    Returns:
+        pd.DataFrame: One row per selector with "PAGES", "OK" (pages where it
+        was fine), "STATUS" (OK, or the most frequent problem), "FAILING PAGES",
+        "SAMPLE TEXT", "PREVIOUS STATUS" and "DRIFT" (True if the selector is
+        not OK, or its status changed since the last report).
+    """
+    problems = results[results["status"] != "OK"]
+    report = results.groupby(["name", "used_by"], sort=False).agg(
+        PAGES=("url", "size"),
+        OK=("status", lambda status: int((status == "OK").sum())),
+        **{"SAMPLE TEXT": ("text", "first")},
+    )
+    report["STATUS"] = (
+        problems.groupby(["name", "used_by"])["status"]
+        .agg(lambda status: status.mode().iloc[0])
+        .reindex(report.index)
+        .fillna("OK")
+    )
+    report["FAILING PAGES"] = (
+        problems.groupby(["name", "used_by"])["url"]
+        .agg(", ".join)
+        .reindex(report.index)
+        .fillna("")
+    )
+    report = report.reset_index().rename(
+        columns={"name": "SELECTOR", "used_by": "USED BY"}
+    )
+
+    report["PREVIOUS STATUS"] = None
+    if table_exists("selector_health", derived_dir):
+        previous = read_table("selector_health", derived_dir)
+        report["PREVIOUS STATUS"] = report["SELECTOR"].map(
+            previous.set_index("SELECTOR")["STATUS"]
+        )
+    report["DRIFT"] = (report["STATUS"] != "OK") | (
+        report["PREVIOUS STATUS"].notna()
+        & (report["PREVIOUS STATUS"] != report["STATUS"])
+    )
+    report = report[
+        [
+            "SELECTOR",
+            "USED BY",
+            "PAGES",
+            "OK",
+            "STATUS",
+            "PREVIOUS STATUS",
+            "DRIFT",
+            "FAILING PAGES",
+            "SAMPLE TEXT",
+        ]
+    ]
+
+    if save:
+        write_table(report, "selector_health", derived_dir)
+    return report
@@ -0,0 +1,303 @@
+# utils/similarity_utils.py
+
+import glob
+import os
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .catalog_utils import load_tournament_catalog
+from .store_utils import DERIVED_DIR, files_fingerprint, read_table, table_path
+
+PROFILE_STATS = [
+    "YDS/DRV",
+    "DRV ACC",
+    "GIR",
+    "PP GIR",
+    "EAGLE",
+    "BIRDIE",
+    "PARS",
+    "BOGEY",
+    "DBL+",
+]
+
+# Hole outcome counts depend on how many rounds were played, so they are
+# converted to shares of holes played before averaging
+HOLE_OUTCOMES = ["EAGLE", "BIRDIE", "PARS", "BOGEY", "DBL+"]
+
+SIMILARITY_INDEX_FILE = "similarity_index.npz"
+
+
+def build_player_profiles(
+    stats: pd.DataFrame, catalog: pd.DataFrame, min_events: int = 3
+) -> pd.DataFrame:
+    """
+    Average each player's stat line per season into a profile.
+
+    Args:
+        stats (pd.DataFrame): Player stats facts with "PLAYER_ID",
+            "TOURNAMENT_ID" and the PROFILE_STATS columns.
+        catalog (pd.DataFrame): The tournament catalog, used for seasons.
+        min_events (int, optional): Drop player-seasons with fewer events.
+            Defaults to 3.
+
+    Returns:
+        pd.DataFrame: One row per player and season with "PLAYER_ID", "SEASON",
+        "EVENTS" and the PROFILE_STATS columns (hole outcomes as shares).
+    """
+    stats = stats.dropna(subset=["PLAYER_ID"]).copy()
+    holes = stats[HOLE_OUTCOMES].sum(axis=1).replace(0, np.nan)
+    stats[HOLE_OUTCOMES] = stats[HOLE_OUTCOMES].div(holes, axis=0)
+    stats["SEASON"] = stats["TOURNAMENT_ID"].map(catalog["Season"])
+
+    grouped = stats.groupby(["PLAYER_ID", "SEASON"])
+    profiles = grouped[PROFILE_STATS].mean()
+    profiles.insert(0, "EVENTS", grouped.size())
+    profiles = profiles[profiles["EVENTS"] >= min_events].dropna()
+    return profiles.reset_index()
+
+
+def _kmeans(vectors: np.ndarray, n_clusters: int, iterations: int = 20, seed=0):
+    """
+    Plain Lloyd's k-means; returns (centroids, assignment of each vector).
+
+    There are at most as many clusters as vectors.
+    """
+    n_clusters = max(1, min(n_clusters, len(vectors)))
+    rng = np.random.default_rng(seed)
+    centroids = vectors[rng.choice(len(vectors), n_clusters, replace=False)]
+    for _ in range(iterations):
+        assignments = _squared_distances(vectors, centroids).argmin(axis=1)
+        for cluster in range(n_clusters):
+            members = vectors[assignments == cluster]
+            if len(members):
+                centroids[cluster] = members.mean(axis=0)
+    return centroids, _squared_distances(vectors, centroids).argmin(axis=1)
+
+
+def _squared_distances(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Squared Euclidean distance matrix between the rows of a and b.
+    """
+    distances = (a**2).sum(axis=1)[:, None] + (b**2).sum(axis=1)[None, :] - 2 * a @ b.T
+    return np.maximum(distances, 0)
+
+
+def _index_inputs(
+    derived_dir: str = DERIVED_DIR, data_directory: str = "data"
+) -> List[str]:
+    """
+    Return the files the default profiles are built from.
+    """
+    return [
+        table_path("player_stats_facts", derived_dir),
+        os.path.join(data_directory, "tournament_info.csv"),
+    ] + glob.glob(os.path.join(data_directory, "golf_tournaments_*.csv"))
+
+
+def build_similarity_index(
+    profiles: Optional[pd.DataFrame] = None,
+    n_lists: Optional[int] = None,
+    derived_dir: str = DERIVED_DIR,
+) -> Dict[str, np.ndarray]:
+    """
+    Build and save a nearest-neighbour index over player profile vectors.
+
+    Profiles are z-score normalized per stat. The index also holds a coarse
+    k-means partition of the vectors (an inverted file), which the approximate
+    mode of find_similar_players uses to search only the closest partitions.
+    An index built from the default profiles stores the fingerprint of the
+    files they were built from, so refresh_similarity_index can tell when it
+    is out of date.
+
+    Args:
+        profiles (pd.DataFrame, optional): Player profiles. Defaults to profiles
+            built from the "player_stats_facts" table and the tournament catalog.
+        n_lists (int, optional): Number of k-means partitions, at most the
+            number of profiles. Defaults to the square root of the number of
+            profiles.
+        derived_dir (str, optional): Directory holding derived tables.
+
+    Returns:
+        dict: The index arrays: "player_ids", "seasons", "events", "vectors",
+        "mean", "std", "centroids", "lists" and "fingerprint" (empty for
+        profiles passed in).
+    """
+    fingerprint = ""
+    if profiles is None:
+        fingerprint = files_fingerprint(_index_inputs(derived_dir))
+        profiles = build_player_profiles(
+            read_table("player_stats_facts", derived_dir), load_tournament_catalog()
+        )
+
+    values = profiles[PROFILE_STATS].to_numpy(dtype=np.float64)
+    mean = values.mean(axis=0)
+    std = values.std(axis=0)
+    std[std == 0] = 1
+    vectors = ((values - mean) / std).astype(np.float32)
+
+    n_lists = n_lists or max(1, int(np.sqrt(len(vectors))))
+    centroids, lists = _kmeans(vectors, n_lists)
+
+    index = {
+        "player_ids": profiles["PLAYER_ID"].to_numpy(dtype=np.int32),
+        "seasons": profiles["SEASON"].to_numpy(dtype=str),
+        "events": profiles["EVENTS"].to_numpy(dtype=np.int32),
+        "vectors": vectors,
+        "mean": mean,
+        "std": std,
+        "centroids": centroids,
+        "lists": lists.astype(np.int32),
+        "fingerprint": np.array(fingerprint),
+    }
+
+    os.makedirs(derived_dir, exist_ok=True)
+    path = os.path.join(derived_dir, SIMILARITY_INDEX_FILE)
+    np.savez(path, **index)
+    print(f"Saved similarity index ({len(vectors)} profiles) to {path}")
+    return index
+
+
+def load_similarity_index(derived_dir: str = DERIVED_DIR) -> Dict[str, np.ndarray]:
+    """
+    Load the nearest-neighbour index saved by build_similarity_index.
+
+    Raises:
+        FileNotFoundError: If the index has not been built yet.
+    """
+    path = os.path.join(derived_dir, SIMILARITY_INDEX_FILE)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Similarity index not found: {path}")
+    with np.load(path) as data:
+        return {key: data[key] for key in data.files}
+
+
+def refresh_similarity_index(
+    n_lists: Optional[int] = None, derived_dir: str = DERIVED_DIR
+) -> Dict[str, np.ndarray]:
+    """
+    Load the similarity index, rebuilding it if its inputs have changed.
+
+    The index is rebuilt from the default profiles when it does not exist, was
+    built from other profiles, the player stats facts or the tournament
+    catalog files changed since it was built, or n_lists asks for a different
+    number of partitions.
+
+    Args:
+        n_lists (int, optional): Number of k-means partitions. By default a
+            current index is kept as built, and a rebuilt one has the square
+            root of the number of profiles.
+        derived_dir (str, optional): Directory holding derived tables.
+
+    Returns:
+        dict: The index, as returned by build_similarity_index.
+    """
+    fingerprint = files_fingerprint(_index_inputs(derived_dir))
+    try:
+        index = load_similarity_index(derived_dir)
+    except FileNotFoundError:
+        return build_similarity_index(n_lists=n_lists, derived_dir=derived_dir)
+
+    partitions = len(index["centroids"])
+    if str(index.get("fingerprint", "")) != fingerprint:
+        print("Similarity index inputs changed; rebuilding")
+    elif n_lists and min(n_lists, len(index["vectors"])) != partitions:
+        print(f"Similarity index has {partitions} partitions; rebuilding")
+    else:
+        return index
+    return build_similarity_index(n_lists=n_lists, derived_dir=derived_dir)
+
+
+def nearest_neighbours(vectors: np.ndarray, queries: np.ndarray, k: int = 10) -> tuple:
+    """
+    Exact k nearest neighbours for a batch of queries.
+
+    Distances from every query to every vector are computed as one matrix, and
+    the k smallest per row are selected with argpartition.
+
+    Args:
+        vectors (np.ndarray): (n, d) indexed vectors.
+        queries (np.ndarray): (m, d) query vectors.
+        k (int, optional): Neighbours per query. Defaults to 10.
+
+    Returns:
+        tuple: (m, k) arrays of neighbour positions and distances, nearest first.
+    """
+    distances = _squared_distances(queries, vectors)
+    k = min(k, vectors.shape[0])
+    nearest = np.argpartition(distances, k - 1, axis=1)[:, :k]
+    nearest_distances = np.take_along_axis(distances, nearest, axis=1)
+    order = np.argsort(nearest_distances, axis=1)
+    return (
+        np.take_along_axis(nearest, order, axis=1),
+        np.sqrt(np.take_along_axis(nearest_distances, order, axis=1)),
+    )
+
+
+def find_similar_players(
+    index: Dict[str, np.ndarray],
+    player_id: int,
+    season: str,
+    k: int = 10,
+    same_season: bool = True,
+    approximate: bool = False,
+    n_probe: int = 3,
+) -> pd.DataFrame:
+    """
+    Find the player-seasons with the profiles most similar to one player's season.
+
+    Args:
+        index (dict): The index from build_similarity_index or
+            load_similarity_index.
+        player_id (int): The player to compare against.
+        season (str): The player's season, e.g. "2024".
+        k (int, optional): Number of similar players. Defaults to 10.
+        same_season (bool, optional): Only return profiles from the same season.
+            Defaults to True.
+        approximate (bool, optional): Only search the n_probe partitions whose
+            centroids are closest to the query. Defaults to False (exact).
+        n_probe (int, optional): Partitions to search in approximate mode.
+            Defaults to 3.
+
+    Returns:
+        pd.DataFrame: "PLAYER_ID", "SEASON", "EVENTS" and "DISTANCE" of the most
+        similar profiles, nearest first.
+
+    Raises:
+        ValueError: If the player has no profile for the season.
+
+    Example:
+        index = load_similarity_index()
+        find_similar_players(index, player_id=25, season="2024", k=5)
+    """
+    matches = np.flatnonzero(
+        (index["player_ids"] == player_id) & (index["seasons"] == str(season))
+    )
+    if not len(matches):
+        raise ValueError(f"No profile for player {player_id} in season {season}")
+    query_position = matches[0]
+    query = index["vectors"][query_position][None, :]
+
+    candidates = np.ones(len(index["vectors"]), dtype=bool)
+    candidates[query_position] = False
+    if same_season:
+        candidates &= index["seasons"] == str(season)
+    if approximate:
+        probe = nearest_neighbours(index["centroids"], query, n_probe)[0][0]
+        candidates &= np.isin(index["lists"], probe)
+
+    positions = np.flatnonzero(candidates)
+    if not len(positions):
+        return pd.DataFrame(columns=["PLAYER_ID", "SEASON", "EVENTS", "DISTANCE"])
+
+    nearest, distances = nearest_neighbours(index["vectors"][positions], query, k)
+    nearest = positions[nearest[0]]
+    return pd.DataFrame(
+        {
+            "PLAYER_ID": index["player_ids"][nearest],
+            "SEASON": index["seasons"][nearest],
+            "EVENTS": index["events"][nearest],
+            "DISTANCE": distances[0],
+        }
+    )
@@ -0,0 +1,180 @@
+# utils/simulation_utils.py
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+# Rounds of an unseen player's history assumed to sit at the field average
+PRIOR_ROUNDS = 20
+
+# Spread of round scores around the field average for a typical tour player
+DEFAULT_ROUND_SD = 3.0
+
+# Simulations per batch; bounds memory at chunk x players x rounds float32 values
+CHUNK_SIZE = 10_000
+
+# Runs larger than this are split across a process pool by default
+PARALLEL_THRESHOLD = 200_000
+
+
+def player_round_models(
+    round_scores: pd.DataFrame,
+    player_ids,
+    prior_rounds: int = PRIOR_ROUNDS,
+    default_sd: float = DEFAULT_ROUND_SD,
+) -> pd.DataFrame:
+    """
+    Estimate each player's round-score distribution relative to the field.
+
+    Means and standard deviations of "VS FIELD" are shrunk toward the field
+    (mean 0, default_sd) in proportion to how few rounds a player has, so
+    players with little or no history are simulated as average players.
+
+    Args:
+        round_scores (pd.DataFrame): The round_scores_vs_field table.
+        player_ids (Iterable[int]): The field to model.
+        prior_rounds (int, optional): Weight of the field prior in rounds.
+            Defaults to 20.
+        default_sd (float, optional): Standard deviation of the field prior.
+            Defaults to 3.0.
+
+    Returns:
+        pd.DataFrame: Indexed by "PLAYER_ID" with columns "ROUNDS", "MEAN" and "SD".
+    """
+    player_ids = pd.Index(pd.unique(pd.Series(list(player_ids))), name="PLAYER_ID")
+    history = round_scores[round_scores["PLAYER_ID"].isin(player_ids)]
+    grouped = history.groupby("PLAYER_ID")["VS FIELD"]
+    stats = pd.DataFrame(
+        {"ROUNDS": grouped.size(), "MEAN": grouped.mean(), "VAR": grouped.var(ddof=0)}
+    ).reindex(player_ids)
+
+    n = stats["ROUNDS"].fillna(0)
+    mean = (n * stats["MEAN"].fillna(0)) / (n + prior_rounds)
+    var = (n * stats["VAR"].fillna(0) + prior_rounds * default_sd**2) / (
+        n + prior_rounds
+    )
+    return pd.DataFrame(
+        {"ROUNDS": n.astype(int), "MEAN": mean, "SD": np.sqrt(var)}, index=player_ids
+    )
+
+
+def _simulate_chunk(args):
+    """
+    Simulate one batch of tournaments and return per-player outcome counts.
+    """
+    means, sds, n_sims, rounds, cut_after, cut_size, seed = args
+    rng = np.random.default_rng(seed)
+    n_players = len(means)
+    wins = np.zeros(n_players, dtype=np.int64)
+    top10 = np.zeros(n_players, dtype=np.int64)
+    made_cut = np.zeros(n_players, dtype=np.int64)
+
+    means = means.astype(np.float32)[None, :, None]
+    sds = sds.astype(np.float32)[None, :, None]
+
+    for start in range(0, n_sims, CHUNK_SIZE):
+        size = min(CHUNK_SIZE, n_sims - start)
+
+        # (simulations x players x rounds) strokes relative to the field
+        scores = rng.standard_normal((size, n_players, rounds), dtype=np.float32)
+        scores *= sds
+        scores += means
+
+        # Cut after cut_after rounds: the top cut_size and ties play on
+        if cut_after and n_players > cut_size:
+            halfway = scores[:, :, :cut_after].sum(axis=2)
+            cut_line = np.partition(halfway, cut_size - 1, axis=1)[:, cut_size - 1]
+            made = halfway <= cut_line[:, None]
+        else:
+            made = np.ones((size, n_players), dtype=bool)
+
+        totals = scores.sum(axis=2)
+        totals[~made] = np.inf
+        made_cut += made.sum(axis=0)
+
+        # Tied leaders go to a playoff, decided here at random
+        playoff = totals + rng.random(totals.shape, dtype=np.float32) * 1e-3
+        wins += np.bincount(playoff.argmin(axis=1), minlength=n_players)
+
+        # Top 10 includes everyone tied for 10th. Cut players have an infinite
+        # total, so if fewer than 10 make the cut the 10th place total is
+        # infinite too and only the players who made the cut count.
+        k = min(10, n_players) - 1
+        tenth = np.partition(totals, k, axis=1)[:, k]
+        top10 += ((totals <= tenth[:, None]) & made).sum(axis=0)
+
+    return wins, top10, made_cut
+
+
+def simulate_tournament(
+    models: pd.DataFrame,
+    n_sims: int = 100_000,
+    rounds: int = 4,
+    cut_after: int = 2,
+    cut_size: int = 65,
+    seed: Optional[int] = None,
+    processes: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    Monte Carlo simulate a tournament and return outcome probabilities.
+
+    Round scores are drawn for all simulations, players and rounds at once as a
+    (simulations x players x rounds) NumPy array, in batches of CHUNK_SIZE
+    simulations. After cut_after rounds the top cut_size players and ties make
+    the cut. A 150-player field at 100k simulations runs in a few seconds in a
+    single process.
+
+    Args:
+        models (pd.DataFrame): Per-player "MEAN" and "SD" of round scores versus
+            the field, as returned by player_round_models.
+        n_sims (int, optional): Number of simulations. Defaults to 100,000.
+        rounds (int, optional): Rounds per tournament. Defaults to 4.
+        cut_after (int, optional): Rounds played before the cut; 0 for no cut.
+            Defaults to 2.
+        cut_size (int, optional): Places that make the cut, plus ties.
+            Defaults to 65.
+        seed (int, optional): Seed for reproducible results. Defaults to None.
+        processes (int, optional): Worker processes. Defaults to one process,
+            or every CPU for runs above PARALLEL_THRESHOLD simulations.
+
+    Returns:
+        pd.DataFrame: Indexed like models with columns "WIN", "TOP 10" and
+        "MAKE CUT" probabilities, sorted by win probability. Only players who
+        made the cut can finish in the top 10, so with a cut_size below 10
+        "TOP 10" equals "MAKE CUT".
+
+    Example:
+        round_scores = read_table("round_scores_vs_field")
+        models = player_round_models(round_scores, field_player_ids)
+        simulate_tournament(models, n_sims=100_000, seed=42)
+    """
+    if processes is None:
+        processes = (os.cpu_count() or 1) if n_sims > PARALLEL_THRESHOLD else 1
+    processes = max(1, min(processes, -(-n_sims // CHUNK_SIZE)))
+
+    means = models["MEAN"].to_numpy(dtype=float)
+    sds = models["SD"].to_numpy(dtype=float)
+
+    # Independent random streams for each worker
+    seeds = np.random.SeedSequence(seed).spawn(processes)
+    sizes = [n_sims // processes + (i < n_sims % processes) for i in range(processes)]
+    tasks = [
+        (means, sds, size, rounds, cut_after, cut_size, child)
+        for size, child in zip(sizes, seeds, strict=True)
+    ]
+
+    if processes == 1:
+        results = [_simulate_chunk(tasks[0])]
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            results = list(executor.map(_simulate_chunk, tasks))
+
+    wins, top10, made_cut = (sum(counts) for counts in zip(*results, strict=True))
+    probabilities = pd.DataFrame(
+        {"WIN": wins / n_sims, "TOP 10": top10 / n_sims, "MAKE CUT": made_cut / n_sims},
+        index=models.index,
+    )
+    return probabilities.sort_values("WIN", ascending=False)
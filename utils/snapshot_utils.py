@@ -0,0 +1,272 @@
+# utils/snapshot_utils.py
+
+import json
+import os
+from bisect import bisect_left
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+SNAPSHOT_DIR = os.path.join("data", "snapshots")
+
+
+def snapshot_path(tournament_id, snapshot_dir: str = SNAPSHOT_DIR) -> str:
+    return os.path.join(snapshot_dir, f"{tournament_id}.jsonl")
+
+
+def _leaderboard_rows(leaderboard: pd.DataFrame) -> Dict[str, Dict]:
+    """
+    Key the rows of a raw leaderboard by player, with JSON-serializable values.
+
+    A name that appears more than once gets a "#2", "#3"... suffix.
+    """
+    players = leaderboard["PLAYER"].astype(str)
+    repeat = players.groupby(players).cumcount()
+    keys = players.where(repeat == 0, players + "#" + (repeat + 1).astype(str))
+    values = leaderboard.astype(object).where(leaderboard.notna(), None)
+    return dict(zip(keys, values.to_dict("records"), strict=True))
+
+
+def _read_captures(tournament_id, snapshot_dir: str = SNAPSHOT_DIR) -> List[Dict]:
+    path = snapshot_path(tournament_id, snapshot_dir)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"No snapshots found for tournament {tournament_id}")
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def _order_moves(before: List[str], after: List[str]) -> List[List]:
+    """
+    Return the fewest [player, index] moves that turn one row order into another.
+
+    Players of after that keep their relative order from before (the longest
+    increasing subsequence of their old positions) stay put; every other
+    player, including new ones, is moved to its index in after.
+    """
+    position = {player: i for i, player in enumerate(before)}
+    present = [player for player in after if player in position]
+
+    # Patience sorting: tails[k] is the index in present of the smallest old
+    # position ending an increasing run of length k + 1
+    tails, tail_positions, previous = [], [], [None] * len(present)
+    for i, player in enumerate(present):
+        k = bisect_left(tail_positions, position[player])
+        previous[i] = tails[k - 1] if k else None
+        if k == len(tails):
+            tails.append(i)
+            tail_positions.append(position[player])
+        else:
+            tails[k] = i
+            tail_positions[k] = position[player]
+
+    kept = set()
+    i = tails[-1] if tails else None
+    while i is not None:
+        kept.add(present[i])
+        i = previous[i]
+    return [[player, i] for i, player in enumerate(after) if player not in kept]
+
+
+def _apply_capture(state: Dict, capture: Dict):
+    """
+    Apply one capture to the state built from the captures before it.
+    """
+    if "base" in capture:
+        state["rows"] = {player: dict(row) for player, row in capture["base"].items()}
+    removed = set(capture.get("removed", []))
+    for player in removed:
+        del state["rows"][player]
+    for player, changes in capture.get("set", {}).items():
+        state["rows"].setdefault(player, {}).update(changes)
+    if "columns" in capture:
+        state["columns"] = capture["columns"]
+    if "order" in capture:
+        state["order"] = capture["order"]
+    elif removed or "moves" in capture:
+        moves = capture.get("moves", [])
+        moved = removed | {player for player, _ in moves}
+        order = [player for player in state["order"] if player not in moved]
+        for player, index in sorted(moves, key=lambda move: move[1]):
+            order.insert(index, player)
+        state["order"] = order
+    state["captured_at"] = capture["captured_at"]
+
+
+def _replay(captures: List[Dict], as_of: Optional[str] = None) -> Optional[Dict]:
+    state = None
+    for capture in captures:
+        if as_of is not None and capture["captured_at"] > as_of:
+            break
+        state = state or {"rows": {}}
+        _apply_capture(state, capture)
+    return state
+
+
+def record_snapshot(
+    leaderboard: pd.DataFrame,
+    tournament_id=None,
+    captured_at: Optional[str] = None,
+    snapshot_dir: str = SNAPSHOT_DIR,
+) -> Dict:
+    """
+    Add a leaderboard capture to its tournament's snapshot history.
+
+    The first capture is stored in full as the base. Later captures only
+    store the cells that changed per player, the players who dropped off the
+    board, the columns when they changed, and the players who moved up or
+    down the board with their new row, so history grows with what happens on
+    the course rather than with the size of the board.
+    A capture identical to the previous one is not stored.
+
+    Args:
+        leaderboard (pd.DataFrame): A raw leaderboard as returned by
+            scrape_leaderboard.
+        tournament_id (str, optional): Defaults to the leaderboard's
+            "TOURNAMENT_ID".
+        captured_at (str, optional): ISO timestamp of the capture. Defaults to
+            now. Captures must be recorded in time order.
+        snapshot_dir (str, optional): Directory holding the snapshot files.
+
+    Returns:
+        dict: "captured_at", "base" (True for the first capture), "changes"
+        (number of changed cells, added, removed and moved players) and
+        "stored" (False if nothing changed).
+
+    Raises:
+        ValueError: If captured_at is earlier than the last capture.
+    """
+    if tournament_id is None:
+        tournament_id = leaderboard["TOURNAMENT_ID"].iloc[0]
+    captured_at = pd.Timestamp(captured_at or datetime.now()).isoformat(
+        timespec="seconds"
+    )
+
+    rows = _leaderboard_rows(leaderboard)
+    columns = [str(col) for col in leaderboard.columns]
+    order = list(rows)
+
+    path = snapshot_path(tournament_id, snapshot_dir)
+    previous = None
+    if os.path.exists(path):
+        previous = _replay(_read_captures(tournament_id, snapshot_dir))
+
+    if previous is None:
+        capture = {
+            "captured_at": captured_at,
+            "columns": columns,
+            "order": order,
+            "base": rows,
+        }
+        changes = len(rows)
+    else:
+        if captured_at < previous["captured_at"]:
+            raise ValueError(
+                f"Capture at {captured_at} is older than the last capture "
+                f"({previous['captured_at']}) of tournament {tournament_id}"
+            )
+        capture = {"captured_at": captured_at}
+        removed = [player for player in previous["rows"] if player not in rows]
+        changed = {}
+        for player, row in rows.items():
+            before = previous["rows"].get(player, {})
+            cells = {
+                col: value
+                for col, value in row.items()
+                if col not in before or before[col] != value
+            }
+            if cells or player not in previous["rows"]:
+                changed[player] = cells
+        if removed:
+            capture["removed"] = removed
+        if changed:
+            capture["set"] = changed
+        if columns != previous["columns"]:
+            capture["columns"] = columns
+        moves = _order_moves(previous["order"], order)
+        if moves:
+            capture["moves"] = moves
+        # Added players are moves too, but already count for their cells
+        changes = (
+            len(removed)
+            + sum(max(len(cells), 1) for cells in changed.values())
+            + sum(player not in changed for player, _ in moves)
+        )
+        if len(capture) == 1:
+            return {
+                "captured_at": captured_at,
+                "base": False,
+                "changes": 0,
+                "stored": False,
+            }
+
+    os.makedirs(snapshot_dir, exist_ok=True)
+    with open(path, "a") as f:
+        f.write(json.dumps(capture) + "\n")
+    return {
+        "captured_at": captured_at,
+        "base": previous is None,
+        "changes": changes,
+        "stored": True,
+    }
+
+
+def rebuild_leaderboard(
+    tournament_id, as_of=None, snapshot_dir: str = SNAPSHOT_DIR
+) -> pd.DataFrame:
+    """
+    Rebuild a tournament's leaderboard as it was at a point in time.
+
+    Args:
+        tournament_id (str): The tournament.
+        as_of (str or datetime, optional): Replay the captures made up to this
+            time. Defaults to the latest capture.
+        snapshot_dir (str, optional): Directory holding the snapshot files.
+
+    Returns:
+        pd.DataFrame: The raw leaderboard as scraped at the last capture made
+        by as_of, ready for clean_leaderboard_data.
+
+    Raises:
+        FileNotFoundError: If the tournament has no snapshots.
+        ValueError: If as_of is before the first capture.
+    """
+    if as_of is not None:
+        as_of = pd.Timestamp(as_of).isoformat(timespec="seconds")
+    state = _replay(_read_captures(tournament_id, snapshot_dir), as_of)
+    if state is None:
+        raise ValueError(f"No capture of tournament {tournament_id} by {as_of}")
+
+    leaderboard = pd.DataFrame(
+        [state["rows"][player] for player in state["order"]],
+        columns=state["columns"],
+    )
+    return leaderboard.infer_objects()
+
+
+def list_snapshots(tournament_id, snapshot_dir: str = SNAPSHOT_DIR) -> pd.DataFrame:
+    """
+    List a tournament's captures.
+
+    Returns:
+        pd.DataFrame: One row per capture with "CAPTURED_AT", "BASE",
+        "CHANGED PLAYERS" (players with changed cells, added, removed or
+        moved) and "PLAYERS" (on the board after the capture).
+    """
+    state = {"rows": {}}
+    captures = []
+    for capture in _read_captures(tournament_id, snapshot_dir):
+        _apply_capture(state, capture)
+        captures.append(
+            {
+                "CAPTURED_AT": pd.Timestamp(capture["captured_at"]),
+                "BASE": "base" in capture,
+                "CHANGED PLAYERS": len(
+                    set(capture.get("base", capture.get("set", {})))
+                    | set(capture.get("removed", []))
+                    | {player for player, _ in capture.get("moves", [])}
+                ),
+                "PLAYERS": len(state["rows"]),
+            }
+        )
+    return pd.DataFrame(captures)
@@ -0,0 +1,148 @@
+# utils/store_utils.py
+
+import glob
+import hashlib
+import os
+from typing import Callable, List, Optional
+
+import pandas as pd
+
+DERIVED_DIR = os.path.join("data", "derived")
+
+QUERY_CACHE_DIR = os.path.join(DERIVED_DIR, "query_cache")
+
+
+def table_path(name: str, derived_dir: str = DERIVED_DIR) -> str:
+    """
+    Return the path of a derived table in the store.
+
+    Args:
+        name (str): Name of the table, e.g. "player_appearances".
+        derived_dir (str, optional): Directory holding derived tables.
+            Defaults to "data/derived".
+
+    Returns:
+        str: Path of the Parquet file backing the table.
+    """
+    return os.path.join(derived_dir, f"{name}.parquet")
+
+
+def table_exists(name: str, derived_dir: str = DERIVED_DIR) -> bool:
+    return os.path.exists(table_path(name, derived_dir))
+
+
+def write_table(df: pd.DataFrame, name: str, derived_dir: str = DERIVED_DIR) -> str:
+    """
+    Write a derived table to the store as a Parquet file.
+
+    The file is written to a temporary path first and then moved into place, so
+    readers never see a partially written table.
+
+    Args:
+        df (pd.DataFrame): The table to write.
+        name (str): Name of the table.
+        derived_dir (str, optional): Directory holding derived tables.
+            Defaults to "data/derived".
+
+    Returns:
+        str: Path of the written file.
+    """
+    os.makedirs(derived_dir, exist_ok=True)
+    path = table_path(name, derived_dir)
+    tmp_path = f"{path}.tmp"
+    df.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, path)
+    print(f"Saved {name} ({len(df)} rows) to {path}")
+    return path
+
+
+def read_table(
+    name: str,
+    derived_dir: str = DERIVED_DIR,
+    columns: Optional[List[str]] = None,
+    memory_map: bool = False,
+    filters: Optional[List[tuple]] = None,
+) -> pd.DataFrame:
+    """
+    Read a derived table from the store.
+
+    Args:
+        name (str): Name of the table.
+        derived_dir (str, optional): Directory holding derived tables.
+            Defaults to "data/derived".
+        columns (list, optional): Only read these columns. Defaults to all.
+        memory_map (bool, optional): Memory-map the file instead of reading it
+            into a buffer. Defaults to False.
+        filters (list, optional): Only read rows matching these pyarrow filters,
+            e.g. [("PLAYER_ID", "==", 25)]. Defaults to all rows.
+
+    Returns:
+        pd.DataFrame: The stored table.
+
+    Raises:
+        FileNotFoundError: If the table has not been built yet.
+    """
+    path = table_path(name, derived_dir)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Derived table not found: {path}")
+    return pd.read_parquet(
+        path, columns=columns, memory_map=memory_map, filters=filters
+    )
+
+
+def files_fingerprint(paths: List[str]) -> str:
+    """
+    Fingerprint a set of files by their paths, sizes and modification times.
+
+    Missing files are included as missing, so creating them changes the
+    fingerprint too.
+    """
+    parts = []
+    for path in sorted(paths):
+        try:
+            stat = os.stat(path)
+            parts.append(f"{path}:{stat.st_size}:{stat.st_mtime_ns}")
+        except FileNotFoundError:
+            parts.append(f"{path}:missing")
+    return hashlib.sha1("\n".join(parts).encode()).hexdigest()
+
+
+def cached_query(
+    key: str,
+    paths: List[str],
+    compute: Callable[[], pd.DataFrame],
+    cache_dir: str = QUERY_CACHE_DIR,
+) -> pd.DataFrame:
+    """
+    Return a query result from the on-disk cache, computing it on a miss.
+
+    Results are keyed by the query and the fingerprint of the files it reads,
+    so rebuilding any of those files invalidates the cached result. A query
+    keeps one cached result: the stale one is deleted when the new one is
+    stored.
+
+    Args:
+        key (str): A string identifying the query and its arguments.
+        paths (list): Files the query reads, e.g. table_path() of each table.
+        compute (callable): Computes the result when it is not cached.
+        cache_dir (str, optional): Directory holding cached results.
+            Defaults to "data/derived/query_cache".
+
+    Returns:
+        pd.DataFrame: The query result.
+    """
+    key_digest = hashlib.sha1(key.encode()).hexdigest()
+    fingerprint = files_fingerprint(paths)
+    path = os.path.join(cache_dir, f"{key_digest}-{fingerprint}.pkl")
+    if os.path.exists(path):
+        return pd.read_pickle(path)
+
+    result = compute()
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    result.to_pickle(tmp_path)
+    os.replace(tmp_path, path)
+    for stale_path in glob.glob(os.path.join(cache_dir, f"{key_digest}-*.pkl")):
+        if stale_path != path:
+            os.remove(stale_path)
+    return result
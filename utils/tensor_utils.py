@@ -0,0 +1,159 @@
+# utils/tensor_utils.py
+
+import json
+import os
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .rating_utils import parse_positions
+from .similarity_utils import PROFILE_STATS
+from .store_utils import DERIVED_DIR, read_table
+
+TENSOR_STATS = PROFILE_STATS + ["SCORE", "FINISH"]
+
+PLAYER_STATS_TENSOR_FILE = "player_stats_tensor.npy"
+PLAYER_STATS_AXES_FILE = "player_stats_tensor.json"
+
+
+def build_player_stats_tensor(
+    stats: Optional[pd.DataFrame] = None, derived_dir: str = DERIVED_DIR
+) -> Tuple[np.ndarray, Dict]:
+    """
+    Pack the player stats into a dense (tournament, player, stat) array on disk.
+
+    The array is float32 with NaN where a player has no stats for a
+    tournament, saved as a .npy file so it can be memory-mapped, next to a
+    JSON file with the IDs along each axis. Both are written to temporary
+    paths and moved into place, the array last.
+
+    Args:
+        stats (pd.DataFrame, optional): Player stats facts with "TOURNAMENT_ID",
+            "PLAYER_ID", "POS" and the PROFILE_STATS and "SCORE" columns.
+            Defaults to the "player_stats_facts" table.
+        derived_dir (str, optional): Directory holding derived tables.
+
+    Returns:
+        tuple: The array and its axes, as returned by load_player_stats_tensor.
+    """
+    if stats is None:
+        stats = read_table("player_stats_facts", derived_dir)
+
+    stats = stats.dropna(subset=["PLAYER_ID"]).copy()
+    stats["FINISH"] = stats.groupby("TOURNAMENT_ID")["POS"].transform(parse_positions)
+    stats = stats.drop_duplicates(["TOURNAMENT_ID", "PLAYER_ID"])
+
+    tournaments = np.sort(stats["TOURNAMENT_ID"].unique()).astype("int64")
+    players = np.sort(stats["PLAYER_ID"].unique()).astype("int64")
+    rows = np.searchsorted(tournaments, stats["TOURNAMENT_ID"].to_numpy())
+    cols = np.searchsorted(players, stats["PLAYER_ID"].to_numpy(dtype="int64"))
+    values = (
+        stats[TENSOR_STATS].apply(pd.to_numeric, errors="coerce").to_numpy("float32")
+    )
+
+    os.makedirs(derived_dir, exist_ok=True)
+    path = os.path.join(derived_dir, PLAYER_STATS_TENSOR_FILE)
+    axes_path = os.path.join(derived_dir, PLAYER_STATS_AXES_FILE)
+
+    shape = (len(tournaments), len(players), len(TENSOR_STATS))
+    tensor = np.lib.format.open_memmap(
+        f"{path}.tmp", mode="w+", dtype=np.float32, shape=shape
+    )
+    tensor[:] = np.nan
+    tensor[rows, cols] = values
+    tensor.flush()
+    del tensor
+
+    axes = {
+        "tournaments": tournaments.tolist(),
+        "players": players.tolist(),
+        "stats": TENSOR_STATS,
+    }
+    with open(f"{axes_path}.tmp", "w") as f:
+        json.dump(axes, f)
+    os.replace(f"{axes_path}.tmp", axes_path)
+    os.replace(f"{path}.tmp", path)
+    print(f"Saved player stats tensor {shape} to {path}")
+    return load_player_stats_tensor(derived_dir)
+
+
+def load_player_stats_tensor(derived_dir: str = DERIVED_DIR) -> Tuple[np.ndarray, Dict]:
+    """
+    Open the player stats tensor read-only and memory-mapped.
+
+    Nothing is read until it is sliced, and processes that open the same file
+    share its pages in the OS cache.
+
+    Returns:
+        tuple: The (tournament, player, stat) array and a dict of the
+        "tournaments", "players" and "stats" along its axes, plus
+        "tournament_index", "player_index" and "stat_index" mapping each to
+        its position.
+
+    Raises:
+        FileNotFoundError: If the tensor has not been built yet.
+        ValueError: If the axes do not match the array's shape.
+    """
+    path = os.path.join(derived_dir, PLAYER_STATS_TENSOR_FILE)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Player stats tensor not found: {path}")
+    tensor = np.load(path, mmap_mode="r")
+    with open(os.path.join(derived_dir, PLAYER_STATS_AXES_FILE)) as f:
+        axes = json.load(f)
+
+    shape = (len(axes["tournaments"]), len(axes["players"]), len(axes["stats"]))
+    if tensor.shape != shape:
+        raise ValueError(f"Tensor shape {tensor.shape} does not match axes {shape}")
+
+    for axis, name in [
+        ("tournaments", "tournament"),
+        ("players", "player"),
+        ("stats", "stat"),
+    ]:
+        axes[f"{name}_index"] = {key: i for i, key in enumerate(axes[axis])}
+    return tensor, axes
+
+
+def player_stat_history(
+    tensor: np.ndarray, axes: Dict, player_id: int, stat: str
+) -> pd.Series:
+    """
+    Return one stat for a player across the tournaments they have stats for.
+
+    Raises:
+        ValueError: If the player or stat is not in the tensor.
+    """
+    try:
+        column = tensor[
+            :, axes["player_index"][int(player_id)], axes["stat_index"][stat]
+        ]
+    except KeyError as e:
+        raise ValueError(f"Not in the player stats tensor: {e}") from None
+    history = pd.Series(
+        column, index=pd.Index(axes["tournaments"], name="TOURNAMENT_ID"), name=stat
+    )
+    return history.dropna()
+
+
+def tournament_stat_table(
+    tensor: np.ndarray, axes: Dict, tournament_id: int
+) -> pd.DataFrame:
+    """
+    Return every stat for the players with stats in one tournament.
+
+    Raises:
+        ValueError: If the tournament is not in the tensor.
+    """
+    try:
+        block = tensor[axes["tournament_index"][int(tournament_id)]]
+    except KeyError:
+        raise ValueError(
+            f"Tournament not in the player stats tensor: {tournament_id}"
+        ) from None
+    table = pd.DataFrame(
+        block,
+        index=pd.Index(axes["players"], name="PLAYER_ID"),
+        columns=axes["stats"],
+    )
+    return table.dropna(how="all")
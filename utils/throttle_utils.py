@@ -0,0 +1,183 @@
+# utils/throttle_utils.py
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+# AIMD settings: every healthy response adds "rate_increase" requests per
+# second, every timeout, error or congested response multiplies the rate by
+# "decrease_factor". Concurrency follows the same rule, in whole requests.
+THROTTLE_SETTINGS = {
+    "initial_rate": 1.0,
+    "min_rate": 0.05,
+    "max_rate": 4.0,
+    "rate_increase": 0.05,
+    "max_concurrency": 4,
+    "decrease_factor": 0.5,
+    # A response this many times slower than the average counts as congestion
+    "slow_factor": 2.5,
+    # Decreases closer together than this are one congestion event
+    "decrease_cooldown": 5.0,
+    "latency_smoothing": 0.2,
+    # Adaptive timeouts are this many times the average latency
+    "timeout_factor": 3.0,
+}
+
+_DEFAULT_SETTINGS = dict(THROTTLE_SETTINGS)
+
+_CONDITION = threading.Condition()
+_STATE: Dict = {}
+
+
+def reset_throttle(**settings):
+    """
+    Reset the throttle to its initial rate, optionally changing settings.
+
+    Settings that are not given go back to their defaults.
+
+    Example:
+        reset_throttle(initial_rate=0.5, max_concurrency=2)
+    """
+    unknown = set(settings) - set(THROTTLE_SETTINGS)
+    if unknown:
+        raise ValueError(f"Unknown throttle settings: {', '.join(sorted(unknown))}")
+    with _CONDITION:
+        THROTTLE_SETTINGS.update(_DEFAULT_SETTINGS, **settings)
+        _STATE.clear()
+        _STATE.update(
+            rate=THROTTLE_SETTINGS["initial_rate"],
+            concurrency=1.0,
+            active=0,
+            next_start=0.0,
+            latency=None,
+            last_decrease=0.0,
+            counts={"ok": 0, "slow": 0, "timeout": 0, "error": 0},
+        )
+        _CONDITION.notify_all()
+
+
+reset_throttle()
+
+
+def get_throttle_state() -> Dict:
+    """
+    Return the current "rate" (requests per second), "concurrency", average
+    "latency" (seconds) and the "counts" of each request outcome.
+    """
+    with _CONDITION:
+        return {
+            "rate": _STATE["rate"],
+            "concurrency": int(_STATE["concurrency"]),
+            "latency": _STATE["latency"],
+            "counts": dict(_STATE["counts"]),
+        }
+
+
+def adaptive_timeout(default: float, floor: float = 5.0) -> float:
+    """
+    Scale a wait timeout to the latency the source currently shows.
+
+    Returns default until a latency has been measured, and never more than
+    default or less than floor, so healthy fast pages give up on a missing
+    element sooner while slow periods keep the full timeout.
+    """
+    with _CONDITION:
+        latency = _STATE["latency"]
+    if latency is None:
+        return default
+    return min(default, max(floor, THROTTLE_SETTINGS["timeout_factor"] * latency))
+
+
+def _decrease(reason: str, now: float):
+    if now - _STATE["last_decrease"] < THROTTLE_SETTINGS["decrease_cooldown"]:
+        return
+    factor = THROTTLE_SETTINGS["decrease_factor"]
+    _STATE["rate"] = max(THROTTLE_SETTINGS["min_rate"], _STATE["rate"] * factor)
+    _STATE["concurrency"] = max(1.0, _STATE["concurrency"] * factor)
+    _STATE["last_decrease"] = now
+    print(
+        f"Throttling down after {reason}: {_STATE['rate']:.2f} requests/s, "
+        f"concurrency {int(_STATE['concurrency'])}"
+    )
+
+
+def _record(outcome: str, seconds: float):
+    """
+    Apply one request's outcome ("ok", "timeout" or "error") to the throttle.
+    """
+    now = time.monotonic()
+    with _CONDITION:
+        latency = _STATE["latency"]
+        if (
+            outcome == "ok"
+            and latency
+            and seconds > (THROTTLE_SETTINGS["slow_factor"] * latency)
+        ):
+            outcome = "slow"
+        _STATE["counts"][outcome] += 1
+
+        if outcome in ("ok", "slow"):
+            smoothing = THROTTLE_SETTINGS["latency_smoothing"]
+            _STATE["latency"] = (
+                seconds
+                if latency is None
+                else (1 - smoothing) * latency + smoothing * seconds
+            )
+
+        if outcome == "ok":
+            _STATE["rate"] = min(
+                THROTTLE_SETTINGS["max_rate"],
+                _STATE["rate"] + THROTTLE_SETTINGS["rate_increase"],
+            )
+            # One more slot per full window of healthy requests
+            _STATE["concurrency"] = min(
+                THROTTLE_SETTINGS["max_concurrency"],
+                _STATE["concurrency"] + 1 / _STATE["concurrency"],
+            )
+        else:
+            _decrease(outcome, now)
+        _CONDITION.notify_all()
+
+
+@contextmanager
+def throttled(label: Optional[str] = None):
+    """
+    Pace the enclosed request and feed its latency and outcome to the throttle.
+
+    The block starts once a concurrency slot is free and the current rate
+    allows another request. A TimeoutException or TimeoutError counts as a
+    timeout, any other exception as an error. Blocks that handle failures
+    themselves can set request["ok"] = False to report an error.
+
+    Args:
+        label (str, optional): What is being requested, e.g. a URL.
+
+    Example:
+        with throttled(url) as request:
+            info = scrape_tournament_info(driver, url)
+            request["ok"] = info["Tournament name"] != "Not found"
+    """
+    with _CONDITION:
+        while _STATE["active"] >= int(_STATE["concurrency"]):
+            _CONDITION.wait()
+        now = time.monotonic()
+        start_at = max(now, _STATE["next_start"])
+        _STATE["next_start"] = start_at + 1 / _STATE["rate"]
+        _STATE["active"] += 1
+
+    try:
+        time.sleep(max(0.0, start_at - time.monotonic()))
+        request = {"ok": True, "label": label}
+        start = time.perf_counter()
+        try:
+            yield request
+        except Exception as e:
+            is_timeout = type(e).__name__ in ("TimeoutException", "TimeoutError")
+            _record("timeout" if is_timeout else "error", time.perf_counter() - start)
+            raise
+        _record("ok" if request["ok"] else "error", time.perf_counter() - start)
+    finally:
+        with _CONDITION:
+            _STATE["active"] -= 1
+            _CONDITION.notify_all()
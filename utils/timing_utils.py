@@ -0,0 +1,144 @@
+# utils/timing_utils.py
+
+import json
+import os
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+METRICS_DIR = os.path.join("data", "derived", "metrics")
+
+# Stages recorded by the scrapers, in pipeline order
+STAGES = [
+    "driver_start",
+    "navigation",
+    "wait",
+    "extract_html",
+    "parse",
+    "clean",
+    "write",
+]
+
+PERCENTILES = [0.5, 0.9, 0.95, 0.99]
+
+_TIMINGS: List[Dict] = []
+
+
+@contextmanager
+def timed(stage: str, function: str, label: Optional[str] = None):
+    """
+    Record how long the enclosed block takes as one sample of a stage.
+
+    Samples are recorded even if the block raises, so timeouts show up in the
+    wait stage.
+
+    Args:
+        stage (str): The pipeline stage, one of STAGES.
+        function (str): The function the block belongs to, e.g. "scrape_leaderboard".
+        label (str, optional): What was being processed, e.g. a URL.
+
+    Example:
+        with timed("navigation", "scrape_leaderboard", url):
+            driver.get(url)
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _TIMINGS.append(
+            {
+                "function": function,
+                "stage": stage,
+                "label": label,
+                "seconds": time.perf_counter() - start,
+            }
+        )
+
+
+def get_timings() -> pd.DataFrame:
+    """
+    Return every recorded sample with "function", "stage", "label" and "seconds".
+    """
+    return pd.DataFrame(_TIMINGS, columns=["function", "stage", "label", "seconds"])
+
+
+def reset_timings():
+    _TIMINGS.clear()
+
+
+def summarize_timings(timings: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+    """
+    Summarize timing samples per function and stage.
+
+    Args:
+        timings (pd.DataFrame, optional): Samples as returned by get_timings.
+            Defaults to the samples recorded so far.
+
+    Returns:
+        pd.DataFrame: One row per function and stage with "count", "total",
+        "mean", "p50", "p90", "p95", "p99" and "max" seconds, and each stage's
+        "share" of the total recorded time, largest total first.
+    """
+    if timings is None:
+        timings = get_timings()
+
+    grouped = timings.groupby(["function", "stage"])["seconds"]
+    summary = grouped.agg(["count", "sum", "mean", "max"]).rename(
+        columns={"sum": "total"}
+    )
+    quantiles = grouped.quantile(PERCENTILES).unstack()
+    quantiles.columns = [f"p{int(q * 100)}" for q in PERCENTILES]
+    summary = summary.join(quantiles)[
+        ["count", "total", "mean", "p50", "p90", "p95", "p99", "max"]
+    ]
+    summary["share"] = summary["total"] / summary["total"].sum()
+    return summary.sort_values("total", ascending=False).reset_index()
+
+
+def write_timing_report(
+    run_name: str, metrics_dir: str = METRICS_DIR
+) -> Dict[str, str]:
+    """
+    Write the recorded samples and their summary for one run.
+
+    Two files are written, named after the run and the current time: a JSON
+    file with the summary and every raw sample, and a CSV file with the summary.
+
+    Args:
+        run_name (str): Name of the run, e.g. "update-data".
+        metrics_dir (str, optional): Directory for the metrics files.
+            Defaults to "data/derived/metrics".
+
+    Returns:
+        dict: Paths of the "json" and "csv" files.
+    """
+    timings = get_timings()
+    if timings.empty:
+        print("No timings recorded")
+        return {}
+
+    summary = summarize_timings(timings)
+    os.makedirs(metrics_dir, exist_ok=True)
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    base = os.path.join(metrics_dir, f"{run_name}_{stamp}")
+
+    with open(f"{base}.json", "w") as f:
+        json.dump(
+            {
+                "run": run_name,
+                "created": datetime.now().isoformat(timespec="seconds"),
+                "summary": summary.to_dict(orient="records"),
+                "samples": timings.to_dict(orient="records"),
+            },
+            f,
+            indent=2,
+        )
+    summary.to_csv(f"{base}.csv", index=False)
+
+    print("\nTime per stage (seconds):")
+    print(summary.round(3).to_string(index=False))
+    print(f"Timing metrics saved to {base}.json and {base}.csv")
+    return {"json": f"{base}.json", "csv": f"{base}.csv"}
@@ -1,9 +1,11 @@
 # utils/tournament_utils.py
 
+import os
 import re
 import time
 from io import StringIO
 
+import numpy as np
 import pandas as pd
 from selenium import webdriver
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
@@ -14,6 +16,38 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 from webdriver_manager.chrome import ChromeDriverManager
 
+from .archive_utils import archive_page
+from .date_utils import parse_date_ranges
+from .throttle_utils import adaptive_timeout, throttled
+from .timing_utils import timed
+
+# Point the scrapers at a replay server by setting ESPN_BASE_URL
+ESPN_BASE_URL = os.environ.get("ESPN_BASE_URL", "https://www.espn.com").rstrip("/")
+LEADERBOARD_URL = f"{ESPN_BASE_URL}/golf/leaderboard"
+
+# Page elements the scrapers rely on, as (selector, selector type). Checked
+# against live pages by unique-selector.py --batch.
+SELECTOR_TYPES = {
+    "css": By.CSS_SELECTOR,
+    "xpath": By.XPATH,
+    "id": By.ID,
+    "class": By.CLASS_NAME,
+    "name": By.NAME,
+    "tag": By.TAG_NAME,
+}
+
+TOURNAMENT_INFO_SELECTORS = {
+    "Tournament name": ("Leaderboard__Event__Title", "class"),
+    "Date": ("Leaderboard__Event__Date", "class"),
+    "Location": ("Leaderboard__Course__Location", "class"),
+    "Details": ("Leaderboard__Course__Location__Detail", "class"),
+    "Purse": ("//div[@class='Leaderboard__Courses']/div[2]", "xpath"),
+}
+
+LEADERBOARD_TABLE_SELECTOR = (".Table__TBODY", "css")
+
+PLAYER_STATS_BUTTON_SELECTOR = ("//button[contains(text(), 'Player Stats')]", "xpath")
+
 
 def setup_driver(headless=True, additional_options=None):
     """
@@ -48,39 +82,25 @@ def setup_driver(headless=True, additional_options=None):
         for option in additional_options:
             chrome_options.add_argument(option)
 
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=chrome_options)
+    with timed("driver_start", "setup_driver"):
+        service = Service(ChromeDriverManager().install())
+        driver = webdriver.Chrome(service=service, options=chrome_options)
 
     return driver
 
 
 def scrape_tournament_info(driver, url):
-    driver.get(url)
+    with timed("navigation", "scrape_tournament_info", url):
+        driver.get(url)
     tournament_info = {}
-    selectors = {
-        "Tournament name": ("Leaderboard__Event__Title", "class"),
-        "Date": ("Leaderboard__Event__Date", "class"),
-        "Location": ("Leaderboard__Course__Location", "class"),
-        "Details": ("Leaderboard__Course__Location__Detail", "class"),
-        "Purse": ("//div[@class='Leaderboard__Courses']/div[2]", "xpath"),
-    }
-
-    selector_types = {
-        "css": By.CSS_SELECTOR,
-        "xpath": By.XPATH,
-        "id": By.ID,
-        "class": By.CLASS_NAME,
-        "name": By.NAME,
-        "tag": By.TAG_NAME,
-    }
 
     def check_selector(selector, selector_type="class", timeout=10):
-        if selector_type not in selector_types:
+        if selector_type not in SELECTOR_TYPES:
             raise ValueError(
-                f"Invalid selector type. Choose from: {', '.join(selector_types.keys())}"
+                f"Invalid selector type. Choose from: {', '.join(SELECTOR_TYPES.keys())}"
             )
 
-        by_type = selector_types[selector_type]
+        by_type = SELECTOR_TYPES[selector_type]
         try:
             element = WebDriverWait(driver, timeout).until(
                 EC.presence_of_element_located((by_type, selector))
@@ -89,9 +109,24 @@ def scrape_tournament_info(driver, url):
         except (TimeoutException, NoSuchElementException):
             return "Not found"
 
-    for key, (selector, selector_type) in selectors.items():
-        tournament_info[key] = check_selector(selector, selector_type)
+    with timed("wait", "scrape_tournament_info", url):
+        for key, (selector, selector_type) in TOURNAMENT_INFO_SELECTORS.items():
+            tournament_info[key] = check_selector(selector, selector_type)
+
+    # Not the "page" view: the leaderboard table may not have loaded yet, and
+    # the reparse reads leaderboards from "page"
+    archive_page(url, driver.page_source, view="tournament-info")
 
+    with timed("parse", "scrape_tournament_info", url):
+        _parse_tournament_details(tournament_info)
+
+    return tournament_info
+
+
+def _parse_tournament_details(tournament_info):
+    """
+    Split the scraped Details text into Par and Yards and extract the Purse amount.
+    """
     # Process Details
     if "Details" in tournament_info and tournament_info["Details"] != "Not found":
         details = tournament_info["Details"]
@@ -113,8 +148,6 @@ def scrape_tournament_info(driver, url):
         else:
             del tournament_info["Purse"]
 
-    return tournament_info
-
 
 def extract_tournament_id(input_string):
     """
@@ -150,73 +183,99 @@ def extract_tournament_id(input_string):
     return None
 
 
-def scrape_leaderboard(url):
-    driver = setup_driver()
-    try:
-        print(f"Loading URL: {url}")
-        driver.get(url)
+def parse_leaderboard_html(html, tournament_id=None):
+    """
+    Extract the main leaderboard table from a leaderboard page's HTML.
 
-        try:
-            WebDriverWait(driver, 20).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, ".Table__TBODY"))
-            )
-        except TimeoutException:
-            print(f"Timeout waiting for table to load for URL: {url}")
-            return None
+    Playoff tables are skipped, multi-level headers are flattened, column names
+    are upper-cased, unnamed columns are dropped and POS is moved first.
 
-        # Add a small delay to ensure the page is fully loaded
-        time.sleep(2)
+    Args:
+        html (str): The page source.
+        tournament_id (str, optional): Stored in a "TOURNAMENT_ID" column.
 
-        html = driver.page_source
+    Returns:
+        pd.DataFrame: The raw leaderboard, or None if the page has no
+        leaderboard table.
+    """
+    tables = pd.read_html(StringIO(html))
 
-        tables = pd.read_html(StringIO(html))
+    if not tables:
+        print("No tables found in the HTML")
+        return None
 
-        if not tables:
-            print(f"No tables found in the HTML for URL: {url}")
-            return None
+    # Function to check if a table is a playoff table
+    def is_playoff_table(df):
+        return any("Playoff Results" in str(col) for col in df.columns)
 
-        # Function to check if a table is a playoff table
-        def is_playoff_table(df):
-            return any("Playoff Results" in str(col) for col in df.columns)
+    # Find the main leaderboard table
+    leaderboard_df = None
+    for table in tables:
+        if not is_playoff_table(table):
+            leaderboard_df = table
+            break
 
-        # Find the main leaderboard table
-        leaderboard_df = None
-        for table in tables:
-            if not is_playoff_table(table):
-                leaderboard_df = table
-                break
+    if leaderboard_df is None:
+        print("No main leaderboard table found")
+        return None
 
-        if leaderboard_df is None:
-            print("No main leaderboard table found")
-            return None
+    print(f"Raw leaderboard data shape: {leaderboard_df.shape}")
+    print(f"Raw leaderboard columns: {leaderboard_df.columns.tolist()}")
 
-        print(f"Raw leaderboard data shape: {leaderboard_df.shape}")
-        print(f"Raw leaderboard columns: {leaderboard_df.columns.tolist()}")
+    # If the leaderboard has multi-index columns, flatten them
+    if isinstance(leaderboard_df.columns, pd.MultiIndex):
+        leaderboard_df.columns = [
+            " ".join(col).strip() for col in leaderboard_df.columns.values
+        ]
 
-        # If the leaderboard has multi-index columns, flatten them
-        if isinstance(leaderboard_df.columns, pd.MultiIndex):
-            leaderboard_df.columns = [
-                " ".join(col).strip() for col in leaderboard_df.columns.values
-            ]
+    # Standardize column names
+    leaderboard_df.columns = leaderboard_df.columns.str.upper()
+    leaderboard_df = leaderboard_df.loc[
+        :, ~leaderboard_df.columns.str.contains("^UNNAMED")
+    ]
 
-        # Standardize column names
-        leaderboard_df.columns = leaderboard_df.columns.str.upper()
-        leaderboard_df = leaderboard_df.loc[
-            :, ~leaderboard_df.columns.str.contains("^UNNAMED")
-        ]
+    if "POS" in leaderboard_df.columns:
+        pos_column = leaderboard_df["POS"]
+        leaderboard_df = leaderboard_df.drop("POS", axis=1)
+        leaderboard_df.insert(0, "POS", pos_column)
 
-        if "POS" in leaderboard_df.columns:
-            pos_column = leaderboard_df["POS"]
-            leaderboard_df = leaderboard_df.drop("POS", axis=1)
-            leaderboard_df.insert(0, "POS", pos_column)
+    leaderboard_df["TOURNAMENT_ID"] = tournament_id
 
-        tournament_id = extract_tournament_id(url)
-        leaderboard_df["TOURNAMENT_ID"] = tournament_id
+    print(f"Final leaderboard data shape: {leaderboard_df.shape}")
+    print(f"Final leaderboard columns: {leaderboard_df.columns.tolist()}")
 
-        print(f"Final leaderboard data shape: {leaderboard_df.shape}")
-        print(f"Final leaderboard columns: {leaderboard_df.columns.tolist()}")
+    return leaderboard_df
 
-        return leaderboard_df
+
+def scrape_leaderboard(url):
+    driver = setup_driver()
+    try:
+        print(f"Loading URL: {url}")
+        with timed("navigation", "scrape_leaderboard", url):
+            driver.get(url)
+
+        with timed("wait", "scrape_leaderboard", url):
+            try:
+                selector, selector_type = LEADERBOARD_TABLE_SELECTOR
+                WebDriverWait(driver, 20).until(
+                    EC.presence_of_element_located(
+                        (SELECTOR_TYPES[selector_type], selector)
+                    )
+                )
+            except TimeoutException:
+                print(f"Timeout waiting for table to load for URL: {url}")
+                return None
+
+            # Add a small delay to ensure the page is fully loaded
+            time.sleep(2)
+
+        with timed("extract_html", "scrape_leaderboard", url):
+            html = driver.page_source
+        archive_page(url, html)
+
+        tournament_id = extract_tournament_id(url)
+        with timed("parse", "scrape_leaderboard", url):
+            return parse_leaderboard_html(html, tournament_id)
 
     except Exception as e:
         print(f"Error scraping {url}: {str(e)}")
@@ -226,23 +285,97 @@ def scrape_leaderboard(url):
         driver.quit()
 
 
+def wait_for_table_data(driver, timeout=30):
+    start_time = time.time()
+    while time.time() - start_time < timeout:
+        table = driver.find_elements(By.TAG_NAME, "table")
+        if table:
+            rows = table[0].find_elements(By.TAG_NAME, "tr")
+            if len(rows) > 1:  # Check if there's more than just the header row
+                return True
+        time.sleep(0.5)  # Short sleep to prevent excessive CPU usage
+    return False
+
+
+def scrape_player_stats_page(driver, url):
+    """
+    Load a leaderboard page, open its Player Stats view and return the stats table.
+
+    Args:
+        driver (webdriver.Chrome): The browser to load the page in.
+        url (str): The leaderboard URL.
+
+    Returns:
+        pd.DataFrame: The raw player stats table, or None if the page has no
+        Player Stats button (the tournament has no player stats).
+
+    Raises:
+        TimeoutException: If the Player Stats table does not load.
+        ValueError: If the Player Stats view has no tables.
+    """
+    with timed("navigation", "scrape_player_stats", url):
+        driver.get(url)
+
+    # Wait for and click the Player Stats button. A missing button means the
+    # tournament has no stats, so the wait is not shortened by
+    # adaptive_timeout: a slow page must not be taken for one without stats.
+    with timed("wait", "scrape_player_stats", url):
+        selector, selector_type = PLAYER_STATS_BUTTON_SELECTOR
+        try:
+            player_stats_button = WebDriverWait(driver, 10).until(
+                EC.element_to_be_clickable((SELECTOR_TYPES[selector_type], selector))
+            )
+        except TimeoutException:
+            print(f"No Player Stats button on {url}")
+            return None
+        archive_page(url, driver.page_source, view="player-stats-button")
+        player_stats_button.click()
+        print("Clicked Player Stats button")
+
+        # Wait for the table data to load
+        table_loaded = wait_for_table_data(driver, adaptive_timeout(30))
+
+    if not table_loaded:
+        raise TimeoutException("Timed out waiting for Player Stats data to load")
+
+    print("Player Stats data loaded successfully")
+    with timed("extract_html", "scrape_player_stats", url):
+        html = driver.page_source
+    archive_page(url, html, view="player-stats")
+    with timed("parse", "scrape_player_stats", url):
+        tables = pd.read_html(StringIO(html))
+
+    if not tables:
+        raise ValueError("No tables found in Player Stats")
+    return tables[-1]  # Assuming the main stats table is the last one
+
+
 def load_tournament_info(csv_file):
+    """
+    Load tournament info, with each tournament ID once.
+
+    Rows keep the columns of csv_file ("Tournament ID", "Year", "Tournament
+    name", "Date", ...) and their file order. Rows without a tournament ID are
+    dropped, and an ID scraped more than once keeps its first row, as in the
+    canonical tournament catalog.
+
+    Args:
+        csv_file (str): Path to tournament_info.csv.
+
+    Returns:
+        pd.DataFrame: One row per tournament with an integer "Tournament ID"
+        column.
+    """
     df = pd.read_csv(csv_file)
     print(f"Original DataFrame shape: {df.shape}")
     print(f"Columns: {df.columns.tolist()}")
-    print(f"Data types: \n{df.dtypes}")
 
-    # Remove rows with missing Tournament ID
     df = df.dropna(subset=["Tournament ID"])
-
-    # Convert Tournament ID to integer
     df["Tournament ID"] = df["Tournament ID"].astype(int)
-
+    total_ids = len(df)
+    df = df.drop_duplicates("Tournament ID").reset_index(drop=True)
     print(f"Cleaned DataFrame shape: {df.shape}")
-
-    unique_ids = df["Tournament ID"].nunique()
-    total_ids = len(df["Tournament ID"])
-    print(f"Unique Tournament IDs: {unique_ids} out of {total_ids} total")
+    print(f"Unique Tournament IDs: {len(df)} out of {total_ids} total")
 
     return df
 
@@ -252,7 +385,8 @@ def generate_urls(tournament_info):
     Generate ESPN golf leaderboard URLs based on tournament IDs.
 
     This function creates URLs for ESPN golf tournament leaderboards. It can handle
-    different input formats for flexibility in various use cases.
+    different input formats for flexibility in various use cases. URLs start with
+    ESPN_BASE_URL, which can be set in the environment to use a replay server.
 
     Args:
         tournament_info (Union[dict, str, list]): The tournament information in one of three formats:
@@ -279,7 +413,7 @@ def generate_urls(tournament_info):
         ['https://www.espn.com/golf/leaderboard/_/tournamentId/401353308',
          'https://www.espn.com/golf/leaderboard/_/tournamentId/401353310']
     """
-    base_url = "https://www.espn.com/golf/leaderboard/_/tournamentId/"
+    base_url = f"{LEADERBOARD_URL}/_/tournamentId/"
 
     if isinstance(tournament_info, dict):
         # Original functionality: dictionary with "Tournament ID" key
@@ -313,6 +447,16 @@ def clean_leaderboard_data(df, tournament_id):
         else None
     )
 
+    with timed("clean", "clean_leaderboard_data", tournament_id):
+        _clean_leaderboard_columns(df)
+
+    return df, extra_column_info
+
+
+def _clean_leaderboard_columns(df):
+    """
+    Convert the score, round, earnings and FedEx columns to numbers in place.
+    """
     # The rest of the cleaning process remains the same, but we don't remove any columns
     if "SCORE" in df.columns:
         df["SCORE"] = df["SCORE"].replace({"E": "0", "CUT": None, "WD": None})
@@ -331,4 +475,194 @@ def clean_leaderboard_data(df, tournament_id):
     if "FEDEX PTS" in df.columns:
         df["FEDEX PTS"] = pd.to_numeric(df["FEDEX PTS"], errors="coerce")
 
-    return df, extra_column_info
+
+LEADERBOARD_NUMERIC_COLUMNS = [
+    "SCORE",
+    "R1",
+    "R2",
+    "R3",
+    "R4",
+    "TOT",
+    "EARNINGS",
+    "FEDEX PTS",
+]
+
+
+def clean_leaderboard_batch(df, tournament_column="TOURNAMENT_ID"):
+    """
+    Clean the concatenated raw leaderboards of many tournaments in one pass.
+
+    This is the batch counterpart of clean_leaderboard_data. Instead of cleaning
+    each tournament separately with a chain of replace/to_numeric calls per
+    column, all numeric columns are converted together: "E" scores become 0,
+    "--" earnings become 0, "$" and "," are stripped, and everything else that
+    is not a number (CUT, WD, ...) becomes NaN. TOT is cleaned as well.
+
+    Args:
+        df (pd.DataFrame): Raw leaderboards as returned by scrape_leaderboard,
+            concatenated across tournaments.
+        tournament_column (str, optional): Column holding the tournament ID.
+            Defaults to "TOURNAMENT_ID".
+
+    Returns:
+        tuple: A tuple containing:
+            - pd.DataFrame: The cleaned leaderboards.
+            - list: One dict per tournament that has TEAM or numbered columns,
+              with keys "tournament_id" and "extra_columns", in the same format
+              as clean_leaderboard_data reports them.
+
+    Example:
+        raw = pd.concat([scrape_leaderboard(url) for url in urls], ignore_index=True)
+        leaderboards, extra_column_data = clean_leaderboard_batch(raw)
+    """
+    with timed("clean", "clean_leaderboard_batch"):
+        if df is None or df.empty:
+            return df, []
+
+        # Columns only exist in the concatenated frame if some tournament had them,
+        # so report per tournament where the extra columns actually hold values
+        extra_columns = [col for col in df.columns if col == "TEAM" or col.isdigit()]
+        extra_column_info = []
+        if extra_columns:
+            present = df[extra_columns].notna().groupby(df[tournament_column]).any()
+            for tournament_id, has_values in present.iterrows():
+                columns = [col for col in extra_columns if has_values[col]]
+                if columns:
+                    extra_column_info.append(
+                        {
+                            "tournament_id": tournament_id,
+                            "extra_columns": ", ".join(columns),
+                        }
+                    )
+
+        columns = [col for col in LEADERBOARD_NUMERIC_COLUMNS if col in df.columns]
+        if not columns:
+            return df, extra_column_info
+
+        # Convert every numeric column in a single flattened pass
+        block = df[columns].replace({"SCORE": {"E": "0"}, "EARNINGS": {"--": "0"}})
+        flat = pd.Series(block.to_numpy(dtype=object).ravel(), dtype="object")
+        flat = flat.astype(str).str.replace(r"[$,]", "", regex=True)
+        values = pd.to_numeric(flat, errors="coerce").to_numpy(dtype=float)
+        values = values.reshape(block.shape)
+
+        df = df.copy()
+        for i, col in enumerate(columns):
+            column_values = values[:, i]
+            # Keep whole-number columns without gaps as integers, like to_numeric does
+            if (
+                col != "EARNINGS"
+                and not np.isnan(column_values).any()
+                and (column_values == np.floor(column_values)).all()
+            ):
+                df[col] = column_values.astype("int64")
+            else:
+                df[col] = column_values
+
+        return df, extra_column_info
+
+
+TOURNAMENT_INFO_COLUMNS = [
+    "Tournament ID",
+    "Year",
+    "Tournament name",
+    "Date",
+    "End Date",
+    "Location",
+    "Par",
+    "Yards",
+    "Purse",
+]
+
+
+def update_tournament_info(tournament_ids, data_directory="data", overwrite=False):
+    """
+    Scrape the details of tournaments and add them to tournament_info.csv.
+
+    Args:
+        tournament_ids (list): IDs of the tournaments to add.
+        data_directory (str, optional): Directory holding tournament_info.csv.
+            Defaults to "data".
+        overwrite (bool, optional): Rescrape tournaments that are already in the
+            file and replace their rows. Defaults to False, which skips them.
+    """
+    output_file = f"{data_directory}/tournament_info.csv"
+    existing_tournaments = set()
+
+    # Read existing tournaments if file exists
+    if os.path.exists(output_file):
+        existing_tournaments = set(
+            pd.read_csv(output_file)["Tournament ID"].astype(str)
+        )
+
+    driver = setup_driver()
+
+    new_tournaments = []
+    try:
+        for tournament_id in tournament_ids:
+            if str(tournament_id) in existing_tournaments and not overwrite:
+                print(f"Tournament ID {tournament_id} already exists. Skipping.")
+                continue
+
+            url = f"{LEADERBOARD_URL}/_/tournamentId/{tournament_id}"
+            print(f"Scraping: {url}")
+
+            with throttled(url) as request:
+                info = scrape_tournament_info(driver, url)
+                request["ok"] = info.get("Tournament name", "") != "Not found"
+            info["Tournament ID"] = tournament_id
+            info["Year"] = info.get("Date", "").split()[-1]  # Extract year from date
+
+            new_tournaments.append(info)
+            print(f"Scraped: {info.get('Tournament name', 'Unknown tournament')}")
+    finally:
+        driver.quit()
+
+    write_tournament_info(new_tournaments, data_directory)
+
+
+def write_tournament_info(new_tournaments, data_directory="data"):
+    """
+    Add scraped tournament details to tournament_info.csv.
+
+    Rows of tournaments that are already in the file are replaced, the "End
+    Date" is parsed from the date range and the file is kept in end date order.
+
+    Args:
+        new_tournaments (list): Dicts as returned by scrape_tournament_info, with
+            "Tournament ID" and "Year" added.
+        data_directory (str, optional): Directory holding tournament_info.csv.
+            Defaults to "data".
+    """
+    output_file = f"{data_directory}/tournament_info.csv"
+    if os.path.exists(output_file):
+        df = pd.read_csv(output_file)
+    else:
+        df = pd.DataFrame()
+
+    # Convert new tournaments to DataFrame
+    new_df = pd.DataFrame(new_tournaments)
+    if not new_df.empty:
+        new_df["End Date"] = parse_date_ranges(new_df["Date"])["End Date"]
+        if not df.empty:
+            # Replaced tournaments drop their previous row
+            scraped = set(new_df["Tournament ID"].astype(str))
+            df = df[~df["Tournament ID"].astype(str).isin(scraped)]
+
+    # Combine existing and new data
+    df = pd.concat([df, new_df], ignore_index=True)
+
+    # Ensure all columns are present
+    for col in TOURNAMENT_INFO_COLUMNS:
+        if col not in df.columns:
+            df[col] = None
+
+    # Sort the DataFrame by Date
+    df["End Date"] = pd.to_datetime(df["End Date"], errors="coerce")
+    df = df.sort_values("End Date", ascending=False)
+
+    # Save the updated DataFrame to CSV
+    with timed("write", "update_tournament_info"):
+        df.to_csv(output_file, index=False)
+
+    print(f"Added {len(new_tournaments)} new tournaments to {output_file}")